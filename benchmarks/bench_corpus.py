@@ -0,0 +1,212 @@
+# benchmarks/bench_corpus.py
+
+"""
+코퍼스 벤치마크 : 실제 시험지 수식의 단계별 시간 / 처리량 / 지연 분포 / 메모리 + 기준 결과 대비 회귀 검사
+
+- 코퍼스 (방향별)
+    - hangul_to_latex : sample/section0.xml 의 수식 전체 + sample/example_input.txt 의 "Hangul -> LaTex" 줄
+    - latex_to_hangul : 위 수식 중 변환에 성공한 것의 LaTeX 결과 + example_input.txt 의 "LaTex -> Hangul" 줄
+- 단계 : tokenize (scan, LaTeX 는 merge_brackets 포함) / build_ast / hooks (apply_postprocess_hooks) / render
+    - 빠른 경로(fast_path) 없이 전체 경로를 단계별로 측정, 수식마다 --repeat 번 중 최솟값
+    - 변환에 실패하는 수식은 errors 로만 세고 시간 통계에서 제외
+- 결과 (방향별)
+    - formulas_per_sec : 전체 경로 처리량, convert_per_sec : convert() 처리량 (빠른 경로 포함)
+    - phases_ms : 단계별 코퍼스 합계, p50_us / p99_us : 수식별 전체 경로 지연
+    - peak_kib : 수식 하나 변환 시 최대 할당량 (tracemalloc, 시간 측정과 별도 패스)
+- --save 로 JSON 저장, --baseline 의 결과보다 --threshold(비율) 이상 나빠진 지표가 있으면 목록 출력 후 종료 코드 1
+
+실행:
+    python -m benchmarks.bench_corpus [--repeat 5] [--engine split] [--save current.json]
+                                      [--baseline baseline.json] [--threshold 0.15]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import timeit
+import tracemalloc
+
+from benchmarks.bench_tokenize import load_scripts
+from converter.hooks.postprocess_hook import apply_postprocess_hooks
+from converter.parser import build_ast, convert, merge_brackets
+from converter.tokenizer import scan
+
+EXAMPLE_INPUT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                             "sample", "example_input.txt")
+
+PHASES = ("tokenize", "build_ast", "hooks", "render")
+
+# 방향 → (원본 언어, 대상 언어, 렌더 메서드 이름, example_input.txt 구역 제목)
+DIRECTIONS = {
+    "hangul_to_latex": ("HANGUL", "LATEX", "to_latex", "Hangul -> LaTex"),
+    "latex_to_hangul": ("LATEX", "HANGUL", "to_hangul", "LaTex -> Hangul"),
+}
+
+# 지표 → 값이 클수록 좋은지 (회귀 판정 방향)
+METRICS = {
+    "formulas_per_sec": True,
+    "convert_per_sec": True,
+    "p50_us": False,
+    "p99_us": False,
+    "peak_kib": False,
+}
+
+
+def load_examples(path: str = EXAMPLE_INPUT) -> dict[str, list[str]]:
+    """example_input.txt : 구역 제목 줄 → 그 아래 수식 줄들"""
+    sections, current = {}, None
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            if line in (title for *_, title in DIRECTIONS.values()):
+                current = sections.setdefault(line, [])
+            elif current is not None:
+                current.append(line)
+    return sections
+
+
+def load_corpus() -> dict[str, list[str]]:
+    """방향 → 수식 목록"""
+    examples = load_examples()
+    hangul = load_scripts() + examples.get(DIRECTIONS["hangul_to_latex"][3], [])
+    latex = []
+    for expr in hangul:
+        try:
+            latex.append(convert(expr))
+        except Exception:
+            pass
+    latex += examples.get(DIRECTIONS["latex_to_hangul"][3], [])
+    return {"hangul_to_latex": hangul, "latex_to_hangul": [expr for expr in latex if expr.strip()]}
+
+
+def run_phases(expr: str, direction: str, engine: str) -> list[float]:
+    """전체 경로 한 번의 단계별 시간 (초), 실패 시 예외 그대로"""
+    from_lang, to_lang, render, _ = DIRECTIONS[direction]
+    t0 = time.perf_counter()
+    tokens = scan(expr)   # 파서와 같은 BraceBlock 토큰 (공개 tokenize 는 블록을 str 로 바꿈)
+    if from_lang == "LATEX":
+        tokens = merge_brackets(tokens)
+    t1 = time.perf_counter()
+    ast = build_ast(tokens, from_lang, to_lang, engine)
+    t2 = time.perf_counter()
+    ast = apply_postprocess_hooks(ast)
+    t3 = time.perf_counter()
+    getattr(ast, render)()
+    return [t1 - t0, t2 - t1, t3 - t2, time.perf_counter() - t3]
+
+
+def peak_bytes(expr: str, direction: str, engine: str) -> int:
+    """수식 하나의 전체 경로 최대 할당량 (tracemalloc 가 켜져 있어야 함)"""
+    tracemalloc.reset_peak()
+    base = tracemalloc.get_traced_memory()[0]
+    run_phases(expr, direction, engine)
+    return tracemalloc.get_traced_memory()[1] - base
+
+
+def percentile(values: list[float], q: float) -> float:
+    """정렬된 values 의 q 분위값 (nearest-rank)"""
+    return values[min(len(values) - 1, int(len(values) * q))]
+
+
+def measure(scripts: list[str], direction: str, engine: str, repeat: int) -> dict:
+    ok, errors = [], 0
+    for expr in scripts:
+        try:
+            run_phases(expr, direction, engine)   # 연산자 인덱스 등 최초 구성 비용 제외 + 실패 수식 걸러내기
+            ok.append(expr)
+        except Exception:
+            errors += 1
+
+    best = [[float("inf")] * len(PHASES) for _ in ok]
+    for _ in range(repeat):
+        for row, expr in zip(best, ok):
+            for i, seconds in enumerate(run_phases(expr, direction, engine)):
+                row[i] = min(row[i], seconds)
+    totals = sorted(sum(row) for row in best)
+    elapsed = sum(totals)
+    convert_best = min(timeit.repeat(lambda: [convert(expr, direction, engine) for expr in ok],
+                                     number=1, repeat=repeat))
+
+    tracemalloc.start()
+    try:
+        peak = max(peak_bytes(expr, direction, engine) for expr in ok)
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "formulas": len(ok),
+        "errors": errors,
+        "formulas_per_sec": len(ok) / elapsed,
+        "convert_per_sec": len(ok) / convert_best,
+        "phases_ms": {phase: sum(row[i] for row in best) * 1e3 for i, phase in enumerate(PHASES)},
+        "p50_us": percentile(totals, 0.50) * 1e6,
+        "p99_us": percentile(totals, 0.99) * 1e6,
+        "peak_kib": peak / 1024,
+    }
+
+
+def regressions(current: dict, baseline: dict, threshold: float) -> list[str]:
+    """baseline 보다 threshold 비율 이상 나빠진 지표 설명 목록 (단계별 합계 포함)"""
+    found = []
+    for direction, result in current["directions"].items():
+        before = baseline.get("directions", {}).get(direction)
+        if before is None:
+            continue
+        checks = [(name, higher_better, result[name], before.get(name)) for name, higher_better in METRICS.items()]
+        checks += [(f"phases_ms.{phase}", False, ms, before.get("phases_ms", {}).get(phase))
+                   for phase, ms in result["phases_ms"].items()]
+        for name, higher_better, value, old in checks:
+            if not old:
+                continue
+            change = (old - value) / old if higher_better else (value - old) / old
+            if change > threshold:
+                found.append(f"{direction} {name}: {old:.2f} → {value:.2f} ({change * 100:+.1f}% worse)")
+    return found
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--engine", default="split")
+    ap.add_argument("--directions", default=",".join(DIRECTIONS))
+    ap.add_argument("--save", help="결과 저장 경로 (JSON)")
+    ap.add_argument("--baseline", help="기준 결과 JSON (회귀 검사)")
+    ap.add_argument("--threshold", type=float, default=0.15, help="회귀로 보는 악화 비율 (기본 0.15 = 15%%)")
+    args = ap.parse_args(argv)
+
+    corpus = load_corpus()
+    result = {
+        "engine": args.engine,
+        "python": sys.version.split()[0],
+        "directions": {direction: measure(corpus[direction], direction, args.engine, args.repeat)
+                       for direction in args.directions.split(",")},
+    }
+
+    for direction, r in result["directions"].items():
+        print(f"[{direction}] formulas {r['formulas']} (errors {r['errors']}), "
+              f"{r['formulas_per_sec']:.0f} formulas/s (convert {r['convert_per_sec']:.0f}/s), "
+              f"p50 {r['p50_us']:.1f}us p99 {r['p99_us']:.1f}us, peak {r['peak_kib']:.1f} KiB")
+        print("    " + " | ".join(f"{phase} {ms:.2f} ms" for phase, ms in r["phases_ms"].items()))
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        found = regressions(result, baseline, args.threshold)
+        for line in found:
+            print(f"  !! regression {line}")
+        if found:
+            return 1
+        print(f"no regression (threshold {args.threshold * 100:.0f}%)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
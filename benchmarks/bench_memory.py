@@ -0,0 +1,95 @@
+# benchmarks/bench_memory.py
+
+"""
+파서 메모리 벤치마크 : 수식 하나를 파싱할 때의 최대 메모리 할당량 (tracemalloc peak)
+
+- corpus : sample/section0.xml 의 <hp:script> 수식 전체 (수식별 peak 의 평균 / 중앙값 / 최대)
+- large  : 긴 연산자 사슬, 자동 괄호가 많은 수식, 깊게 중첩된 분수 등 큰 합성 수식
+- --save 로 결과를 JSON 으로 저장해 두고, 변경 후 --compare 로 이전 결과와 나란히 비교
+
+실행:
+    python -m benchmarks.bench_memory [--engine split] [--save before.json] [--compare before.json]
+"""
+
+import argparse
+import json
+import statistics
+import tracemalloc
+
+from benchmarks.bench_tokenize import load_scripts
+from converter.parser import parse_hangul
+
+LARGE = {
+    "chain 400": " times ".join(["a"] * 400),
+    "groups 200": " -f ".join(["f LEFT ( 2+h RIGHT )"] * 200),
+    "fraction depth 60": "{1 over " * 60 + "x" + "}" * 60,
+    "sum 300": " + ".join("{a_%d} over {b_%d}" % (i, i) for i in range(300)),
+}
+
+
+def peak_bytes(expr: str, engine: str) -> int:
+    """parse_hangul(expr) 한 번의 최대 할당량 (파싱 전 상주 메모리 제외)"""
+    tracemalloc.reset_peak()
+    base = tracemalloc.get_traced_memory()[0]
+    try:
+        parse_hangul(expr, engine=engine)
+    except Exception:
+        pass
+    return tracemalloc.get_traced_memory()[1] - base
+
+
+def measure(engine: str) -> dict:
+    scripts = load_scripts()
+    tracemalloc.start()
+    try:
+        # 연산자 인덱스 등 최초 1회 구성 비용 제외
+        peak_bytes(scripts[0], engine)
+        corpus = [peak_bytes(expr, engine) for expr in scripts]
+        large = {name: peak_bytes(expr, engine) for name, expr in LARGE.items()}
+    finally:
+        tracemalloc.stop()
+    return {
+        "corpus": {
+            "formulas": len(corpus),
+            "mean": statistics.mean(corpus),
+            "median": statistics.median(corpus),
+            "max": max(corpus),
+        },
+        "large": large,
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--engine", default="split")
+    ap.add_argument("--save", help="결과 저장 경로 (JSON)")
+    ap.add_argument("--compare", help="이전 결과 JSON 과 비교")
+    args = ap.parse_args()
+
+    result = measure(args.engine)
+
+    before = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            before = json.load(f)
+
+    def row(label, key, value, section):
+        line = f"{label:24} {value / 1024:10.1f} KiB"
+        if before is not None:
+            old = before[section][key]
+            line += f"  (before {old / 1024:10.1f} KiB, {old / value if value else 0:5.1f}x)"
+        print(line)
+
+    print(f"engine: {args.engine}, formulas: {result['corpus']['formulas']}")
+    for key in ("mean", "median", "max"):
+        row(f"[corpus] {key}", key, result["corpus"][key], "corpus")
+    for name, value in result["large"].items():
+        row(f"[large ] {name}", name, value, "large")
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# benchmarks/bench_parser.py
+
+"""
+파서 엔진 A/B 벤치마크 : engine="split" (재귀 분할) vs engine="pratt" (한 번의 좌→우 조립)
+
+- corpus : sample/section0.xml 의 <hp:script> 수식 전체를 두 엔진으로 파싱
+    - 두 엔진의 AST(repr)와 변환 결과가 모두 같은지 먼저 확인
+- chain  : 'a times a times ... ' 형태의 긴 이항 연산자 사슬 (길이별 시간 → 증가율 확인)
+- groups : 'f LEFT ( 2+h RIGHT ) -f LEFT ( ... ' 형태로 자동 괄호 쌍이 많은 수식 (괄호 매칭 비용 확인)
+
+실행:
+    python -m benchmarks.bench_parser [--repeat 5]
+"""
+
+import argparse
+import timeit
+
+from benchmarks.bench_tokenize import load_scripts
+from converter.parser import parse_hangul, ENGINES
+
+
+def parse_all(scripts: list[str], engine: str) -> list[str]:
+    """수식 전체 파싱 결과 (repr / LaTeX / 오류 이름)"""
+    out = []
+    for expr in scripts:
+        try:
+            ast = parse_hangul(expr, engine=engine)
+            out.append(repr(ast) + ast.to_latex())
+        except Exception as e:
+            out.append(type(e).__name__)
+    return out
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    scripts = load_scripts()
+    results = {engine: parse_all(scripts, engine) for engine in ENGINES}
+    assert results["split"] == results["pratt"]
+
+    timings = {}
+    for engine in ENGINES:
+        timings[engine] = min(timeit.repeat(lambda: parse_all(scripts, engine), number=1, repeat=args.repeat))
+
+    chains = []
+    for length in (50, 200, 800):
+        expr = " times ".join(["a"] * length)
+        chains.append((length, {
+            engine: min(timeit.repeat(lambda: parse_hangul(expr, engine=engine), number=1, repeat=args.repeat))
+            for engine in ENGINES
+        }))
+
+    groups = []
+    for count in (50, 200, 800):
+        expr = " -f ".join(["f LEFT ( 2+h RIGHT )"] * count)
+        groups.append((count, min(timeit.repeat(lambda: parse_hangul(expr), number=1, repeat=args.repeat))))
+
+    print(f"scripts: {len(scripts)}")
+    for engine in ENGINES:
+        print(f"[corpus] {engine:6} {timings[engine] * 1e3:8.2f} ms")
+    for length, best in chains:
+        line = " | ".join(f"{engine} {best[engine] * 1e3:9.3f} ms" for engine in ENGINES)
+        print(f"[chain ] length {length:5}: {line}")
+    for count, best in groups:
+        print(f"[groups] pairs  {count:5}: {best * 1e3:9.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+# benchmarks/bench_scaling.py
+
+"""
+합성 수식 크기별 증가율 벤치마크 : 구조별로 크기 n 을 키워 가며 전체 경로(parse_* + render) 시간을 재고 증가 차수를 추정
+
+- 수식 모양 (n = 반복 단위 수, 한글 / LaTeX 각각)
+    - plus      : 'a + a + ... + a' (이항 연산자 사슬)
+    - left      : 'LEFT ( LEFT ( ... x ... RIGHT ) RIGHT )' / '\\left( ... \\right)' (자동 괄호 중첩)
+    - over      : '{1 over {1 over ... x}}' / '\\frac{1}{\\frac{1}{... x}}' (분수 중첩)
+    - cases     : n 행짜리 cases (행마다 'x && x > 0' / 'x & x > 0')
+    - matrix    : 약 n 칸의 정사각 matrix (k x k, k = isqrt(n))
+    - power     : 'x ^ x ^ ... ^ x' (지수 사슬)
+- 크기 : --sizes (기본 10, 100, 1k, 10k, 100k)
+    - 한 번 실행이 --budget 초를 넘으면 그 모양의 더 큰 크기는 건너뜀 (멈춤으로 표시)
+- 변환이 예외로 끝나도 (ex) 현재 자동 괄호 중첩은 AttributeError) 예외까지 걸린 시간으로 측정하고 error 로 표시
+- 증가 차수 : 시간이 MIN_FIT_SECONDS 이상인 크기 중 큰 쪽 FIT_POINTS 개에서 log(시간) ~ log(n) 최소제곱 기울기
+    - 작은 크기의 고정 비용이 섞이지 않도록 가장 큰 크기들만 사용 (점근 증가율)
+    - 시간 / (n log n) 의 기울기가 NLOGN_TOLERANCE 를 넘으면 n log n 보다 빠르게 증가하는 모양으로 표시 (!!)
+
+실행:
+    python -m benchmarks.bench_scaling [--sizes 10,100,1000,10000,100000] [--shapes plus,over]
+                                       [--budget 10] [--save scaling.json]
+"""
+
+import argparse
+import json
+import math
+import sys
+import time
+from math import isqrt
+
+from converter.parser import parse_hangul, parse_latex
+
+MIN_FIT_SECONDS = 5e-4   # 이보다 짧은 측정은 고정 비용 / 잡음이 커서 차수 추정에서 제외
+FIT_POINTS = 2           # 차수 추정에 쓰는 가장 큰 크기 수
+NLOGN_TOLERANCE = 0.15   # 시간 / (n log n) 의 log-log 기울기 허용치
+
+
+def _grid(n: int) -> list[list[str]]:
+    k = max(1, isqrt(n))
+    return [["a"] * k for _ in range(k)]
+
+
+# 이름 → (방향 → 수식 생성 함수)
+SHAPES = {
+    "plus": {
+        "hangul_to_latex": lambda n: " + ".join(["a"] * n),
+        "latex_to_hangul": lambda n: " + ".join(["a"] * n),
+    },
+    "left": {
+        "hangul_to_latex": lambda n: "LEFT ( " * n + "x" + " RIGHT )" * n,
+        "latex_to_hangul": lambda n: "\\left( " * n + "x" + " \\right)" * n,
+    },
+    "over": {
+        "hangul_to_latex": lambda n: "{1 over " * n + "x" + "}" * n,
+        "latex_to_hangul": lambda n: "\\frac{1}{" * n + "x" + "}" * n,
+    },
+    "cases": {
+        "hangul_to_latex": lambda n: "cases{" + " # ".join(["x && x > 0"] * n) + "}",
+        "latex_to_hangul": lambda n: "\\begin{cases} " + " \\\\ ".join(["x & x > 0"] * n) + " \\end{cases}",
+    },
+    "matrix": {
+        "hangul_to_latex": lambda n: "matrix{" + " # ".join(" & ".join(row) for row in _grid(n)) + "}",
+        "latex_to_hangul": lambda n: "\\begin{matrix} " + " \\\\ ".join(" & ".join(row) for row in _grid(n))
+                                     + " \\end{matrix}",
+    },
+    "power": {
+        "hangul_to_latex": lambda n: " ^ ".join(["x"] * n),
+        "latex_to_hangul": lambda n: " ^ ".join(["x"] * n),
+    },
+}
+
+# 방향 → (파서, 렌더 메서드 이름)
+DIRECTIONS = {
+    "hangul_to_latex": (parse_hangul, "to_latex"),
+    "latex_to_hangul": (parse_latex, "to_hangul"),
+}
+
+
+def run(expr: str, direction: str) -> tuple[float, str]:
+    """(전체 경로 시간, 예외 이름 또는 "")"""
+    parse, render = DIRECTIONS[direction]
+    start = time.perf_counter()
+    try:
+        getattr(parse(expr), render)()
+        error = ""
+    except Exception as e:
+        error = type(e).__name__
+    return time.perf_counter() - start, error
+
+
+def fit_order(points: list[tuple[int, float]]) -> tuple[float, float]:
+    """
+    (n, 시간) 목록 → (log-log 기울기, 시간 / (n log n) 의 log-log 기울기)
+    - MIN_FIT_SECONDS 미만 측정 제외 후 가장 큰 FIT_POINTS 개 사용, 2개 미만이면 (nan, nan)
+    """
+    points = [(n, t) for n, t in points if t >= MIN_FIT_SECONDS and n > 1][-FIT_POINTS:]
+    if len(points) < 2:
+        return math.nan, math.nan
+
+    def slope(pairs):
+        xs, ys = zip(*pairs)
+        mx, my = sum(xs) / len(xs), sum(ys) / len(ys)
+        return sum((x - mx) * (y - my) for x, y in pairs) / sum((x - mx) ** 2 for x in xs)
+
+    order = slope([(math.log(n), math.log(t)) for n, t in points])
+    excess = slope([(math.log(n), math.log(t / (n * math.log(n)))) for n, t in points])
+    return order, excess
+
+
+def measure(shape: str, direction: str, sizes: list[int], budget: float, repeat: int) -> dict:
+    make = SHAPES[shape][direction]
+    points, errors, stalled = [], {}, None
+    for n in sizes:
+        if stalled is not None:
+            break
+        expr = make(n)
+        elapsed, error = run(expr, direction)
+        if elapsed < 0.1:
+            elapsed = min([elapsed] + [run(expr, direction)[0] for _ in range(repeat - 1)])
+        points.append((n, elapsed))
+        if error:
+            errors[n] = error
+        if elapsed > budget:
+            stalled = n
+    order, excess = fit_order(points)
+    return {
+        "points": points,
+        "errors": errors,
+        "stalled_at": stalled,
+        "order": order,
+        "excess_over_nlogn": excess,
+        "flagged": stalled is not None or excess > NLOGN_TOLERANCE,
+    }
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--sizes", default="10,100,1000,10000,100000")
+    ap.add_argument("--shapes", default=",".join(SHAPES))
+    ap.add_argument("--directions", default=",".join(DIRECTIONS))
+    ap.add_argument("--budget", type=float, default=10.0, help="한 번 실행 시간 상한 (초), 넘으면 더 큰 크기 생략")
+    ap.add_argument("--repeat", type=int, default=3, help="0.1 초 미만 측정의 반복 횟수 (최솟값 사용)")
+    ap.add_argument("--save", help="결과 저장 경로 (JSON)")
+    args = ap.parse_args(argv)
+
+    sizes = sorted(int(s) for s in args.sizes.split(","))
+    result = {}
+    print(f"{'shape':8} {'direction':16} " + " ".join(f"{n:>10}" for n in sizes) + f" {'order':>6}  verdict")
+    for shape in args.shapes.split(","):
+        for direction in args.directions.split(","):
+            r = result[f"{shape}/{direction}"] = measure(shape, direction, sizes, args.budget, args.repeat)
+            times = dict(r["points"])
+            cells = []
+            for n in sizes:
+                cell = f"{times[n] * 1e3:.2f}ms" if n in times else "-"
+                cells.append(f"{cell + ('*' if n in r['errors'] else ''):>10}")
+            if r["stalled_at"] is not None:
+                verdict = f"!! over budget at n={r['stalled_at']}"
+            elif r["flagged"]:
+                verdict = f"!! faster than n log n (excess {r['excess_over_nlogn']:+.2f})"
+            else:
+                verdict = "ok"
+            print(f"{shape:8} {direction:16} {' '.join(cells)} {r['order']:6.2f}  {verdict}")
+            for n, error in r["errors"].items():
+                print(f"    * n={n}: {error}")
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+    return 1 if any(r["flagged"] for r in result.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
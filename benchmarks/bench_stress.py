@@ -0,0 +1,77 @@
+# benchmarks/bench_stress.py
+
+"""
+깊은 중첩 수식 스트레스 벤치마크 : 파싱 / 후처리 훅 / 렌더링이 재귀 한도 없이 깊이에 비례해 동작하는지 확인
+
+- power      : 'x ^ x ^ ... ^ x'  (왼쪽으로 깊어지는 PowerNode 트리, 훅 / 렌더 모두 깊이 n)
+- power_tex  : 같은 사슬을 LaTeX → 한글 방향으로
+- chain      : 'a times a times ... ' (BinaryOpNode 사슬)
+- sqrt       : 'sqrt {sqrt {... x}}' (중괄호 블록 중첩 → 블록마다 새 토큰 배열)
+- sqrt_tex   : '\\sqrt{\\sqrt{... x}}' (LaTeX → 한글)
+- 한 번 실행(파싱 + 렌더)이 --budget 초를 넘으면 그 모양의 더 큰 깊이는 건너뜀 (over budget 으로 표시)
+- 깊이마다 두 엔진(split / pratt)의 변환 결과가 같은지 확인
+- 현재 sys.getrecursionlimit() 도 함께 출력 (깊이가 이 값을 넘어도 RecursionError 가 나지 않아야 함)
+
+실행:
+    python -m benchmarks.bench_stress [--depths 1000,10000,100000] [--budget 10]
+"""
+
+import argparse
+import sys
+import time
+
+from converter.parser import parse_hangul, parse_latex, ENGINES
+
+# 이름 → (수식 생성 함수, 파서, 렌더 메서드 이름)
+SHAPES = {
+    "power": (lambda n: " ^ ".join(["x"] * n), parse_hangul, "to_latex"),
+    "power_tex": (lambda n: " ^ ".join(["x"] * n), parse_latex, "to_hangul"),
+    "chain": (lambda n: " times ".join(["a"] * n), parse_hangul, "to_latex"),
+    "sqrt": (lambda n: "sqrt {" * n + "x" + "}" * n, parse_hangul, "to_latex"),
+    "sqrt_tex": (lambda n: "\\sqrt{" * n + "x" + "}" * n, parse_latex, "to_hangul"),
+}
+
+
+def run(expr: str, parse, render: str, engine: str) -> tuple[float, float, str]:
+    """(파싱 + 훅 시간, 렌더 시간, 결과 문자열)"""
+    start = time.perf_counter()
+    ast = parse(expr, engine=engine)
+    parsed = time.perf_counter()
+    out = getattr(ast, render)()
+    return parsed - start, time.perf_counter() - parsed, out
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--depths", default="1000,10000,100000")
+    ap.add_argument("--shapes", default=",".join(SHAPES))
+    ap.add_argument("--budget", type=float, default=10.0, help="한 번 실행 시간 상한 (초), 넘으면 더 깊은 수식 생략")
+    args = ap.parse_args()
+
+    depths = [int(d) for d in args.depths.split(",")]
+    print(f"recursion limit: {sys.getrecursionlimit()}")
+    print(f"{'shape':10} {'depth':>7} {'engine':6} {'parse':>10} {'render':>10} {'chars':>9}")
+    for name in args.shapes.split(","):
+        make, parse, render = SHAPES[name]
+        stalled = None
+        for depth in depths:
+            if stalled is not None:
+                print(f"{name:10} {depth:7} {'-':6} {f'skip (over budget at {stalled})':>31}")
+                continue
+            expr = make(depth)
+            outputs = set()
+            for engine in ENGINES:
+                parse_time, render_time, out = run(expr, parse, render, engine)
+                outputs.add(out)
+                print(f"{name:10} {depth:7} {engine:6} {parse_time * 1e3:8.1f}ms {render_time * 1e3:8.1f}ms "
+                      f"{len(out):9}")
+                if parse_time + render_time > args.budget:
+                    stalled = depth
+            if len(outputs) != 1:
+                print(f"  !! {name} depth {depth}: 엔진별 결과가 다름")
+            if stalled is not None:
+                print(f"  !! {name} depth {depth}: 한 번 실행이 {args.budget:g}초를 넘음")
+
+
+if __name__ == "__main__":
+    main()
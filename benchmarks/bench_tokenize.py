@@ -0,0 +1,76 @@
+# benchmarks/bench_tokenize.py
+
+"""
+토크나이저 마이크로벤치마크 : 단일 패스 스캐너(scan) vs 기존 문자 단위 루프(scan_chars)
+
+- 입력: sample/section0.xml 의 <hp:script> 수식 전체
+- flat   : 각 수식의 최상위 토큰화
+- nested : 중괄호 블록 내부까지 모두 토큰화
+    - scan_chars 는 기존 파서처럼 블록 문자열을 단계마다 다시 토큰화
+    - scan 은 한 번의 스캔에서 만들어진 BraceBlock.tokens 를 순회
+- deep   : '{{{ ... x ... }}}' 형태의 깊은 중첩 (깊이별 시간 → 선형 여부 확인)
+
+실행:
+    python -m benchmarks.bench_tokenize [--repeat 20]
+"""
+
+import argparse
+import os
+import timeit
+
+from converter.hwpx import iter_equations
+from converter.tokenizer import scan, scan_chars, BraceBlock
+
+SAMPLE_XML = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "sample", "section0.xml")
+
+
+def load_scripts(path: str = SAMPLE_XML) -> list[str]:
+    """샘플 섹션의 비어 있지 않은 수식 스크립트 (문서 순서)"""
+    return [eq.script for eq in iter_equations(path) if eq.script]
+
+
+def tokenize_nested(tokenizer, expr: str) -> int:
+    """중괄호 블록 내부까지 토큰화하며 전체 토큰 수를 반환"""
+    count = 0
+    pending = [tokenizer(expr)]
+    while pending:
+        tokens = pending.pop()
+        count += len(tokens)
+        for t in tokens:
+            if isinstance(t, BraceBlock):
+                pending.append(t.tokens)
+            elif t.startswith("{"):
+                pending.append(tokenizer(t[1:-1]))
+    return count
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--repeat", type=int, default=20)
+    args = ap.parse_args()
+
+    scripts = load_scripts()
+    for expr in scripts:
+        assert scan(expr) == scan_chars(expr), expr
+
+    print(f"scripts: {len(scripts)}, chars: {sum(map(len, scripts))}")
+    for mode, fn in (("flat", lambda tk: [tk(s) for s in scripts]),
+                     ("nested", lambda tk: [tokenize_nested(tk, s) for s in scripts])):
+        results = {}
+        for name, tokenizer in (("scan_chars", scan_chars), ("scan", scan)):
+            best = min(timeit.repeat(lambda: fn(tokenizer), number=1, repeat=args.repeat))
+            results[name] = best
+            print(f"[{mode:6}] {name:10} {best * 1e3:8.2f} ms  ({len(scripts) / best:10.0f} formulas/s)")
+        print(f"[{mode:6}] speedup    {results['scan_chars'] / results['scan']:8.2f}x")
+
+    for depth in (10, 100, 1000):
+        expr = "5 ^" + "{1 over " * depth + "3" + "}" * depth
+        line = []
+        for name, tokenizer in (("scan_chars", scan_chars), ("scan", scan)):
+            best = min(timeit.repeat(lambda: tokenize_nested(tokenizer, expr), number=1, repeat=5))
+            line.append(f"{name} {best * 1e3:9.3f} ms")
+        print(f"[deep  ] depth {depth:5}: " + " | ".join(line))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,13 @@
 # converter/__init__.py
 
-from .parser import parse_latex, parse_hangul
+__version__ = "0.1.0"   # 유일한 버전 정의 (setup.py 가 읽어 감, 디스크 캐시 지문에 포함)
 
-__all__ = ['parse_latex', 'parse_hangul']
\ No newline at end of file
+from .parser import parse_latex, parse_hangul, convert
+from .registry import register_node
+from .batch import convert_many, convert_document
+from .cache import ConversionCache, ShapeCache
+from .persistent_cache import PersistentCache
+from .metrics import MetricsRegistry
+from .slow_log import SlowLog
+
+__all__ = ['parse_latex', 'parse_hangul', 'convert', 'register_node', 'convert_many', 'convert_document', 'ConversionCache', 'ShapeCache', 'PersistentCache', 'MetricsRegistry', 'SlowLog']
\ No newline at end of file
@@ -1,19 +1,35 @@
 # converter/base.py
 
-from abc import ABC, abstractmethod
+from abc import ABC
+from converter.render import render
 
 class ExprNode(ABC):
-    """모든 수식 노드의 추상 기반 클래스"""
+    """
+    모든 수식 노드의 추상 기반 클래스
+    - 하위 클래스는 출력 조각(문자열 또는 하위 노드) 리스트만 정의
+    - to_latex / to_hangul 은 converter.render 가 조각을 작업 스택으로 펼쳐 이어 붙임 (재귀 없음)
+    - 조각 대신 to_latex / to_hangul 을 직접 구현한 노드는 그 결과 문자열 하나가 조각
+    """
+
+    def latex_parts(self) -> list:
+        """LaTeX 출력 조각 리스트 (기본 : to_latex 결과 하나)"""
+        if type(self).to_latex is ExprNode.to_latex:
+            raise NotImplementedError(f"{type(self).__name__}: latex_parts 또는 to_latex 구현 필요")
+        return [self.to_latex()]
+
+    def hangul_parts(self) -> list:
+        """한글 출력 조각 리스트 (기본 : to_hangul 결과 하나)"""
+        if type(self).to_hangul is ExprNode.to_hangul:
+            raise NotImplementedError(f"{type(self).__name__}: hangul_parts 또는 to_hangul 구현 필요")
+        return [self.to_hangul()]
 
-    @abstractmethod
     def to_latex(self) -> str:
         """LaTeX 수식 문자열로 변환"""
-        pass
+        return render(self, "latex")
 
-    @abstractmethod
     def to_hangul(self) -> str:
         """한글 수식 문자열로 변환"""
-        pass
+        return render(self, "hangul")
 
     def __str__ (self) -> str:
         return f"<{self.__class__.__name__}: {self.to_latex()}>"
@@ -0,0 +1,173 @@
+# converter/batch.py
+
+"""
+병렬 일괄 변환
+
+- convert_many : (방향, 수식) 항목을 청크로 묶어 프로세스 풀에서 변환하고 결과를 제너레이터로 반환
+    - 입력 iterable 은 필요한 만큼만 읽음 : 동시에 제출된 청크 수(max_in_flight)로 메모리 상한 유지
+    - ordered=True 면 입력 순서, False 면 완료 순서 (index 로 원래 위치 확인)
+    - 워커 프로세스는 실행 내내 재사용 : converter import / 연산자 인덱스 구성은 워커당 한 번
+    - cache_dir 를 주면 워커들이 같은 디스크 캐시(PersistentCache)를 함께 읽고 씀 (청크당 쓰기 트랜잭션 1회, 연결은 변환 / 워커가 끝나면 닫음)
+    - slow_log 를 주면 워커마다 같은 설정의 SlowLog 를 trace sink 로 설치 (같은 JSONL 파일에 함께 기록)
+- convert_document : 한 문서(섹션)의 수식 스크립트들을 청크로 나눠 프로세스 풀에서 변환
+    - 수식끼리는 독립적이므로 청크 단위로 워커에 분배 (청크당 프로세스 간 왕복 1회)
+    - 결과는 완료 순서와 무관하게 문서 순서로 재조립
+    - 수식 하나의 실패는 해당 결과의 error 로만 기록하고 나머지는 계속 변환
+- workers=1 (또는 CPU 1개) 이면 풀 없이 현재 프로세스에서 변환
+
+사용 예시:
+    for result in convert_many([("hangul_to_latex", "x ^ 2"), ("latex_to_hangul", "\\frac{a}{b}")]):
+        print(result.index, result.output)
+
+    scripts = [eq.script for eq in iter_equations("sample/section0.xml")]
+    for result in convert_document(scripts, workers=8):
+        print(result.index, result.output if result.ok else result.error)
+"""
+
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+from multiprocessing.util import Finalize
+from typing import Iterable, Iterator, NamedTuple, Optional, Sequence
+
+from converter import trace
+from converter.parser import convert, operator_index
+from converter.persistent_cache import PersistentCache
+from converter.slow_log import SlowLog
+
+CHUNKS_PER_WORKER = 4   # convert_document 기본 청크 크기 : 워커당 청크 4개 (워커 간 작업량 편차 완화)
+CHUNK_SIZE = 256        # convert_many 기본 청크 크기
+
+# 워커 프로세스의 캐시 디렉터리 → PersistentCache (워커 종료 시 _close_stores 로 닫음)
+_STORES: dict[str, PersistentCache] = {}
+
+
+class ConversionResult(NamedTuple):
+    index: int              # 입력 순서 (문서 내 수식 순서)
+    output: Optional[str]   # 변환 결과, 실패 시 None
+    error: Optional[str]    # 실패 시 "예외 이름: 메시지"
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _init_worker(slow_log: SlowLog = None):
+    """워커 시작 시 한 번 : 양방향 연산자 인덱스를 미리 구성, slow log 설치"""
+    operator_index("HANGUL", "LATEX")
+    operator_index("LATEX", "HANGUL")
+    if slow_log is not None:
+        trace.enable(slow_log)
+    # 풀 워커는 os._exit 로 끝나 atexit 이 돌지 않음 → multiprocessing 종료 처리에 등록
+    Finalize(None, _close_stores, exitpriority=0)
+
+
+def _close_stores():
+    for store in _STORES.values():
+        store.close()
+    _STORES.clear()
+
+
+def _store(cache_dir: str) -> PersistentCache:
+    store = _STORES.get(cache_dir)
+    if store is None:
+        store = _STORES[cache_dir] = PersistentCache(cache_dir)
+    return store
+
+
+def _convert_chunk(engine: str, start: int, items: list[tuple[str, str]],
+                   cache_dir: str = None, store: PersistentCache = None) -> list[ConversionResult]:
+    """워커에서 실행 : 청크 안의 (방향, 수식) 을 차례로 변환 (수식별 예외는 결과로 기록)"""
+    if store is None and cache_dir:
+        store = _store(cache_dir)
+    results = []
+    fresh = []   # 디스크 캐시에 새로 저장할 (입력, 방향, 결과)
+    for index, (direction, text) in enumerate(items, start):
+        try:
+            output = store.get(text, direction) if store is not None else None
+            if output is None:
+                output = convert(text, direction, engine)
+                if store is not None:
+                    fresh.append((text, direction, output))
+            results.append(ConversionResult(index, output, None))
+        except Exception as e:
+            results.append(ConversionResult(index, None, f"{type(e).__name__}: {e}"))
+    if fresh:
+        store.put_many(fresh)
+    return results
+
+
+def _chunks(items: Iterable[tuple[str, str]], chunk_size: int) -> Iterator[tuple[int, list]]:
+    """(시작 index, 항목 리스트) 청크를 입력에서 필요한 만큼만 읽어 생성"""
+    it = iter(items)
+    start = 0
+    while chunk := list(islice(it, chunk_size)):
+        yield start, chunk
+        start += len(chunk)
+
+
+def convert_many(items: Iterable[tuple[str, str]], workers: int = None, chunk_size: int = CHUNK_SIZE,
+                 max_in_flight: int = None, ordered: bool = True, engine: str = "split",
+                 cache_dir: str = None, slow_log: SlowLog = None) -> Iterator[ConversionResult]:
+    """
+    (방향, 수식) 항목들을 병렬 변환해 ConversionResult 를 하나씩 반환
+    - 방향 : "hangul_to_latex" / "latex_to_hangul" (잘못된 방향도 해당 항목의 error 로 기록)
+    - workers       : 프로세스 수 (기본 os.cpu_count(), 1 이면 현재 프로세스에서 변환)
+    - chunk_size    : 워커에 한 번에 넘기는 항목 수
+    - max_in_flight : 동시에 제출해 두는 청크 수 (기본 workers * 2) → 입력 / 결과 버퍼 상한
+    - ordered       : False 면 먼저 끝난 청크부터 반환
+    - cache_dir     : 디스크 캐시 디렉터리 (None 이면 사용 안 함)
+    - slow_log      : 느린 변환 기록 (SlowLog, 워커 프로세스마다 설치)
+    """
+    workers = workers or os.cpu_count() or 1
+    chunks = _chunks(items, chunk_size)
+    if workers <= 1:
+        # 현재 프로세스에서는 이번 호출 전용 연결을 열고 끝나면 닫음
+        store = PersistentCache(cache_dir) if cache_dir else None
+        if slow_log is not None:
+            trace.enable(slow_log)
+        try:
+            for start, chunk in chunks:
+                yield from _convert_chunk(engine, start, chunk, store=store)
+        finally:
+            if slow_log is not None:
+                trace.disable(slow_log)
+            if store is not None:
+                store.close()
+        return
+
+    max_in_flight = max_in_flight or workers * 2
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(slow_log,)) as pool:
+        pending = deque()   # 제출 순서 (ordered) / 미완료 집합 (unordered)
+
+        def fill():
+            for start, chunk in islice(chunks, max_in_flight - len(pending)):
+                pending.append(pool.submit(_convert_chunk, engine, start, chunk, cache_dir))
+
+        fill()
+        while pending:
+            if ordered:
+                done = [pending.popleft()]
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.remove(future)
+            fill()   # 결과를 넘기는 동안에도 워커가 쉬지 않도록 먼저 다음 청크 제출
+            for future in done:
+                yield from future.result()
+
+
+def convert_document(scripts: Sequence[str], direction: str = "hangul_to_latex", workers: int = None,
+                     chunk_size: int = None, engine: str = "split", cache_dir: str = None) -> list[ConversionResult]:
+    """
+    수식 스크립트 목록을 병렬 변환해 입력 순서대로 ConversionResult 목록 반환
+    - workers    : 프로세스 수 (기본 os.cpu_count())
+    - chunk_size : 워커에 한 번에 넘기는 수식 수 (기본 : 워커당 CHUNKS_PER_WORKER 개 청크가 되도록)
+    """
+    scripts = list(scripts)
+    workers = workers or os.cpu_count() or 1
+    chunk_size = chunk_size or max(1, -(-len(scripts) // (workers * CHUNKS_PER_WORKER)))
+    workers = max(1, min(workers, -(-len(scripts) // chunk_size)))   # 청크 수보다 많은 워커는 띄우지 않음
+    return list(convert_many([(direction, text) for text in scripts], workers, chunk_size,
+                             max_in_flight=workers * CHUNKS_PER_WORKER, engine=engine, cache_dir=cache_dir))
@@ -0,0 +1,243 @@
+# converter/cache.py
+
+"""
+수식 단위 변환 결과 LRU 캐시 (ConversionCache) / 수식 모양 템플릿 캐시 (ShapeCache)
+
+- 시험지 수식은 같은 스크립트가 자주 반복됨 ('1', '=4', 'f LEFT ( x RIGHT )' 등)
+- 키 : (변환 방향, 엔진, 정규화한 입력), 변환은 항상 입력 원문으로 → 캐시 사용 여부와 무관하게 convert() 와 같은 결과
+    - normalize : 중괄호 밖의 공백(' ') 연속을 공백 하나로 합치고 양끝 제거 (변환 결과가 바뀌지 않는 것만 접음)
+    - 탭 / 줄바꿈 / HWP 간격 기호(` ~) / 중괄호 블록 안 공백은 결과에 남을 수 있어 그대로 둠
+    - normalize_input=False 면 입력 원문 그대로 키
+- 값 : 후처리 훅까지 적용된 AST + 렌더링 결과
+    - parse 는 저장된 AST 의 복사본을 반환 → 호출자가 이후 훅으로 AST 를 바꿔도 캐시는 그대로
+- maxsize 초과 시 가장 오래 쓰이지 않은 항목부터 제거, 적중 / 미적중 / 제거 횟수는 stats() 로 확인
+- 변환 중 예외는 캐시하지 않음
+- ShapeCache : 리터럴(숫자 / 변수 한 글자)만 다른 수식끼리 AST 템플릿 공유
+    - 키 : tokenizer.shape_key 의 모양 (리터럴 → 자리 문자), 값 : 모양 그대로 파싱한 AST 템플릿
+    - 같은 모양의 다음 입력은 괄호 매칭 / 우선순위 분할 / 후처리 훅 없이 템플릿 복사 + 자리 문자 치환
+    - 템플릿을 처음 만들 때 원래 입력의 직접 파싱 결과와 비교 → 다르면 그 모양은 항상 직접 파싱
+
+사용 예시:
+    cache = ConversionCache(maxsize=10_000)
+    cache.convert("f LEFT ( x RIGHT )")
+    print(cache.stats())
+
+    shapes = ShapeCache()
+    shapes.convert("f LEFT ( 2 RIGHT )")   # 미적중 : 템플릿 생성
+    shapes.convert("g LEFT ( 3 RIGHT )")   # 적중 : 템플릿에 g, 3 채움
+"""
+
+import re
+from collections import OrderedDict
+from typing import NamedTuple
+
+from converter import registry
+from converter.base import ExprNode
+from converter.hooks.postprocess_hook import _snapshot
+from converter.parser import DIRECTIONS
+from converter.tokenizer import SLOT_DIGITS, SLOT_LETTERS, shape_key
+
+_SPACES_RE = re.compile(r" {2,}")
+_BRACE_RE = re.compile(r"[{}]")
+
+
+def normalize(text: str) -> str:
+    """
+    캐시 키용 정규화 : 중괄호 밖의 공백(' ') 연속 → 공백 하나, 양끝 공백 제거
+    - 토크나이저는 ' ' 만 건너뛰므로 중괄호 밖 공백 개수는 토큰 / 변환 결과에 영향 없음
+    - 중괄호 블록은 원문이 결과에 그대로 남을 수 있어 건드리지 않음 (짝 없는 '{' 는 끝까지 블록)
+    """
+    if "{" not in text:
+        return _SPACES_RE.sub(" ", text).strip(" ")
+    parts = []
+    depth = last = 0
+    for m in _BRACE_RE.finditer(text):
+        if m.group() == "{":
+            if depth == 0:
+                parts.append(_SPACES_RE.sub(" ", text[last:m.start()]))
+                last = m.start()
+            depth += 1
+        elif depth:
+            depth -= 1
+            if depth == 0:
+                parts.append(text[last:m.end()])
+                last = m.end()
+    if depth:
+        parts.append(text[last:])
+        return "".join(parts).lstrip(" ")
+    parts.append(_SPACES_RE.sub(" ", text[last:]))
+    return "".join(parts).strip(" ")
+
+
+def clone(ast, table: dict = None):
+    """
+    AST 깊은 복사 (작업 스택, 재귀 없음)
+    - 노드와 리스트(행렬 행 등 중첩 리스트 포함)만 새로 만들고 문자열 등 값은 공유
+    - table 이 있으면 문자열 값은 str.translate(table) 결과로 바꿔 넣음 (모양 템플릿 채우기)
+    """
+    holder = [ast]
+    stack = [(holder, 0)]
+    while stack:
+        container, key = stack.pop()
+        value = container[key]
+        if isinstance(value, ExprNode):
+            copy = value.__class__.__new__(value.__class__)
+            copy.__dict__ = attrs = dict(value.__dict__)
+            container[key] = copy
+            stack.extend((attrs, name) for name in attrs)
+        elif isinstance(value, list):
+            container[key] = items = list(value)
+            stack.extend((items, i) for i in range(len(items)))
+        elif table is not None and isinstance(value, str):
+            container[key] = value.translate(table)
+    return holder[0]
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+
+def _check_direction(direction: str):
+    if direction not in DIRECTIONS:
+        raise ValueError(f"지원하지 않는 변환 방향: {direction!r} (사용 가능: {', '.join(DIRECTIONS)})")
+
+
+class ConversionCache:
+    """(방향, 엔진, 정규화 입력) → (AST, 렌더링 결과) LRU 캐시"""
+
+    def __init__(self, maxsize: int = 4096, normalize_input: bool = True):
+        if maxsize < 1:
+            raise ValueError(f"maxsize 는 1 이상이어야 함: {maxsize}")
+        self.maxsize = maxsize
+        self.normalize_input = normalize_input
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _entry(self, text: str, direction: str, engine: str) -> tuple:
+        _check_direction(direction)
+        key = (direction, engine, normalize(text) if self.normalize_input else text)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        parse, render = DIRECTIONS[direction]
+        ast = parse(text, engine)
+        entry = self._entries[key] = (ast, getattr(ast, render)())
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return entry
+
+    def convert(self, text: str, direction: str = "hangul_to_latex", engine: str = "split") -> str:
+        """캐시를 거친 convert (결과 문자열)"""
+        return self._entry(text, direction, engine)[1]
+
+    def parse(self, text: str, direction: str = "hangul_to_latex", engine: str = "split") -> ExprNode:
+        """캐시를 거친 파싱 (후처리 훅 적용 후 AST 의 복사본)"""
+        return clone(self._entry(text, direction, engine)[0])
+
+    def stats(self) -> CacheStats:
+        return CacheStats(self.hits, self.misses, self.evictions, len(self._entries), self.maxsize)
+
+    def clear(self):
+        """항목과 카운터 모두 초기화"""
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+
+_RESERVED = None   # (registry.revision, 매핑 / 우선순위 키로 쓰이는 영문자 한 글자)
+
+
+def _reserved_letters() -> frozenset:
+    """자리로 바꾸면 안 되는 영문자 한 글자 (매핑 테이블 / 우선순위 키, ex) 'o')"""
+    global _RESERVED
+    if _RESERVED is None or _RESERVED[0] != registry.revision:
+        keys = set()
+        for from_lang, to_lang in registry.DIRECTIONS:
+            for _, _, table in registry.tables(from_lang, to_lang):
+                keys.update(table)
+            keys.update(registry.precedence_map(from_lang))
+        _RESERVED = (registry.revision, frozenset(k for k in keys if len(k) == 1 and k.isalpha()))
+    return _RESERVED[1]
+
+
+class ShapeCache:
+    """(방향, 엔진, 수식 모양) → AST 템플릿 LRU 캐시 (검증 실패한 모양은 None 으로 기억)"""
+
+    def __init__(self, maxsize: int = 4096):
+        if maxsize < 1:
+            raise ValueError(f"maxsize 는 1 이상이어야 함: {maxsize}")
+        self.maxsize = maxsize
+        self._templates = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def parse(self, text: str, direction: str = "hangul_to_latex", engine: str = "split") -> ExprNode:
+        """모양 템플릿을 거친 파싱 (후처리 훅까지 적용된 AST, 호출마다 새 객체)"""
+        _check_direction(direction)
+        parse = DIRECTIONS[direction][0]
+        shaped = shape_key(text, _reserved_letters())
+        if shaped is None:
+            self.misses += 1
+            return parse(text, engine)
+        shape, literals = shaped
+        key = (direction, engine, shape)
+        template = self._templates.get(key)
+        if template is not None:
+            self._templates.move_to_end(key)
+            self.hits += 1
+            return clone(template, self._fill_table(literals))
+
+        self.misses += 1
+        ast = parse(text, engine)
+        if key in self._templates:
+            return ast   # 검증에 실패했던 모양
+        try:
+            template = parse(shape, engine)
+        except Exception:
+            template = None
+        # 템플릿을 원래 리터럴로 채운 결과가 직접 파싱과 다르면 이 모양은 템플릿으로 쓰지 않음
+        if template is not None and \
+                _snapshot(clone(template, self._fill_table(literals))) != _snapshot(ast):
+            template = None
+        self._templates[key] = template
+        if len(self._templates) > self.maxsize:
+            self._templates.popitem(last=False)
+            self.evictions += 1
+        return ast
+
+    def convert(self, text: str, direction: str = "hangul_to_latex", engine: str = "split") -> str:
+        """모양 템플릿을 거친 convert"""
+        _check_direction(direction)
+        return getattr(self.parse(text, direction, engine), DIRECTIONS[direction][1])()
+
+    @staticmethod
+    def _fill_table(literals: str) -> dict:
+        """자리 문자 → 원래 리터럴 (str.translate 표), 자리는 숫자 / 변수 각각 등장 순서대로 번호가 매겨짐"""
+        table = {}
+        digits = letters = 0
+        for ch in literals:
+            if ch <= "9":
+                table[ord(SLOT_DIGITS[digits])] = ch
+                digits += 1
+            else:
+                table[ord(SLOT_LETTERS[letters])] = ch
+                letters += 1
+        return table
+
+    def stats(self) -> CacheStats:
+        return CacheStats(self.hits, self.misses, self.evictions, len(self._templates), self.maxsize)
+
+    def clear(self):
+        self._templates.clear()
+        self.hits = self.misses = self.evictions = 0
@@ -0,0 +1,80 @@
+# converter/fast_path.py
+
+"""
+구조가 없는 수식의 빠른 변환 (AST 없이 토큰 치환)
+
+- 대상 : 숫자 / 식별자 / 이항 연산자(times, div, ...) 만 나열된 수식
+    - ex) '3', 'x', 'a times b = 4', '2 + 3'
+    - 중괄호 / 괄호 / 자동 괄호 태그 / sqrt / int / '_' '^' / LaTeX 명령어가 있으면 대상 아님
+- 전체 경로(tokenize → build_ast → 후처리 훅 → render)와 같은 결과
+    - 연산자가 아닌 토큰 연속 → LiteralNode(" ".join(...)) 와 같은 문자열
+    - 이항 연산자 → BinaryOpNode 와 같은 " 연산자 " (매핑 테이블로 치환), 트리 모양과 무관하게 중위 순서로 이어짐
+    - 연산자가 맨 앞 / 맨 뒤에 있거나 연달아 나오면 (함수형 분기 / 빈 피연산자) 대상 아님
+- 연산자 판정은 파서의 연산자 인덱스와 같은 규칙 (레지스트리 매핑 테이블, 여러 맵에 있으면 마지막 맵)
+- convert 가 먼저 시도하고, None 이면 전체 경로로 변환 (trace 활성 시 fast_path 이벤트로 적중 여부 기록)
+"""
+
+from converter import registry
+from converter.mapping.map import HANGUL_TO_LATEX_BINARY_OP, LATEX_TO_HANGUL_BINARY_OP
+from converter.nodes.binary_op import BinaryOpNode
+from converter.tokenizer import scan
+
+# 변환 방향 → (원본 언어, 대상 언어, BinaryOpNode 렌더링 테이블)
+_DIRECTIONS = {
+    "hangul_to_latex": ("HANGUL", "LATEX", HANGUL_TO_LATEX_BINARY_OP),
+    "latex_to_hangul": ("LATEX", "HANGUL", LATEX_TO_HANGUL_BINARY_OP),
+}
+
+# 일반 토큰에 있으면 대상에서 제외하는 문자 (블록 / 괄호 / 첨자 / LaTeX 명령어)
+_STRUCTURAL_CHARS = frozenset("{}[]()_^\\")
+# 파서가 토큰 이름으로 직접 분기하는 접두어 (자동 괄호 태그, 적분, 제곱근)
+_STRUCTURAL_PREFIXES = ("left", "right", "int", "sqrt")
+
+_TABLES = {}   # 방향 → (registry.revision, 매핑 키 전체, 이항 연산자 토큰 → 출력 문자열)
+
+
+def _tables(direction: str) -> tuple[frozenset, dict]:
+    cached = _TABLES.get(direction)
+    if cached is None or cached[0] != registry.revision:
+        from_lang, to_lang, rendering = _DIRECTIONS[direction]
+        last_class = {}
+        for _, cls, table in registry.tables(from_lang, to_lang):
+            for tok in table:
+                last_class[tok] = cls
+        ops = {tok: f" {rendering.get(tok.strip(), tok.strip())} "
+               for tok, cls in last_class.items() if cls is BinaryOpNode}
+        cached = _TABLES[direction] = (registry.revision, frozenset(last_class), ops)
+    return cached[1], cached[2]
+
+
+def _plain(tok: str) -> bool:
+    """연산자 / 구조 토큰이 아닌 일반 토큰 (매핑 키 여부는 호출부에서 확인)"""
+    if tok[0] == "{" or not _STRUCTURAL_CHARS.isdisjoint(tok):
+        return False
+    return not tok.lower().startswith(_STRUCTURAL_PREFIXES)
+
+
+def transpile(text: str, direction: str) -> str:
+    """
+    구조가 없는 수식이면 변환 결과, 아니면 None
+    - 토큰화 한 번 + 토큰당 사전 조회 한 번
+    """
+    keys, ops = _tables(direction)
+    out = []
+    pending = []        # 현재 피연산자 토큰 연속
+    for tok in scan(text):
+        if tok in keys:
+            op = ops.get(tok)
+            if op is None or not pending:
+                return None
+            out.append(" ".join(pending))
+            out.append(op)
+            pending = []
+        elif _plain(tok):
+            pending.append(tok)
+        else:
+            return None
+    if not pending:
+        return None if out else ""
+    out.append(" ".join(pending))
+    return "".join(out)
@@ -5,6 +5,74 @@ from converter.nodes.binary_op import BinaryOpNode
 from converter.nodes.derivative import DerivativeNode
 from converter.nodes.literal import LiteralNode
 from converter.base import ExprNode
+from converter import trace
+
+
+_NO_FIELDS = ((), False)
+
+def _child_fields(node) -> tuple:
+    """훅 공통 하위 속성 : args 가 있으면 args, 없으면 children (리스트 속성 하나)"""
+    if hasattr(node, 'args'):
+        return ('args',), True
+    elif hasattr(node, 'children'):
+        return ('children',), True
+    return _NO_FIELDS
+
+class _Pending:
+    """_rewrite 작업 스택 항목 : 자식 결과를 모아 다시 넣을 노드"""
+    __slots__ = ("node", "names", "many", "count")
+
+    def __init__(self, node, names: tuple, many: bool, count: int):
+        self.node = node
+        self.names = names
+        self.many = many
+        self.count = count
+
+def _rewrite(ast, fields=_child_fields, enter=None, leave=None, each=None):
+    """
+    훅 공통 순회 (재귀 대신 작업 스택, 자식은 왼쪽부터 방문)
+    - enter(node) : 자식 방문 전 호출. None 이 아닌 값을 반환하면 그 값으로 대체하고 자식은 방문하지 않음
+    - fields(node) : (자식 속성 이름들, 리스트 여부) → 리스트 속성 하나 또는 단일 노드 속성 여러 개
+    - each(child) : 각 자식 결과를 속성에 다시 넣기 전 변환
+    - leave(node) : 자식을 다시 넣은 뒤 호출, 반환값이 해당 위치의 최종 결과 (없으면 node 그대로)
+    기존 재귀 구현(node.args = [recurse(child) for child in node.args] 등)과 방문 순서 / 결과가 같음
+    """
+    results = []
+    stack = [ast]
+    while stack:
+        node = stack.pop()
+        if node.__class__ is _Pending:
+            pending = node
+            node = pending.node
+            start = len(results) - pending.count
+            done = results[start:]
+            del results[start:]
+            if each is not None:
+                done = [each(child) for child in done]
+            if pending.many:
+                setattr(node, pending.names[0], done)
+            else:
+                for name, child in zip(pending.names, done):
+                    setattr(node, name, child)
+            results.append(leave(node) if leave is not None else node)
+            continue
+
+        if enter is not None:
+            replaced = enter(node)
+            if replaced is not None:
+                results.append(replaced)
+                continue
+        names, many = fields(node)
+        if not names:
+            results.append(leave(node) if leave is not None else node)
+            continue
+        if many:
+            children = getattr(node, names[0])
+        else:
+            children = [getattr(node, name) for name in names]
+        stack.append(_Pending(node, names, many, len(children)))
+        stack.extend(reversed(children))
+    return results[0]
 
 def handle_postfix_derivatives(ast: ExprNode) -> ExprNode:
     """
@@ -13,24 +81,24 @@ def handle_postfix_derivatives(ast: ExprNode) -> ExprNode:
     - prime f → f PRIME (DerivativeNode 위치 재조정)
     - prime prime f → f DOUBLEPRIME
     """
-    def recurse(node: ExprNode) -> ExprNode:
+    def enter(node: ExprNode):
         if isinstance(node, DerivativeNode) and len(node.args) == 1:
             target = node.args[0]
             if isinstance(target, DerivativeNode):
                 return DerivativeNode("''", target.args[0])
             elif isinstance(target, LiteralNode):
                 return DerivativeNode(node.op, target)
+        return None
 
+    def fields(node: ExprNode) -> tuple:
         if hasattr(node, 'args'):
-            node.args = [recurse(child) for child in node.args]
+            return ('args',), True
         elif hasattr(node, 'base') and hasattr(node, 'sub'):
-            node.base = recurse(node.base)
-            node.sub = recurse(node.sub)
+            return ('base', 'sub'), False
         elif hasattr(node, 'children'):
-            node.children = [recurse(child) for child in node.children]
-
-        return node
-    return recurse(ast)
+            return ('children',), True
+        return _NO_FIELDS
+    return _rewrite(ast, fields, enter=enter)
 
 def handle_cases_structure(ast: ExprNode) -> ExprNode:
     """
@@ -38,12 +106,7 @@ def handle_cases_structure(ast: ExprNode) -> ExprNode:
     - 내부 줄 구분자: # (ex. a & b # c & d)
     - 이를 children 리스트로 변환해 재구조화할 수 있음
     """
-    def recurse(node: ExprNode) -> ExprNode:
-        if hasattr(node, 'args'):
-            node.args = [recurse(child) for child in node.args]
-        elif hasattr(node, 'children'):
-            node.children = [recurse(child) for child in node.children]
-
+    def leave(node: ExprNode) -> ExprNode:
         if node.__class__.__name__ == 'CasesNode' and len(node.args) == 1:
             only_arg = node.args[0]
             if isinstance(only_arg, LiteralNode):
@@ -51,19 +114,14 @@ def handle_cases_structure(ast: ExprNode) -> ExprNode:
                 node.children = [LiteralNode(row.strip()) for row in rows]
                 node.args = []
         return node
-    return recurse(ast)
+    return _rewrite(ast, leave=leave)
 
 def handle_matrix_structure(ast: ExprNode) -> ExprNode:
     """
     \begin{matrix} 형태의 행렬 수식을 파싱하여
     행(row)과 열(column)을 명확히 분리된 children 구조로 재구성
     """
-    def recurse(node: ExprNode) -> ExprNode:
-        if hasattr(node, 'args'):
-            node.args = [recurse(child) for child in node.args]
-        elif hasattr(node, 'children'):
-            node.children = [recurse(child) for child in node.children]
-
+    def leave(node: ExprNode) -> ExprNode:
         if node.__class__.__name__ == 'MatrixNode' and len(node.args) == 1:
             only_arg = node.args[0]
             if isinstance(only_arg, LiteralNode):
@@ -75,7 +133,7 @@ def handle_matrix_structure(ast: ExprNode) -> ExprNode:
                 node.children = matrix
                 node.args = []
         return node
-    return recurse(ast)
+    return _rewrite(ast, leave=leave)
 
 def handle_nested_mix(ast: ExprNode) -> ExprNode:
     """
@@ -90,13 +148,7 @@ def handle_nested_mix(ast: ExprNode) -> ExprNode:
                 return LiteralNode(val[1:-1])
         return node
 
-    def recurse(node: ExprNode) -> ExprNode:
-        if hasattr(node, 'args'):
-            node.args = [unwrap_literal(recurse(child)) for child in node.args]
-        elif hasattr(node, 'children'):
-            node.children = [unwrap_literal(recurse(child)) for child in node.children]
-        return node
-    return recurse(ast)
+    return _rewrite(ast, each=unwrap_literal)
 
 def handle_vector_classification(ast: ExprNode) -> ExprNode:
     """
@@ -104,18 +156,14 @@ def handle_vector_classification(ast: ExprNode) -> ExprNode:
     - \vec → VEC
     - \hat → UNIT
     """
-    def recurse(node: ExprNode) -> ExprNode:
+    def enter(node: ExprNode):
         if node.__class__.__name__ == 'VectorNode':
             if node.op == r'\vec':
                 node.kind = 'vec'
             elif node.op == r'\hat':
                 node.kind = 'unit'
-        if hasattr(node, 'args'):
-            node.args = [recurse(child) for child in node.args]
-        elif hasattr(node, 'children'):
-            node.children = [recurse(child) for child in node.children]
-        return node
-    return recurse(ast)
+        return None
+    return _rewrite(ast, enter=enter)
 
 def merge_negative_numbers(tokens: list[str]) -> list[str]:
     merged = []
@@ -143,7 +191,65 @@ def apply_postprocess_hooks(ast: ExprNode) -> ExprNode:
         handle_nested_mix,
         handle_vector_classification,
     ]
+    if trace.active:
+        return _apply_traced(ast, hooks)
     for hook in hooks:
         ast = hook(ast)
     return ast
 
+def _apply_traced(ast: ExprNode, hooks: list) -> ExprNode:
+    """
+    trace 활성 시 훅 적용 : hooks 구간 안에 훅별 hook 구간
+    - changed : 훅 적용 전후 AST 스냅샷 비교 (훅이 트리를 실제로 바꿨는지), trace.node_events 일 때만
+    - hooks 구간의 nodes : 훅 적용을 마친 최종 AST 의 노드 수 (끝에서 한 번만 셈)
+    """
+    with trace.span("hooks") as summary:
+        if not trace.node_events:
+            for hook in hooks:
+                with trace.span("hook", name=hook.__name__):
+                    ast = hook(ast)
+            summary["nodes"] = _count_nodes(ast)
+            return ast
+        snapshot = _snapshot(ast)
+        for hook in hooks:
+            with trace.span("hook", name=hook.__name__) as data:
+                ast = hook(ast)
+            before, snapshot = snapshot, _snapshot(ast)
+            data["changed"] = snapshot != before
+        summary["nodes"] = sum(1 for value in snapshot if isinstance(value, type) and issubclass(value, ExprNode))
+    return ast
+
+def _count_nodes(ast: ExprNode) -> int:
+    """AST 의 노드 수 (작업 스택 순회)"""
+    count = 0
+    pending = [ast]
+    while pending:
+        value = pending.pop()
+        if isinstance(value, ExprNode):
+            count += 1
+            pending.extend(vars(value).values())
+        elif isinstance(value, list):
+            pending.extend(value)
+    return count
+
+def _snapshot(ast: ExprNode) -> list:
+    """
+    AST 의 노드 종류 / 속성 이름 / 값을 전위 순서로 나열한 리스트 (작업 스택 순회)
+    - repr 비교와 달리 깊은 트리에서도 재귀 한도에 걸리지 않음
+    """
+    out = []
+    pending = [ast]
+    while pending:
+        value = pending.pop()
+        if isinstance(value, ExprNode):
+            out.append(type(value))
+            for name, child in reversed(list(vars(value).items())):
+                pending.append(child)
+                pending.append(name)
+        elif isinstance(value, list):
+            out.append(len(value))
+            pending.extend(reversed(value))
+        else:
+            out.append(value)
+    return out
+
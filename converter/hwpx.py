@@ -0,0 +1,160 @@
+# converter/hwpx.py
+
+"""
+HWPX 섹션 XML(Contents/section*.xml)에서 수식(<hp:equation>) 추출
+
+- iter_equations : 섹션을 점진적으로 파싱(iterparse)하며 수식마다 EquationRecord 를 하나씩 반환
+    - DOM 전체를 메모리에 올리지 않음
+    - 끝난 요소는 바로 부모에서 떼어내므로 섹션 크기와 무관하게 메모리 일정
+    - 수식 안의 요소만 수식이 끝날 때까지 유지 (<hp:script> 텍스트를 읽기 위해)
+- 스크립트 텍스트의 엔티티(&lt; 등)는 XML 파서가 풀어서 반환
+- iter_package_equations : .hwpx(zip) 패키지의 Contents/section*.xml 멤버를 압축 해제 스트림으로 바로 읽음
+    - 디스크에 풀지 않음, 요청한 섹션만 압축 해제
+- rewrite_scripts : 섹션을 바이트 그대로 복사하면서 id 로 지정한 수식의 <hp:script> 텍스트만 교체
+
+사용 예시:
+    for eq in iter_equations("sample/section0.xml"):
+        print(eq.id, eq.attributes["baseUnit"], eq.script)
+
+    for section, eq in iter_package_equations("doc.hwpx", sections=[0]):
+        print(section, eq.script)
+"""
+
+import re
+import xml.etree.ElementTree as ET
+import zipfile
+from typing import IO, Iterable, Iterator, Mapping, NamedTuple, Union
+from xml.sax.saxutils import escape
+
+HP_NS = "http://www.hancom.co.kr/hwpml/2011/paragraph"
+EQUATION_TAG = f"{{{HP_NS}}}equation"
+SCRIPT_TAG = f"{{{HP_NS}}}script"
+
+_SECTION_RE = re.compile(r"Contents/section(\d+)\.xml")
+
+
+class EquationRecord(NamedTuple):
+    id: str            # <hp:equation id="...">, 없으면 None
+    attributes: dict   # <hp:equation> 속성 전체 (baseUnit, font, version 등)
+    script: str        # <hp:script> 텍스트, 비어 있거나 없으면 ""
+
+
+def iter_equations(source: Union[str, IO[bytes]]) -> Iterator[EquationRecord]:
+    """
+    섹션 XML 의 수식을 문서 순서대로 반환
+    - source : 파일 경로 또는 바이너리 파일 객체 (zip 멤버 등 스트림 가능)
+    """
+    open_elements = []   # 시작 태그는 읽었지만 아직 끝나지 않은 요소 (루트 → 현재 위치)
+    depth = 0            # 열려 있는 <hp:equation> 수
+    for event, elem in ET.iterparse(source, events=("start", "end")):
+        if event == "start":
+            open_elements.append(elem)
+            if elem.tag == EQUATION_TAG:
+                depth += 1
+            continue
+
+        open_elements.pop()
+        if elem.tag == EQUATION_TAG:
+            depth -= 1
+            script = elem.find(SCRIPT_TAG)
+            text = script.text if script is not None else None
+            yield EquationRecord(elem.get("id"), dict(elem.attrib), text or "")
+        # 수식 밖의 끝난 요소는 부모에서 제거 (부모에는 항상 마지막 자식 하나만 남아 있음)
+        if depth == 0 and open_elements:
+            open_elements[-1].remove(elem)
+
+
+def section_names(package: zipfile.ZipFile) -> list[str]:
+    """패키지 안의 섹션 멤버 이름 (섹션 번호 순 : section2 < section10)"""
+    found = [(int(m.group(1)), name) for name in package.namelist()
+             if (m := _SECTION_RE.fullmatch(name))]
+    return [name for _, name in sorted(found)]
+
+
+def iter_package_equations(source: Union[str, IO[bytes]],
+                           sections: Iterable[Union[int, str]] = None) -> Iterator[tuple[str, EquationRecord]]:
+    """
+    .hwpx 패키지의 수식을 (섹션 멤버 이름, EquationRecord) 로 반환
+    - source   : .hwpx 경로 또는 바이너리 파일 객체
+    - sections : 섹션 번호(0, 1, ...) 또는 멤버 이름 목록, None 이면 전체 섹션 (섹션 번호 순)
+    - 없는 섹션을 요청하면 KeyError (압축 해제 전에 확인)
+    """
+    with zipfile.ZipFile(source) as package:
+        names = section_names(package)
+        if sections is None:
+            selected = names
+        else:
+            selected = [f"Contents/section{s}.xml" if isinstance(s, int) else s for s in sections]
+            missing = [name for name in selected if name not in names]
+            if missing:
+                raise KeyError(f"패키지에 없는 섹션: {', '.join(missing)}")
+        for name in selected:
+            with package.open(name) as stream:
+                for record in iter_equations(stream):
+                    yield name, record
+
+
+_TAG_RE = re.compile(rb"<hp:(equation|script)\b([^>]*)>|</hp:equation>")
+_ID_RE = re.compile(rb"""\sid\s*=\s*["']([^"']*)["']""")
+_SCRIPT_END = b"</hp:script>"
+
+
+def rewrite_scripts(src: IO[bytes], dst: IO[bytes], scripts: Mapping[str, str],
+                    chunk_size: int = 1 << 16) -> int:
+    """
+    섹션 XML 을 src → dst 로 복사하면서 scripts 에 id 가 있는 수식의 <hp:script> 텍스트만 교체
+    - DOM 없이 바이트 단위로 스트리밍 (청크 + 태그가 잘린 꼬리만 이월) → 메모리 일정
+    - 교체하지 않는 부분은 네임스페이스 / 속성 / 공백까지 바이트 그대로 유지
+    - 새 텍스트는 XML 이스케이프(&, <, >) 후 UTF-8 로 기록, <hp:script/> 는 <hp:script>...</hp:script> 로 펼침
+    - 원문의 hp 접두어 기준 (한글이 저장하는 섹션 XML 형식)
+    - 반환값 : 교체한 수식 수
+    """
+    replaced = 0
+    equation_id = None   # 현재 열려 있는 <hp:equation> 의 id
+    skipping = False     # 교체 대상 스크립트의 기존 텍스트를 버리는 중
+    buf = b""
+    eof = False
+    while not eof:
+        chunk = src.read(chunk_size)
+        eof = not chunk
+        buf += chunk
+        pos = 0
+        while True:
+            if skipping:
+                end = buf.find(_SCRIPT_END, pos)
+                if end < 0:
+                    # 기존 텍스트는 버리고, 종료 태그가 잘렸을 수 있는 꼬리만 남김
+                    pos = max(pos, len(buf) - len(_SCRIPT_END) + 1)
+                    break
+                pos = end
+                skipping = False
+            m = _TAG_RE.search(buf, pos)
+            if m is None:
+                # 잘린 태그일 수 있는 마지막 '<' 이후는 다음 청크와 이어서 검사
+                cut = len(buf) if eof else buf.rfind(b"<", pos)
+                if cut < 0:
+                    cut = len(buf)
+                dst.write(buf[pos:cut])
+                pos = cut
+                break
+            kind = m.group(1)
+            if kind is None:
+                equation_id = None
+            elif kind == b"equation":
+                id_match = _ID_RE.search(m.group(2))
+                equation_id = id_match.group(1).decode("utf-8") if id_match else None
+            elif equation_id is not None and equation_id in scripts:
+                text = escape(scripts[equation_id]).encode("utf-8")
+                if m.group(2).endswith(b"/"):
+                    dst.write(buf[pos:m.end() - 2] + b">" + text + _SCRIPT_END)
+                else:
+                    dst.write(buf[pos:m.end()] + text)
+                    skipping = True
+                pos = m.end()
+                equation_id = None
+                replaced += 1
+                continue
+            dst.write(buf[pos:m.end()])
+            pos = m.end()
+        buf = buf[pos:]
+    return replaced
@@ -0,0 +1,143 @@
+# converter/metrics.py
+
+"""
+변환 지표 수집 (trace sink) : 노드 종류별 생성 수 / 대체 분기 / 적분 실패 / 훅 변경 횟수 / 단계별 지연 히스토그램
+
+- MetricsRegistry 는 trace sink : trace.enable(metrics) 동안의 변환만 집계 (설치 전에는 비용 없음)
+    - 노드 / 훅 변경 집계에 노드 단위 정보가 필요하므로 wants_nodes sink
+- 집계 항목
+    - nodes           : parse 직후 AST 의 노드 클래스별 개수 (node 이벤트)
+    - fallbacks       : 마지막 LiteralNode(" ".join(...)) 분기 횟수
+    - integral_errors : build_ast 의 적분 분기에서 잡힌 예외 이름별 횟수
+    - hook_runs / hook_changes : 훅별 실행 횟수 / AST 를 실제로 바꾼 횟수
+    - fast_path       : 빠른 경로 적중(hit) / 미적중(miss)
+    - phase_errors    : 예외로 끝난 구간 수 (단계별)
+    - phases          : 구간 단계별 지연 히스토그램 (초, 누적 버킷), 훅은 "hook.<훅 이름>" 으로 따로 집계
+- snapshot() → dict, to_json() / to_prometheus() 로 내보내기 (외부 의존성 없음)
+    - 배치 워커는 프로세스마다 자기 레지스트리의 스냅샷을 내보냄
+
+사용 예시:
+    metrics = MetricsRegistry()
+    trace.enable(metrics)
+    convert("{a} over {b}")
+    print(metrics.to_prometheus())
+"""
+
+import json
+from bisect import bisect_left
+from collections import Counter
+
+from converter.trace import TraceEvent
+
+# 지연 히스토그램 버킷 상한 (초)
+DEFAULT_BUCKETS = (1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 2.5e-3, 5e-3, 1e-2, 2.5e-2, 5e-2, 0.1, 0.25, 0.5, 1.0)
+
+# 스냅샷의 카운터 이름 → (Prometheus 라벨 이름, 설명)
+_COUNTERS = {
+    "nodes": ("type", "AST nodes built by parse, by node class"),
+    "integral_errors": ("error", "integral parse failures caught in build_ast, by exception"),
+    "hook_runs": ("hook", "post-process hook runs"),
+    "hook_changes": ("hook", "post-process hook runs that changed the AST"),
+    "fast_path": ("result", "fast path attempts by result"),
+    "phase_errors": ("phase", "spans that ended with an exception, by phase"),
+}
+
+
+class Histogram:
+    """누적 버킷 히스토그램 (Prometheus histogram 과 같은 le 의미)"""
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: tuple = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)   # 마지막 칸 : +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def snapshot(self) -> dict:
+        cumulative, total = [], 0
+        for le, n in zip(self.buckets + ("+Inf",), self.counts):
+            total += n
+            cumulative.append([le, total])
+        return {"buckets": cumulative, "sum": self.sum, "count": self.count}
+
+
+class MetricsRegistry:
+    """trace 이벤트 → 카운터 / 히스토그램 (trace.enable(registry) 로 설치)"""
+    wants_nodes = True   # node 이벤트 / hook changed 요청
+
+    def __init__(self, buckets: tuple = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.reset()
+
+    def reset(self):
+        self.counters = {name: Counter() for name in _COUNTERS}
+        self.fallbacks = 0
+        self.histograms: dict[str, Histogram] = {}
+
+    def __call__(self, event: TraceEvent):
+        data = event.data
+        if event.kind == "end":
+            key = event.phase
+            if key == "hook":
+                key = f"hook.{data['name']}"
+                self.counters["hook_runs"][data["name"]] += 1
+                if data.get("changed"):
+                    self.counters["hook_changes"][data["name"]] += 1
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram(self.buckets)
+            histogram.observe(event.elapsed / 1e9)
+            if "error" in data:
+                self.counters["phase_errors"][event.phase] += 1
+        elif event.kind == "point":
+            if event.phase == "node":
+                self.counters["nodes"][data["type"]] += 1
+            elif event.phase == "fallback":
+                self.fallbacks += 1
+            elif event.phase == "integral_error":
+                self.counters["integral_errors"][data["error"]] += 1
+            elif event.phase == "fast_path":
+                self.counters["fast_path"]["hit" if data["hit"] else "miss"] += 1
+
+    def snapshot(self) -> dict:
+        """현재 집계 (JSON 으로 바로 직렬화 가능한 dict)"""
+        result = {name: dict(sorted(counter.items())) for name, counter in self.counters.items()}
+        result["fallbacks"] = self.fallbacks
+        result["phases"] = {key: self.histograms[key].snapshot() for key in sorted(self.histograms)}
+        return result
+
+    def to_json(self, indent: int = None) -> str:
+        return json.dumps(self.snapshot(), indent=indent)
+
+    def to_prometheus(self, prefix: str = "math_converter") -> str:
+        """Prometheus text exposition format (0.0.4)"""
+        snap = self.snapshot()
+        lines = []
+        for name, (label, help_text) in _COUNTERS.items():
+            metric = f"{prefix}_{name}_total"
+            lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} counter"]
+            lines += [f'{metric}{{{label}="{_escape(key)}"}} {value}' for key, value in snap[name].items()]
+        metric = f"{prefix}_fallbacks_total"
+        lines += [f"# HELP {metric} final LiteralNode fallback branches taken", f"# TYPE {metric} counter",
+                  f"{metric} {snap['fallbacks']}"]
+
+        metric = f"{prefix}_phase_seconds"
+        lines += [f"# HELP {metric} conversion phase latency", f"# TYPE {metric} histogram"]
+        for key, histogram in snap["phases"].items():
+            phase, _, hook = key.partition(".")
+            labels = f'phase="{phase}"' + (f',hook="{_escape(hook)}"' if hook else "")
+            for le, count in histogram["buckets"]:
+                lines.append(f'{metric}_bucket{{{labels},le="{le}"}} {count}')
+            lines.append(f"{metric}_sum{{{labels}}} {histogram['sum']!r}")
+            lines.append(f"{metric}_count{{{labels}}} {histogram['count']}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    """Prometheus 라벨 값 이스케이프 (\\, ", 줄바꿈)"""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -14,12 +14,12 @@ class ArrowNode(ExprNode):
         self.left = left
         self.right = right
 
-    def to_latex(self) -> str:
-        return f"{self.left.to_latex()} {self.op} {self.right.to_latex()}"
+    def latex_parts(self) -> list:
+        return [self.left, f" {self.op} ", self.right]
 
-    def to_hangul(self) -> str:
+    def hangul_parts(self) -> list:
         op = LATEX_TO_HANGUL_ARROW.get(self.op, self.op)
-        return f"{self.left.to_hangul()} {op} {self.right.to_hangul()}"
+        return [self.left, f" {op} ", self.right]
 
     def __repr__(self):
         return f"ArrowNode('{self.op}', {repr(self.left)}, {repr(self.right)})"
\ No newline at end of file
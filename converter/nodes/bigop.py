@@ -1,6 +1,7 @@
 # converter/nodes/bigop.py
 
 from converter.base import ExprNode
+from converter.render import joined
 from converter.mapping.map import HANGUL_TO_LATEX_BIGOP, LATEX_TO_HANGUL_BIGOP
 
 class BigOpNode(ExprNode):
@@ -15,17 +16,15 @@ class BigOpNode(ExprNode):
             self.op = op
         self.args = list(args)
 
-    def to_latex(self) -> str:
+    def latex_parts(self) -> list:
         if len(self.args) == 3:
-            lower = self.args[0].to_latex()
-            upper = self.args[1].to_latex()
-            expr = self.args[2].to_latex()
-            return f"{self.op}_{{{lower}}}^{{{upper}}} {expr}"
-        return f"{self.op} " + " ".join(arg.to_latex() for arg in self.args)
+            lower, upper, expr = self.args
+            return [f"{self.op}_{{", lower, "}^{", upper, "} ", expr]
+        return [f"{self.op} ", *joined(self.args, " ")]
 
-    def to_hangul(self) -> str:
+    def hangul_parts(self) -> list:
         hangul_op = LATEX_TO_HANGUL_BIGOP.get(self.op, self.op)
-        return f"{hangul_op} " + " ".join(arg.to_hangul() for arg in self.args)
+        return [f"{hangul_op} ", *joined(self.args, " ")]
 
     def __repr__(self):
         return f"BigOpNode('{self.op}', {', '.join(repr(a) for a in self.args)})"
\ No newline at end of file
@@ -11,25 +11,13 @@ class BinaryOpNode(ExprNode):
         self.left = left
         self.right = right
 
-    def to_latex(self) -> str:
-        left_str = self.left.to_latex()
-        right_str = self.right.to_latex()
-
+    def latex_parts(self) -> list:
         latex_op = HANGUL_TO_LATEX_BINARY_OP.get(self.op, self.op)
-        return f"{left_str} {latex_op} {right_str}"
-
-    def to_hangul(self) -> str:
-        left_str = self.left.to_hangul()
-        right_str = self.right.to_hangul()
+        return [self.left, f" {latex_op} ", self.right]
 
+    def hangul_parts(self) -> list:
         hangul_op = LATEX_TO_HANGUL_BINARY_OP.get(self.op, self.op)
-
-        print("[DEBUG to_hangul] (LaTeX → HANGUL 변환)")
-        print(f"  self.op         = '{self.op}'")
-        print(f"  hangul_op       = '{hangul_op}'")
-        print(f"  final_str       = '{left_str} {hangul_op} {right_str}'")
-
-        return f"{left_str} {hangul_op} {right_str}"
+        return [self.left, f" {hangul_op} ", self.right]
 
     def __repr__(self):
         return f"BinaryOpNode('{self.op}', {repr(self.left)}, {repr(self.right)})"
\ No newline at end of file
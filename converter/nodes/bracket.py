@@ -16,17 +16,15 @@ class BracketNode(ExprNode):
         self.rparen = rparen
         self.right_tag = right_tag
 
-    def to_latex(self) -> str:
+    def latex_parts(self) -> list:
         left_tag = r"\left" if self.left_tag.casefold() in ["left", "\\left"] else self.left_tag
         right_tag = r"\right" if self.right_tag.casefold() in ["right", "\\right"] else self.right_tag
-        inner = self.inner.to_latex()
-        return f"{left_tag}{self.lparen}{inner}{right_tag}{self.rparen}"
+        return [f"{left_tag}{self.lparen}", self.inner, f"{right_tag}{self.rparen}"]
 
-    def to_hangul(self) -> str:
+    def hangul_parts(self) -> list:
         left_tag = "left" if self.left_tag.casefold() in ["left", "\\left"] else self.left_tag
         right_tag = "right" if self.right_tag.casefold() in ["right", "\\right"] else self.right_tag
-        inner = self.inner.to_hangul()
-        return f"{left_tag}{self.lparen}{inner}{right_tag}{self.rparen}"
+        return [f"{left_tag}{self.lparen}", self.inner, f"{right_tag}{self.rparen}"]
 
     def __repr__(self):
         return f"BracketNode('{self.left_tag}', '{self.lparen}', {repr(self.inner)}, '{self.rparen}', '{self.right_tag}')"
\ No newline at end of file
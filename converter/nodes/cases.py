@@ -1,6 +1,7 @@
 # converter/nodes/cases.py
 
 from converter.base import ExprNode
+from converter.render import joined
 from converter.mapping.map import HANGUL_TO_LATEX_CASES, LATEX_TO_HANGUL_CASES
 from converter.nodes.binary_op import BinaryOpNode
 
@@ -11,7 +12,7 @@ class CasesNode(ExprNode):
     """
 
     def __init__(self, op, *args):
-        from converter.parser import build_ast, tokenize  # 순환 import 회피
+        from converter.parser import build_ast, _tokenize  # 순환 import 회피
 
         self.op = HANGUL_TO_LATEX_CASES.get(op, op)
         self.args = []
@@ -22,20 +23,18 @@ class CasesNode(ExprNode):
             for line in lines:
                 if "&&" in line:
                     left_raw, right_raw = line.split("&&", 1)
-                    left_ast = build_ast(tokenize(left_raw.strip()), from_lang="HANGUL", to_lang="LATEX")
-                    right_ast = build_ast(tokenize(right_raw.strip()), from_lang="HANGUL", to_lang="LATEX")
+                    left_ast = build_ast(_tokenize(left_raw.strip()), from_lang="HANGUL", to_lang="LATEX")
+                    right_ast = build_ast(_tokenize(right_raw.strip()), from_lang="HANGUL", to_lang="LATEX")
                     self.args.append(BinaryOpNode("&", left_ast, right_ast))
         else:
             self.args = list(args)
 
-    def to_latex(self) -> str:
-        content = r" \\ ".join(arg.to_latex() for arg in self.args)
-        return f"\\begin{{cases}} {content} \\end{{cases}}"
+    def latex_parts(self) -> list:
+        return ["\\begin{cases} ", *joined(self.args, r" \\ "), " \\end{cases}"]
 
-    def to_hangul(self) -> str:
+    def hangul_parts(self) -> list:
         hangul_op = LATEX_TO_HANGUL_CASES.get(self.op, self.op)
-        content = " # ".join(arg.to_hangul() for arg in self.args)
-        return f"{hangul_op} {content}"
+        return [f"{hangul_op} ", *joined(self.args, " # ")]
 
     def __repr__(self):
         return f"CasesNode('{self.op}', {', '.join(repr(a) for a in self.args)})"
\ No newline at end of file
@@ -12,12 +12,12 @@ class DerivativeNode(ExprNode):
         self.op = HANGUL_TO_LATEX_DERIV.get(op, op)
         self.func = func
 
-    def to_latex(self) -> str:
-        return f"{self.func.to_latex()}{self.op}"
+    def latex_parts(self) -> list:
+        return [self.func, self.op]
 
-    def to_hangul(self) -> str:
+    def hangul_parts(self) -> list:
         hangul_op = LATEX_TO_HANGUL_DERIV.get(self.op, self.op)
-        return f"{self.func.to_hangul()} {hangul_op}"
+        return [self.func, f" {hangul_op}"]
 
     def __repr__(self):
         return f"DerivativeNode('{self.op}', {repr(self.func)})"
\ No newline at end of file
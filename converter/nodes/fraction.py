@@ -17,21 +17,19 @@ class FractionNode(ExprNode):
             self.op = op
         self.args = list(args)
 
-    def to_latex(self) -> str:
+    def latex_parts(self) -> list:
         latex_op = HANGUL_TO_LATEX_FRACTION.get(self.op, self.op)
         if len(self.args) == 2:
-            numerator = self.args[0].to_latex()
-            denominator = self.args[1].to_latex()
-            return f"{latex_op}{{{numerator}}}{{{denominator}}}"
-        return latex_op
+            numerator, denominator = self.args
+            return [f"{latex_op}{{", numerator, "}{", denominator, "}"]
+        return [latex_op]
 
-    def to_hangul(self) -> str:
+    def hangul_parts(self) -> list:
         hangul_op = LATEX_TO_HANGUL_FRACTION.get(self.op, self.op)
         if len(self.args) == 2:
-            numerator = self.args[0].to_hangul()
-            denominator = self.args[1].to_hangul()
-            return f"{numerator} {hangul_op} {{{denominator}}}"
-        return hangul_op
+            numerator, denominator = self.args
+            return [numerator, f" {hangul_op} {{", denominator, "}"]
+        return [hangul_op]
 
     def __repr__(self):
         return f"FractionNode('{self.op}', {', '.join(repr(a) for a in self.args)})"
\ No newline at end of file
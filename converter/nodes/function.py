@@ -1,4 +1,5 @@
 from converter.base import ExprNode
+from converter.render import joined
 from converter.mapping.map import HANGUL_TO_LATEX_FUNCTION, LATEX_TO_HANGUL_FUNCTION
 
 
@@ -13,24 +14,22 @@ class FunctionNode(ExprNode):
         self.op = HANGUL_TO_LATEX_FUNCTION.get(op, op)
         self.args = list(args)
 
-    def to_latex(self) -> str:
+    def latex_parts(self) -> list:
         """
         함수 → LaTeX 변환
         - 함수명: self.op
         - 인자: 항상 중괄호로 감쌈
         """
-        args_str = " ".join(arg.to_latex() for arg in self.args)
-        return f"{self.op}{{{args_str}}}"
+        return [f"{self.op}{{", *joined(self.args, " "), "}"]
 
-    def to_hangul(self) -> str:
+    def hangul_parts(self) -> list:
         """
         함수 → 한글 변환
         - 함수명: 한글로 치환
         - 인자: 중괄호 유지
         """
         op_hangul = LATEX_TO_HANGUL_FUNCTION.get(self.op, self.op)
-        args_str = " ".join(f"{{{arg.to_hangul()}}}" for arg in self.args)
-        return f"{op_hangul} {args_str}"
+        return [f"{op_hangul} ", *joined(self.args, " ", "{", "}")]
 
     def __repr__(self):
         return f"FunctionNode('{self.op}', {', '.join(repr(a) for a in self.args)})"
\ No newline at end of file
@@ -15,24 +15,18 @@ class IntegralNode(ExprNode):
             self.op = op
         self.args = list(args)
 
-    def to_latex(self) -> str:
+    def latex_parts(self) -> list:
         if len(self.args) == 4:
-            lower = self.args[0].to_latex()
-            upper = self.args[1].to_latex()
-            body = self.args[2].to_latex()
-            dx = self.args[3].to_latex()
-            return f"{self.op}_{{{lower}}}^{{{upper}}} {body} \\, {dx}"
-        return self.op
+            lower, upper, body, dx = self.args
+            return [f"{self.op}_{{", lower, "}^{", upper, "} ", body, " \\, ", dx]
+        return [self.op]
 
-    def to_hangul(self) -> str:
+    def hangul_parts(self) -> list:
         hangul_op = LATEX_TO_HANGUL_INTEGRAL.get(self.op, self.op)
         if len(self.args) == 4:
-            lower = self.args[0].to_hangul()
-            upper = self.args[1].to_hangul()
-            body = self.args[2].to_hangul()
-            dx = self.args[3].to_hangul()
-            return f"{hangul_op}_ {{{lower}}} ^ {{{upper}}} {body} {dx}"
-        return hangul_op
+            lower, upper, body, dx = self.args
+            return [f"{hangul_op}_ {{", lower, "} ^ {", upper, "} ", body, " ", dx]
+        return [hangul_op]
 
     def __repr__(self):
         return f"IntegralNode('{self.op}', {', '.join(repr(a) for a in self.args)})"
@@ -15,20 +15,18 @@ class LimitNode(ExprNode):
             self.op = op
         self.args = list(args)
 
-    def to_latex(self) -> str:
+    def latex_parts(self) -> list:
         if len(self.args) == 2:
-            under = self.args[0].to_latex()
-            body = self.args[1].to_latex()
-            return f"{self.op}_{{{under}}} {body}"
-        return self.op
+            under, body = self.args
+            return [f"{self.op}_{{", under, "} ", body]
+        return [self.op]
 
-    def to_hangul(self) -> str:
+    def hangul_parts(self) -> list:
         hangul_op = LATEX_TO_HANGUL_LIMIT.get(self.op, self.op)
         if len(self.args) == 2:
-            under = self.args[0].to_hangul()
-            body = self.args[1].to_hangul()
-            return f"{hangul_op} {{{under}}} {body}"
-        return hangul_op
+            under, body = self.args
+            return [f"{hangul_op} {{", under, "} ", body]
+        return [hangul_op]
 
     def __repr__(self):
         return f"LimitNode('{self.op}', {', '.join(repr(a) for a in self.args)})"
\ No newline at end of file
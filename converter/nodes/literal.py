@@ -12,12 +12,19 @@ class LiteralNode(ExprNode):
     def __init__(self, value: str):
         self.value = value
 
+    def latex_parts(self) -> list:
+        return [self.value]
+
+    def hangul_parts(self) -> list:
+        return [self.value]
+
+    # 리프 노드는 조각을 펼칠 필요가 없으므로 렌더러를 거치지 않고 바로 반환
     def to_latex(self) -> str:
         return self.value
 
     def to_hangul(self) -> str:
         return self.value
-        
+
     def __repr__(self):
         return f"LiteralNode('{self.value}')"
 
@@ -17,24 +17,23 @@ class LogNode(ExprNode):
             self.op = op
         self.args = list(args)
 
-    def to_latex(self) -> str:
+    def latex_parts(self) -> list:
         latex_op = self.op
         if len(self.args) == 2:
-            base_str = self.args[0].to_latex()
-            value_str = self.args[1].to_latex()
-            return f"{latex_op}_{{{base_str}}}{{{value_str}}}"
+            base, value = self.args
+            return [f"{latex_op}_{{", base, "}{", value, "}"]
         elif len(self.args) == 1:
-            return f"{latex_op}{{{self.args[0].to_latex()}}}"
+            return [f"{latex_op}{{", self.args[0], "}"]
         else:
-            return latex_op
+            return [latex_op]
 
-    def to_hangul(self) -> str:
+    def hangul_parts(self) -> list:
         hangul_op = LATEX_TO_HANGUL_LOG.get(self.op, self.op)
         if len(self.args) == 2:
-            return f"{hangul_op}_{{{self.args[0].to_hangul()}}}{{{self.args[1].to_hangul()}}}"
+            return [f"{hangul_op}_{{", self.args[0], "}{", self.args[1], "}"]
         elif len(self.args) == 1:
-            return f"{hangul_op} {{{self.args[0].to_hangul()}}}"
-        return hangul_op
+            return [f"{hangul_op} {{", self.args[0], "}"]
+        return [hangul_op]
 
     def __repr__(self):
         return f"LogNode('{self.op}', {', '.join(repr(a) for a in self.args)})"
\ No newline at end of file
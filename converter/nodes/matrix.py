@@ -1,6 +1,7 @@
 # converter/nodes/matrix.py
 
 from converter.base import ExprNode
+from converter.render import joined
 from converter.mapping.map import HANGUL_TO_LATEX_MATRIX, LATEX_TO_HANGUL_MATRIX
 
 class MatrixNode(ExprNode):
@@ -15,14 +16,12 @@ class MatrixNode(ExprNode):
             self.op = op
         self.args = list(args)  # 각 row는 LiteralNode("1 & 2") 형태로 들어옴
 
-    def to_latex(self) -> str:
-        content = r" \\\\ ".join(arg.to_latex() for arg in self.args)
-        return f"\\begin{{matrix}} {content} \\end{{matrix}}"
+    def latex_parts(self) -> list:
+        return ["\\begin{matrix} ", *joined(self.args, r" \\\\ "), " \\end{matrix}"]
 
-    def to_hangul(self) -> str:
+    def hangul_parts(self) -> list:
         hangul_op = LATEX_TO_HANGUL_MATRIX.get(self.op, self.op)
-        content = " # ".join(arg.to_hangul() for arg in self.args)
-        return f"{hangul_op} {content}"
+        return [f"{hangul_op} ", *joined(self.args, " # ")]
 
     def __repr__(self):
         return f"MatrixNode('{self.op}', {', '.join(repr(a) for a in self.args)})"
\ No newline at end of file
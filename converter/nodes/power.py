@@ -12,20 +12,18 @@ class PowerNode(ExprNode):
         self.op = HANGUL_TO_LATEX_POWER.get(op, op)
         self.args = list(args)
 
-    def to_latex(self) -> str:
+    def latex_parts(self) -> list:
         if len(self.args) == 2:
-            base = self.args[0].to_latex()
-            exponent = self.args[1].to_latex()
-            return f"{base}{self.op}{{{exponent}}}"
-        return self.op
+            base, exponent = self.args
+            return [base, f"{self.op}{{", exponent, "}"]
+        return [self.op]
 
-    def to_hangul(self) -> str:
+    def hangul_parts(self) -> list:
         hangul_op = LATEX_TO_HANGUL_POWER.get(self.op, self.op)
         if len(self.args) == 2:
-            base = self.args[0].to_hangul()
-            exponent = self.args[1].to_hangul()
-            return f"{base} {hangul_op} {{{exponent}}}"
-        return hangul_op
+            base, exponent = self.args
+            return [base, f" {hangul_op} {{", exponent, "}"]
+        return [hangul_op]
 
     def __repr__(self):
         return f"PowerNode('{self.op}', {', '.join(repr(a) for a in self.args)})"
\ No newline at end of file
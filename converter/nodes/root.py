@@ -14,26 +14,22 @@ class RootNode(ExprNode):
         self.op = HANGUL_TO_LATEX_ROOT.get(op, op)
         self.args = list(args)
 
-    def to_latex(self) -> str:
+    def latex_parts(self) -> list:
         if len(self.args) == 1:
-            radicand = self.args[0].to_latex()
-            return f"{self.op}{{{radicand}}}"
+            return [f"{self.op}{{", self.args[0], "}"]
         elif len(self.args) == 2:
-            index = self.args[0].to_latex()
-            radicand = self.args[1].to_latex()
-            return f"{self.op}[{index}]{{{radicand}}}"
-        return self.op
+            index, radicand = self.args
+            return [f"{self.op}[", index, "]{", radicand, "}"]
+        return [self.op]
 
-    def to_hangul(self) -> str:
+    def hangul_parts(self) -> list:
         hangul_op = LATEX_TO_HANGUL_ROOT.get(self.op, self.op)
         if len(self.args) == 1:
-            radicand = self.args[0].to_hangul()
-            return f"{hangul_op} {{{radicand}}}"
+            return [f"{hangul_op} {{", self.args[0], "}"]
         elif len(self.args) == 2:
-            index = self.args[0].to_hangul()
-            radicand = self.args[1].to_hangul()
-            return f"{hangul_op} {{{index}}} of {{{radicand}}}"
-        return hangul_op
+            index, radicand = self.args
+            return [f"{hangul_op} {{", index, "} of {", radicand, "}"]
+        return [hangul_op]
 
     def __repr__(self):
         return f"RootNode('{self.op}', {', '.join(repr(a) for a in self.args)})"
\ No newline at end of file
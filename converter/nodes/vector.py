@@ -13,12 +13,12 @@ class VectorNode(ExprNode):
         self.op = HANGUL_TO_LATEX_VECTOR.get(op, op)
         self.arg = arg
 
-    def to_latex(self) -> str:
-        return f"{self.op}{{{self.arg.to_latex()}}}"
+    def latex_parts(self) -> list:
+        return [f"{self.op}{{", self.arg, "}"]
 
-    def to_hangul(self) -> str:
+    def hangul_parts(self) -> list:
         hangul_op = LATEX_TO_HANGUL_VECTOR.get(self.op, self.op)
-        return f"{hangul_op} {self.arg.to_hangul()}"
+        return [f"{hangul_op} ", self.arg]
 
     def __repr__(self):
         return f"VectorNode('{self.op}', {repr(self.arg)})"
\ No newline at end of file
@@ -10,15 +10,17 @@
 
 
 핵심 기능:
-- 입력된 수식 문자열을 토큰 단위로 분리 (`tokenize`)
+- 입력된 수식 문자열을 토큰 단위로 분리 (`tokenize` → converter.tokenizer.scan)
 - 토큰 리스트를 기반으로 AST(Abstract Syntax Tree) 구성 (`build_ast`)
 - 자동 괄호(left/right), RootNode(sqrt of 구조) 등 특수한 구문 처리 포함
 - 매핑 테이블 및 노드 클래스 기반으로 다양한 수식 구조 생성
 - 후처리 훅(`apply_postprocess_hooks`)을 통해 AST 정제 처리
+- 단계별 추적 이벤트는 converter.trace 로 전달 (sink 가 없으면 비용 없음)
 
 사용 예시:
 - `parse_hangul("sqrt{3}of{5}")` → LaTeX AST 반환
 - `parse_latex("\\sqrt[3]{5}")` → 한글 AST 반환
+- `convert("sqrt{3}of{5}", "hangul_to_latex")` → 변환 문자열 반환
 
 의존 모듈:
 - converter.nodes.* (각종 수식 노드)
@@ -33,123 +35,97 @@
 import logging
 from converter.base import ExprNode
 from converter.nodes.literal import LiteralNode
-from converter.utils.string_util import to_pascal_case
-from converter.hooks.postprocess_hook import apply_postprocess_hooks, merge_negative_numbers
+from converter.hooks.postprocess_hook import apply_postprocess_hooks
+from converter.tokenizer import scan, BraceBlock
+from converter.token_summary import TokenSummary
+from converter import fast_path, registry, trace
 
-# 로깅 설정
+# 로깅 설정 (핸들러 / 레벨은 애플리케이션에서 구성)
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
-handler = logging.StreamHandler()
-formatter = logging.Formatter('[%(levelname)s parser] %(message)s')
-handler.setFormatter(formatter)
-logger.addHandler(handler)
 
-# 모든 노드 클래스 import (리플렉션 동작 보장)
+# 파서가 직접 만드는 노드 (나머지 노드 클래스는 converter.registry 에서 매핑 종류로 연결)
 from converter.nodes.root import RootNode
-from converter.nodes.log import LogNode
-from converter.nodes.function import FunctionNode
-from converter.nodes.fraction import FractionNode
 from converter.nodes.integral import IntegralNode
-from converter.nodes.bigop import BigOpNode
-from converter.nodes.matrix import MatrixNode
-from converter.nodes.limit import LimitNode
-from converter.nodes.cases import CasesNode
-from converter.nodes.arrow import ArrowNode
-from converter.nodes.vector import VectorNode
-from converter.nodes.derivative import DerivativeNode
 from converter.nodes.bracket import BracketNode
-from converter.nodes.binary_op import BinaryOpNode
-from converter.nodes.power import PowerNode
 
-# 매핑 import
-from converter.mapping.map import *
-from converter.mapping.precedence import OP_PRECEDENCE_HANGUL, OP_PRECEDENCE_LATEX
 
+# =========================
+# 연산자 인덱스 (방향별로 1회 구성, 레지스트리가 바뀌면 다시 구성)
+# =========================
+def build_operator_index(from_lang: str, to_lang: str) -> tuple[dict, dict]:
+    """
+    방향별 연산자 인덱스 구성
+    - split_index    : 토큰 → (우선순위, 맵 이름, 노드 클래스 | None)
+        - 우선순위 분기용. 여러 맵에 있는 토큰은 마지막 맵 기준 (기존 <= 비교 결과와 동일)
+        - 우선순위 테이블에 없는 토큰은 inf
+    - fallback_index : 토큰 → (맵 이름, 노드 클래스)
+        - 첫 토큰 리플렉션용. 클래스가 존재하고 BracketNode 가 아닌 첫 번째 맵 기준
+    """
+    precedence_map = registry.precedence_map(from_lang)
+    split_index = {}
+    fallback_index = {}
+    for kind, cls, table in registry.tables(from_lang, to_lang):
+        map_name = registry.map_name(kind, from_lang, to_lang)
+        for tok in table:
+            split_index[tok] = (precedence_map.get(tok, float("inf")), map_name, cls)
+            if cls and cls is not BracketNode and tok not in fallback_index:
+                fallback_index[tok] = (map_name, cls)
+    return split_index, fallback_index
+
+# (원본 언어, 대상 언어) → (레지스트리 revision, 연산자 인덱스)
+_OPERATOR_INDEX = {
+    key: (registry.revision, build_operator_index(*key)) for key in registry.DIRECTIONS
+}
+
+def operator_index(from_lang: str, to_lang: str) -> dict:
+    """우선순위 분기용 연산자 인덱스 (split_index)"""
+    return _operator_indexes(from_lang, to_lang)[0]
+
+def _operator_indexes(from_lang: str, to_lang: str) -> tuple[dict, dict]:
+    key = (from_lang.upper(), to_lang.upper())
+    cached = _OPERATOR_INDEX.get(key)
+    if cached is None or cached[0] != registry.revision:
+        cached = _OPERATOR_INDEX[key] = (registry.revision, build_operator_index(*key))
+    return cached[1]
 
-def tokenize(expr: str) -> list[str]:
-    def collect_brace_block(expr: str, start_index: int) -> tuple[str, int]:
-        i = start_index
-        brace_depth = 1
-        block = '{'
-        while i < len(expr) and brace_depth > 0:
-            if expr[i] == '{':
-                brace_depth += 1
-            elif expr[i] == '}':
-                brace_depth -= 1
-            block += expr[i]
-            i += 1
-        return block, i
-
-    tokens = []
-    i = 0
-
-    while i < len(expr):
-        ch = expr[i]
-
-        # Hangul 자동 괄호: LEFT ( → left(
-        if expr[i:i + 4].upper() == "LEFT" and i + 4 < len(expr) and expr[i + 4] in '(){}[]':
-            tokens.append("left")
-            tokens.append(expr[i + 4])
-            i += 5
-            continue
-        if expr[i:i + 5].upper() == "RIGHT" and i + 5 < len(expr) and expr[i + 5] in '(){}[]':
-            tokens.append("right")
-            tokens.append(expr[i + 5])
-            i += 6
-            continue
-
-        # LaTeX 자동 괄호: \left( → \left(
-        if expr.startswith(r'\left', i) and i + 6 <= len(expr) and expr[i + 5] in '(){}[]':
-            tokens.append(r'\left')
-            tokens.append(expr[i + 5])
-            i += 6
-            continue
-        if expr.startswith(r'\right', i) and i + 7 <= len(expr) and expr[i + 6] in '(){}[]':
-            tokens.append(r'\right')
-            tokens.append(expr[i + 6])
-            i += 7
-            continue
-
-        # 중괄호 블록
-        if ch == '{':
-            block, i = collect_brace_block(expr, i + 1)
-            tokens.append(block)
-            continue
-
-        if ch == ' ':
-            i += 1
-            continue
-
-        # 알파벳 연속 토큰
-        if ch.isalpha():
-            ident = ''
-            while i < len(expr) and expr[i].isalpha():
-                ident += expr[i]
-                i += 1
-            tokens.append(ident)
-            continue
-
-        # LaTeX 명령어
-        if ch == '\\':
-            command = ch
-            i += 1
-            #while i < len(expr) and (expr[i].isalpha() or expr[i] == '_'):
-            while i < len(expr) and expr[i].isalpha():
-                command += expr[i]
-                i += 1
-            tokens.append(command)
-            continue
-
-        # 단일 문자 토큰 (괄호 등)
-        tokens.append(ch)
-        i += 1
-
-    tokens = merge_negative_numbers(tokens)
 
-    print(f"[DEBUG tokenize] 입력: {expr}")
-    print(f"[DEBUG tokenize] 결과 토큰: {tokens}")
+def tokenize(expr: str) -> list[str]:
+    """
+    수식 문자열을 토큰 리스트로 분리 (공개 함수, 모든 토큰이 str)
+    - 실제 분리는 converter.tokenizer.scan (단일 패스 스캐너) 이 담당
+    - 음수 병합과 자동 괄호(LEFT/RIGHT, \\left/\\right) 인식은 스캔 중에 함께 처리됨
+    - 중괄호 블록은 '{...}' 원문 문자열로 반환 (파서 내부는 원문 구간을 가리키는 BraceBlock 토큰을 쓰는 _tokenize 사용)
+    """
+    return [str(tok) if tok.__class__ is BraceBlock else tok for tok in _tokenize(expr)]
+
+def _tokenize(expr: str) -> list:
+    """파서 내부용 토큰화 : scan 결과 그대로 (중괄호 블록은 BraceBlock, 내부 토큰 포함)"""
+    if trace.active:
+        with trace.span("tokenize", length=len(expr)) as data:
+            tokens = scan(expr)
+            data["tokens"] = len(tokens)
+        return tokens
+    return scan(expr)
+
+def block_tokens(block: str) -> list[str]:
+    """
+    중괄호 블록 토큰('{...}')의 내부 토큰 리스트
+    - scan 이 만들어 둔 BraceBlock.tokens 를 그대로 사용 (재귀 단계마다 다시 토큰화하지 않음)
+    - 일반 문자열이면 기존처럼 block[1:-1] 을 토큰화
+    """
+    if isinstance(block, BraceBlock):
+        return block.tokens
+    return _tokenize(block[1:-1])
 
-    return tokens
+def stripped_block_tokens(block: str) -> list[str]:
+    """
+    block.strip("{} ") 의 토큰 리스트 (적분 상/하한 처리용)
+    - strip 결과가 블록 내부와 같으면 BraceBlock.tokens 재사용, 아니면 strip 결과를 토큰화
+    """
+    stripped = block.strip("{} ")
+    if isinstance(block, BraceBlock) and stripped == block[1:-1].strip(" "):
+        return block.tokens
+    return _tokenize(stripped)
 
 def merge_brackets(tokens: list[str]) -> list[str]:
     """
@@ -174,32 +150,29 @@ def find_lowest_precedence_op(tokens: list[str], from_lang: str, to_lang: str) -
     수식 토큰에서 가장 낮은 우선순위 연산자의 인덱스와 해당 맵 이름을 반환
     - BinaryOpNode, FractionNode, PowerNode 등 모든 이항 연산 처리에 사용됨
     - 우선순위는 OP_PRECEDENCE_*** 에 정의된 값을 기준으로 비교
+    - 연산자 인덱스 조회로 토큰당 O(1), 전체 한 번 순회
     """
-    from converter.mapping.precedence import OP_PRECEDENCE_HANGUL, OP_PRECEDENCE_LATEX
-
-    precedence_map = (
-        OP_PRECEDENCE_HANGUL if from_lang.upper() == "HANGUL"
-        else OP_PRECEDENCE_LATEX
-    )
-
-    prefix = f"{from_lang.upper()}_TO_{to_lang.upper()}_"
-    map_candidates = [name for name in globals() if name.startswith(prefix)]
+    op_index, entry = _lowest_precedence_entry(tokens, 0, len(tokens), operator_index(from_lang, to_lang))
+    return op_index, entry[1] if entry else ""
 
+def _lowest_precedence_entry(tokens: list, lo: int, hi: int, index: dict) -> tuple[int, tuple]:
+    """
+    find_lowest_precedence_op 의 내부 구현 : tokens[lo:hi] 구간의 (인덱스, 인덱스 항목) 반환
+    - 같은 우선순위면 뒤쪽 토큰 선택 (<= 비교, 기존 동작 유지)
+    """
+    get = index.get
     min_prec = float("inf")
     min_index = -1
-    min_map_name = ""
+    min_entry = None
 
-    for i, tok in enumerate(tokens):
-        for map_name in map_candidates:
-            map_dict = globals()[map_name]
-            if tok in map_dict:
-                prec = precedence_map.get(tok, float("inf"))
-                if prec <= min_prec:
-                    min_prec = prec
-                    min_index = i
-                    min_map_name = map_name
+    for i in range(lo, hi):
+        entry = get(tokens[i])
+        if entry is not None and entry[0] <= min_prec:
+            min_prec = entry[0]
+            min_index = i
+            min_entry = entry
 
-    return min_index, min_map_name
+    return min_index, min_entry
 
 def should_skip_reflection(tokens: list[str]) -> bool:
     """
@@ -207,145 +180,341 @@ def should_skip_reflection(tokens: list[str]) -> bool:
     1. 자동 괄호 구조 포함 (BracketNode)
     2. RootNode 특수 분기 - 인자가 두 개인 경우만 (e.g., \sqrt[3]{x}, sqrt {3} of {x})
     """
+    return _should_skip_range(tokens, 0, len(tokens), TokenSummary(tokens))
+
+def _should_skip_range(tokens: list, lo: int, hi: int, summary: TokenSummary) -> bool:
+    """should_skip_reflection 의 구간 버전 : tokens[lo:hi] 기준, 각 판정은 요약 질의로 O(log n)"""
     # 1. BracketNode 관련 토큰이 포함되어 있는 경우
-    if any(tok in HANGUL_TO_LATEX_BRACKET for tok in tokens) or any(tok in LATEX_TO_HANGUL_BRACKET for tok in tokens):
+    if summary.has_bracket(lo, hi):
         return True
 
+    first = tokens[lo]
+
     # 2. RootNode LaTeX (\sqrt[3]{x})
-    if tokens[0] == r"\sqrt" and len(tokens) == 3 and tokens[1].startswith("[") and tokens[2].startswith("{"):
+    if first == r"\sqrt" and hi - lo == 3 and tokens[lo + 1].startswith("[") and tokens[lo + 2].startswith("{"):
         return True
 
     # 3. RootNode Hangul (sqrt {3} of {x})
-    if tokens[0] == "sqrt" and "of" in tokens and len(tokens) > 2:
+    if first == "sqrt" and summary.has_token("of", lo, hi) and hi - lo > 2:
         return True
 
     # === IntegralNode 구조  ===
-    if tokens[0] in ["int", "\\int"] and "_" in tokens and "^" in tokens and any(
-            t.endswith("dx") or t == "dx" for t in tokens):
+    if first in ["int", "\\int"] and summary.has_token("_", lo, hi) and summary.has_token("^", lo, hi) \
+            and summary.any_dx_suffix(lo, hi):
         return True
 
     return False
 
 
-def extract_bracket_node_once(tokens: list[str], from_lang: str, to_lang: str):
+def _is_bracket_tag(tok, tag: str) -> bool:
+    """left/\\left 또는 right/\\right 로 시작하는 자동 괄호 태그인지 (대소문자 무시)"""
+    if not isinstance(tok, str):
+        return False
+    low = tok.lower()
+    return low.startswith(tag) or low.startswith("\\" + tag)
+
+def _run(steps):
     """
-    수식 내 하나의 괄호 쌍만 찾아서 BracketNode로 감싸고, 감싼 토큰 리스트를 반환
-    - BracketNode 감싼 부분을 치환한 새 토큰 리스트 반환
-    - 감싸지 못하면 None 반환
+    파서 단계 제너레이터 실행기 (재귀 대신 작업 스택)
+    - 단계 제너레이터는 하위 구조가 필요하면 하위 단계 제너레이터를 yield 하고, 결과를 send 로 돌려받음
+    - 하위 단계에서 난 예외는 yield 한 상위 단계로 throw → 기존 재귀 호출과 같은 지점에서 잡히거나 전파됨
+    - 중첩 깊이는 파이썬 호출 스택이 아닌 리스트 길이로만 늘어남 (재귀 한도 없음)
     """
-    for i in range(len(tokens)):
-        if isinstance(tokens[i], str) and (
-                tokens[i].lower().startswith("left") or tokens[i].lower().startswith(r"\left")):
-            for j in range(i + 2, len(tokens)):
-                if isinstance(tokens[j], str) and (
-                        tokens[j].lower().startswith("right") or tokens[j].lower().startswith(r"\right")):
-                    lparen = tokens[i][4:] if tokens[i].lower().startswith("left") else tokens[i][5:]
-                    rparen = tokens[j][5:] if tokens[j].lower().startswith("right") else tokens[j][6:]
-
-                    left_tag = r"\left" if tokens[i].lower().startswith("left") else tokens[i]
-                    right_tag = r"\right" if tokens[j].lower().startswith("right") else tokens[j]
-
-                    # 내부 노드 처리 개선
-                    inner_tokens = tokens[i + 1:j]
-                    if len(inner_tokens) == 1 and isinstance(inner_tokens[0], str):
-                        # 단일 LiteralNode인 경우 괄호를 제외한 내용만 추출
-                        inner_value = inner_tokens[0].strip()
-                        if inner_value.startswith(lparen) and inner_value.endswith(rparen):
-                            inner_value = inner_value[1:-1].strip()
-                        inner_ast = LiteralNode(inner_value)
-                    else:
-                        inner_ast = build_ast(inner_tokens, from_lang, to_lang)
-
-                    bracket_ast = BracketNode(left_tag, lparen, inner_ast, rparen, right_tag)
-
-                    # 치환된 새 토큰 리스트 반환
-                    return tokens[:i] + [bracket_ast] + tokens[j + 1:]
-    return None
-
-
-def build_ast(tokens: list[str], from_lang: str, to_lang: str) -> ExprNode:
-    print(f"[DEBUG build_ast] 받은 토큰: {tokens}")
-    if not tokens:
+    stack = [steps]
+    value = None
+    error = None
+    while True:
+        try:
+            if error is None:
+                child = stack[-1].send(value)
+            else:
+                child = stack[-1].throw(error)
+        except StopIteration as stop:
+            stack.pop()
+            if not stack:
+                return stop.value
+            value, error = stop.value, None
+            continue
+        except Exception as exc:
+            stack.pop()
+            if not stack:
+                raise
+            value, error = None, exc
+            continue
+        stack.append(child)
+        value, error = None, None
+
+def _bracket_node_steps(open_tag: str, close_tag: str, tokens: list, lo: int, hi: int, from_lang: str, to_lang: str,
+                        engine: str = "split"):
+    """여는/닫는 태그와 내부 토큰 구간 tokens[lo:hi] 로 BracketNode 생성"""
+    lparen = open_tag[4:] if open_tag.lower().startswith("left") else open_tag[5:]
+    rparen = close_tag[5:] if close_tag.lower().startswith("right") else close_tag[6:]
+
+    left_tag = r"\left" if open_tag.lower().startswith("left") else open_tag
+    right_tag = r"\right" if close_tag.lower().startswith("right") else close_tag
+
+    # 내부 노드 처리 개선
+    if hi - lo == 1 and isinstance(tokens[lo], (str, BraceBlock)):
+        # 단일 LiteralNode인 경우 괄호를 제외한 내용만 추출
+        inner_value = tokens[lo].strip()
+        if inner_value.startswith(lparen) and inner_value.endswith(rparen):
+            inner_value = inner_value[1:-1].strip()
+        inner_ast = LiteralNode(inner_value)
+    else:
+        # 안쪽 괄호는 이미 접혔으므로 괄호 추출 생략, 요약은 내부 구간만 대상으로 구성
+        summary = TokenSummary(tokens, lo, hi, _operator_indexes(from_lang, to_lang)[0])
+        inner_ast = yield _range_steps(tokens, lo, hi, from_lang, to_lang, engine, summary)
+
+    return BracketNode(left_tag, lparen, inner_ast, rparen, right_tag)
+
+def extract_bracket_nodes(tokens: list[str], from_lang: str, to_lang: str, engine: str = "split") -> list:
+    """
+    수식 내 자동 괄호 쌍(left ... right)을 모두 BracketNode 로 감싼 새 토큰 리스트 반환
+    - 여는 태그 위치를 스택에 쌓으며 한 번만 순회 → 닫는 태그는 가장 가까운 여는 태그와 짝지음
+    - 안쪽 괄호부터 BracketNode 로 접히므로(bottom-up) 중첩 괄호도 올바르게 짝지어짐
+    - 여는 태그 바로 다음의 닫는 태그는 짝으로 보지 않음 (빈 괄호 방지, 기존 동작 유지)
+    - 짝이 없는 태그는 일반 토큰으로 남김
+    - 여는 태그가 없으면 입력 리스트를 그대로 반환 (복사 없음)
+    """
+    return _run(_extract_steps(tokens, from_lang, to_lang, engine))
+
+def _extract_steps(tokens: list, from_lang: str, to_lang: str, engine: str):
+    """extract_bracket_nodes 의 단계 제너레이터 (괄호 내부 AST 는 하위 단계로 요청)"""
+    start = next((i for i, tok in enumerate(tokens) if _is_bracket_tag(tok, "left")), None)
+    if start is None:
+        return tokens
+
+    out = tokens[:start]
+    opens = []
+    for k in range(start, len(tokens)):
+        tok = tokens[k]
+        if _is_bracket_tag(tok, "right"):
+            if opens and opens[-1] < len(out) - 1:
+                i = opens.pop()
+                node = yield from _bracket_node_steps(out[i], tok, out, i + 1, len(out), from_lang, to_lang, engine)
+                del out[i:]
+                out.append(node)
+                continue
+        elif _is_bracket_tag(tok, "left"):
+            opens.append(len(out))
+        out.append(tok)
+    return out
+
+
+def build_ast(tokens: list[str], from_lang: str, to_lang: str, engine: str = "split") -> ExprNode:
+    """
+    토큰 리스트 → AST
+    - engine="split" : 가장 낮은 우선순위 연산자에서 구간을 둘로 나눠 하위 구간 처리 (기존 방식)
+    - engine="pratt" : 이항 연산자 사슬을 한 번의 좌→우 패스로 조립 (_chain_steps)
+    두 엔진은 항상 같은 AST 를 반환해야 함
+    - 하위 구조는 파이썬 재귀 대신 _run 의 작업 스택으로 처리 (깊게 중첩된 수식도 재귀 한도 없음)
+    """
+    return _run(_range_steps(tokens, 0, len(tokens), from_lang, to_lang, engine))
+
+def _build_range(tokens: list, lo: int, hi: int, from_lang: str, to_lang: str, engine: str = "split",
+                 summary: TokenSummary = None) -> ExprNode:
+    """tokens[lo:hi] 구간 하나를 AST 로 변환 (_range_steps 실행)"""
+    return _run(_range_steps(tokens, lo, hi, from_lang, to_lang, engine, summary))
+
+def _array_steps(tokens: list, from_lang: str, to_lang: str, engine: str):
+    """새 토큰 배열 전체의 단계 (기존 build_ast 재귀 호출 자리)"""
+    return _range_steps(tokens, 0, len(tokens), from_lang, to_lang, engine)
+
+def _arg_steps(tokens: list, i: int, from_lang: str, to_lang: str, engine: str, summary: TokenSummary):
+    """함수형 인자 하나의 단계 : 중괄호 블록이면 내부 토큰, 아니면 토큰 하나짜리 구간"""
+    tok = tokens[i]
+    if tok.startswith("{"):
+        return _array_steps(block_tokens(tok), from_lang, to_lang, engine)
+    return _range_steps(tokens, i, i + 1, from_lang, to_lang, engine, summary)
+
+def _range_steps(tokens: list, lo: int, hi: int, from_lang: str, to_lang: str, engine: str = "split",
+                 summary: TokenSummary = None):
+    """
+    build_ast 의 내부 구현 (단계 제너레이터) : 공유 토큰 배열의 tokens[lo:hi] 구간을 AST 로 변환
+    - 하위 구조는 `yield 하위 단계` 로 요청하고 결과 AST 를 돌려받음 (_run 이 작업 스택으로 실행)
+    - 하위 구조는 (lo, hi) 범위만 넘기고 부분 리스트를 만들지 않음
+    - summary : 자동 괄호 추출을 마친 배열의 구조 판정 요약 (TokenSummary)
+        - None 이면 새 배열 → 괄호 추출 후 요약 생성
+        - 하위 구간은 같은 요약을 공유 (새로 짝지어질 괄호가 없고, 구조 판정은 구간 질의로 처리)
+    - 새 토큰 배열은 중괄호 블록 내부, 적분 상/하한 등 원래 따로 토큰화되는 경우에만 생김
+    """
+    if lo >= hi:
         return LiteralNode("")
 
-    # === 재귀적으로 BracketNode 처리 ===
-    while True:
-        new_tokens = extract_bracket_node_once(tokens, from_lang, to_lang)
-        if new_tokens is None:
-            break
-        tokens = new_tokens
+    # === 자동 괄호 → BracketNode (스택 한 번 순회) ===
+    split_index, fallback_index = _operator_indexes(from_lang, to_lang)
+    if summary is None:
+        array = tokens if lo == 0 and hi == len(tokens) else tokens[lo:hi]
+        if trace.active:
+            with trace.span("brackets", tokens=len(array)):
+                tokens = yield from _extract_steps(array, from_lang, to_lang, engine)
+        else:
+            tokens = yield from _extract_steps(array, from_lang, to_lang, engine)
+        lo, hi = 0, len(tokens)
+        summary = TokenSummary(tokens, lo, hi, split_index)
+
+    first = tokens[lo]
 
     # === 특수 구조 우선 분기 ===
-    if tokens[0] == r"\sqrt" and len(tokens) == 3 and tokens[1].startswith("[") and tokens[2].startswith("{"):
-        index_ast = build_ast(tokenize(tokens[1][1:-1]), from_lang, to_lang)
-        value_ast = build_ast(tokenize(tokens[2][1:-1]), from_lang, to_lang)
+    if first == r"\sqrt" and hi - lo == 3 and tokens[lo + 1].startswith("[") and tokens[lo + 2].startswith("{"):
+        index_ast = yield _array_steps(_tokenize(tokens[lo + 1][1:-1]), from_lang, to_lang, engine)
+        value_ast = yield _array_steps(block_tokens(tokens[lo + 2]), from_lang, to_lang, engine)
         return RootNode(r"\sqrt", index_ast, value_ast)
 
-    if tokens[0] == "sqrt" and "of" in tokens:
-        idx = tokens.index("of")
-        left_ast = build_ast(tokens[1:idx], from_lang, to_lang)
-        right_ast = build_ast(tokens[idx+1:], from_lang, to_lang)
+    if first == "sqrt" and summary.has_token("of", lo, hi):
+        idx = summary.first_token("of", lo, hi)
+        left_ast = yield _range_steps(tokens, lo + 1, idx, from_lang, to_lang, engine, summary)
+        right_ast = yield _range_steps(tokens, idx + 1, hi, from_lang, to_lang, engine, summary)
         return RootNode(r"\sqrt", left_ast, right_ast)
 
-    if (tokens[0].startswith("int") or tokens[0].startswith("\\int")) \
-            and any("_" in t for t in tokens) and any("^" in t for t in tokens) and any("dx" in t for t in tokens):
+    if (first.startswith("int") or first.startswith("\\int")) and summary.any_substring("_", lo, hi) \
+            and summary.any_substring("^", lo, hi) and summary.any_substring("dx", lo, hi):
         try:
-            underscore_index = next(i for i, t in enumerate(tokens) if "_" in t)
-            caret_index = next(i for i, t in enumerate(tokens) if "^" in t)
-            lower = tokens[underscore_index + 1].strip("{} ")
-            upper = tokens[caret_index + 1].strip("{} ")
-            body_tokens = tokens[caret_index + 2:-1]
-            dx_token = tokens[-1].replace("`", "").replace("\\,", "").strip()
-            body_tokens = [t for t in body_tokens if t not in [r"\,", r"\;", r"\!", r"\\,", "\\", ","]]
-
-            return IntegralNode(
-                tokens[0],
-                build_ast(tokenize(lower), from_lang, to_lang),
-                build_ast(tokenize(upper), from_lang, to_lang),
-                build_ast(body_tokens, from_lang, to_lang),
-                build_ast([dx_token], from_lang, to_lang)
-            )
+            underscore_index = summary.first_substring("_", lo, hi)
+            caret_index = summary.first_substring("^", lo, hi)
+            if underscore_index + 1 >= hi or caret_index + 1 >= hi:
+                raise IndexError("list index out of range")
+            lower = stripped_block_tokens(tokens[underscore_index + 1])
+            upper = stripped_block_tokens(tokens[caret_index + 1])
+            dx_token = tokens[hi - 1].replace("`", "").replace("\\,", "").strip()
+            skip = [r"\,", r"\;", r"\!", r"\\,", "\\", ","]
+
+            body_lo, body_hi = caret_index + 2, max(caret_index + 2, hi - 1)
+
+            lower_ast = yield _array_steps(lower, from_lang, to_lang, engine)
+            upper_ast = yield _array_steps(upper, from_lang, to_lang, engine)
+            if any(tokens[i] in skip for i in range(body_lo, body_hi)):
+                body = [tokens[i] for i in range(body_lo, body_hi) if tokens[i] not in skip]
+                body_ast = yield _array_steps(body, from_lang, to_lang, engine)
+            else:
+                body_ast = yield _range_steps(tokens, body_lo, body_hi, from_lang, to_lang, engine, summary)
+            dx_ast = yield _array_steps([dx_token], from_lang, to_lang, engine)
+
+            return IntegralNode(first, lower_ast, upper_ast, body_ast, dx_ast)
         except Exception as e:
-            logger.warning(f"[IntegralNode Parsing] Failed: {tokens} - {e}")
+            logger.debug("[IntegralNode Parsing] Failed: %s - %s", tokens[lo:hi], e)
+            if trace.active:
+                trace.emit("integral_error", error=type(e).__name__)
 
-    if len(tokens) == 1:
-        return LiteralNode(tokens[0])
+    if hi - lo == 1:
+        return LiteralNode(str(first) if isinstance(first, BraceBlock) else first)
 
-    if not should_skip_reflection(tokens):
-        op_index, map_name = find_lowest_precedence_op(tokens, from_lang, to_lang)
+    if not _should_skip_range(tokens, lo, hi, summary):
+        op_index, entry = summary.lowest(lo, hi)
 
-        if op_index != -1 and map_name:
+        if op_index != -1:
             op = tokens[op_index]
-            map_type = map_name.replace(f"{from_lang.upper()}_TO_{to_lang.upper()}_", "")
-            class_name = to_pascal_case(map_type) + "Node"
-            cls = globals().get(class_name)
+            cls = entry[2]
 
             if cls:
                 # 함수형 연산자
-                if op_index == 0:
-                    args = [build_ast(tokenize(t[1:-1]) if t.startswith("{") else [t], from_lang, to_lang)
-                            for t in tokens[1:]]
+                if op_index == lo:
+                    args = []
+                    for i in range(lo + 1, hi):
+                        args.append((yield _arg_steps(tokens, i, from_lang, to_lang, engine, summary)))
                     return cls(op, *args)
                 # 이항 연산자
-                left = build_ast(tokens[:op_index], from_lang, to_lang)
-                right = build_ast(tokens[op_index + 1:], from_lang, to_lang)
+                if engine == "pratt":
+                    return (yield from _chain_steps(tokens, lo, hi, from_lang, to_lang, split_index, summary))
+                if trace.active:
+                    trace.emit("split", op=op, map=entry[1], start=lo, end=hi)
+                left = yield _range_steps(tokens, lo, op_index, from_lang, to_lang, engine, summary)
+                right = yield _range_steps(tokens, op_index + 1, hi, from_lang, to_lang, engine, summary)
                 return cls(op, left, right)
 
     # fallback: 첫 토큰 기준 리플렉션
-    first = tokens[0]
-    prefix = f"{from_lang.upper()}_TO_{to_lang.upper()}_"
-    for map_name in [name for name in globals() if name.startswith(prefix)]:
-        map_dict = globals()[map_name]
-        if first in map_dict:
-            class_name = to_pascal_case(map_name.replace(prefix, "")) + "Node"
-            cls = globals().get(class_name)
-            if cls and class_name != "BracketNode":
-                args = [build_ast(tokenize(t[1:-1]) if t.startswith("{") else [t], from_lang, to_lang)
-                        for t in tokens[1:]]
-                return cls(first, *args)
+    entry = fallback_index.get(first) if first.__class__ is not BraceBlock else None
+    if entry is not None:
+        cls = entry[1]
+        args = []
+        for i in range(lo + 1, hi):
+            args.append((yield _arg_steps(tokens, i, from_lang, to_lang, engine, summary)))
+        return cls(first, *args)
 
     # 마지막 fallback
-    return LiteralNode(" ".join(str(t) if isinstance(t, str) else repr(t) for t in tokens))
+    if trace.active:
+        trace.emit("fallback", tokens=hi - lo)
+    return LiteralNode(" ".join(str(t) if isinstance(t, (str, BraceBlock)) else repr(t) for t in tokens[lo:hi]))
+
+
+# =========================
+# Pratt 엔진 (engine="pratt")
+# =========================
+ENGINES = ("split", "pratt")
+
+def _operator_tree(tokens: list, lo: int, hi: int, split_index: dict) -> tuple[int, dict, dict]:
+    """
+    tokens[lo:hi] 의 연산자 위치로 카르테시안 트리를 구성 (좌→우 한 번 순회, 연산자 스택 사용)
+    - 각 구간의 루트 = 구간 내 가장 낮은 우선순위 연산자, 같으면 뒤쪽 (분할 엔진의 분기점과 동일)
+    - 반환 : (루트 위치, 왼쪽 자식, 오른쪽 자식) / 자식이 없으면 -1
+    """
+    get = split_index.get
+    stack = []
+    left = {}
+    right = {}
+    for i in range(lo, hi):
+        if tokens[i].__class__ is BraceBlock:   # 중괄호 블록은 연산자가 아님
+            continue
+        entry = get(tokens[i])
+        if entry is None:
+            continue
+        prec = entry[0]
+        last = -1
+        while stack and stack[-1][0] >= prec:
+            last = stack.pop()[1]
+        left[i] = last
+        right[i] = -1
+        if stack:
+            right[stack[-1][1]] = i
+        stack.append((prec, i))
+    return (stack[0][1] if stack else -1), left, right
+
+def _is_plain_split(tokens: list, lo: int, hi: int, op_index: int, split_index: dict) -> bool:
+    """
+    _range_steps(tokens, lo, hi) 가 op_index 에서 바로 이항 분기하는지 판정 (O(1))
+    - 상위 구간에서 괄호 추출 / should_skip_reflection 을 이미 통과했으므로
+      하위 구간은 첫 토큰(sqrt, int 등 특수 구조)과 분기점 위치만 보면 됨
+    - 애매한 경우는 False → 해당 구간은 _range_steps 로 그대로 처리
+    """
+    if op_index == -1 or op_index == lo or hi - lo < 2:
+        return False
+    first = tokens[lo]
+    if not isinstance(first, (str, BraceBlock)) or first in ("sqrt", r"\sqrt") or first.startswith(("int", "\\int")):
+        return False
+    return split_index[tokens[op_index]][2] is not None
+
+def _chain_steps(tokens: list, lo: int, hi: int, from_lang: str, to_lang: str,
+                 split_index: dict, summary: TokenSummary):
+    """
+    tokens[lo:hi] 의 이항 연산자 사슬을 조립 (단계 제너레이터)
+    - 카르테시안 트리를 작업 스택으로 후위 순회하며 노드 생성 (깊은 사슬에서도 재귀 없음)
+    - 연산자가 없는 구간이나 특수 구조 구간만 하위 단계(_range_steps)로 요청
+    - 긴 사슬(a times b times ... ) 기준 O(n^2) → O(n)
+    """
+    root, left, right = _operator_tree(tokens, lo, hi, split_index)
+    results = []
+    stack = [(lo, hi, root, False)]
+    while stack:
+        start, end, op_index, ready = stack.pop()
+        if ready:
+            right_ast = results.pop()
+            left_ast = results.pop()
+            op = tokens[op_index]
+            if trace.active:
+                trace.emit("split", op=op, map=split_index[op][1], start=start, end=end)
+            results.append(split_index[op][2](op, left_ast, right_ast))
+            continue
+        if start != lo or end != hi:
+            if start == end:
+                results.append(LiteralNode(""))
+                continue
+            if not _is_plain_split(tokens, start, end, op_index, split_index):
+                results.append((yield _range_steps(tokens, start, end, from_lang, to_lang, "pratt", summary)))
+                continue
+        stack.append((start, end, op_index, True))
+        stack.append((op_index + 1, end, right[op_index], False))
+        stack.append((start, op_index, left[op_index], False))
+    return results[0]
 
 
 # def build_ast(tokens: list[str], from_lang: str, to_lang: str) -> ExprNode:
@@ -494,14 +663,80 @@ def build_ast(tokens: list[str], from_lang: str, to_lang: str) -> ExprNode:
 #         return LiteralNode(" ".join(safe_tokens))
 
 
-def parse_hangul(text: str) -> ExprNode:
-    tokens = tokenize(text)
-    ast = build_ast(tokens, from_lang="HANGUL", to_lang="LATEX")
+def _check_engine(engine: str):
+    if engine not in ENGINES:
+        raise ValueError(f"지원하지 않는 파서 엔진: {engine!r} (사용 가능: {', '.join(ENGINES)})")
+
+
+def _traced_build(tokens: list, from_lang: str, to_lang: str, engine: str) -> ExprNode:
+    """trace 활성 시 build_ast : parse 구간 + (node_events 일 때) 생성된 노드마다 node 이벤트"""
+    with trace.span("parse", tokens=len(tokens)):
+        ast = build_ast(tokens, from_lang, to_lang, engine)
+    if not trace.node_events:
+        return ast
+    pending = [ast]
+    while pending:
+        node = pending.pop()
+        trace.emit("node", type=type(node).__name__)
+        values = list(vars(node).values())
+        while values:
+            value = values.pop()
+            if isinstance(value, ExprNode):
+                pending.append(value)
+            elif isinstance(value, list):
+                values.extend(value)
+    return ast
+
+
+def parse_hangul(text: str, engine: str = "split") -> ExprNode:
+    _check_engine(engine)
+    tokens = _tokenize(text)
+    if trace.active:
+        ast = _traced_build(tokens, "HANGUL", "LATEX", engine)
+    else:
+        ast = build_ast(tokens, from_lang="HANGUL", to_lang="LATEX", engine=engine)
     return apply_postprocess_hooks(ast)
 
 
-def parse_latex(expr: str) -> ExprNode:
-    tokens = tokenize(expr)
+def parse_latex(expr: str, engine: str = "split") -> ExprNode:
+    _check_engine(engine)
+    tokens = _tokenize(expr)
     tokens = merge_brackets(tokens)  # 전처리
-    ast = build_ast(tokens, from_lang="LATEX", to_lang="HANGUL")
-    return apply_postprocess_hooks(ast)
\ No newline at end of file
+    if trace.active:
+        ast = _traced_build(tokens, "LATEX", "HANGUL", engine)
+    else:
+        ast = build_ast(tokens, from_lang="LATEX", to_lang="HANGUL", engine=engine)
+    return apply_postprocess_hooks(ast)
+
+
+# 변환 방향 → (파서, 렌더 메서드 이름)
+DIRECTIONS = {
+    "hangul_to_latex": (parse_hangul, "to_latex"),
+    "latex_to_hangul": (parse_latex, "to_hangul"),
+}
+
+
+def convert(text: str, direction: str = "hangul_to_latex", engine: str = "split") -> str:
+    """
+    수식 하나를 파싱 후 대상 언어 문자열로 렌더링
+    - direction : "hangul_to_latex" (parse_hangul → to_latex) / "latex_to_hangul" (parse_latex → to_hangul)
+    - 구조가 없는 수식(숫자 / 식별자 / 이항 연산자 나열)은 AST 없이 fast_path 로 변환 (결과 동일)
+    """
+    if direction not in DIRECTIONS:
+        raise ValueError(f"지원하지 않는 변환 방향: {direction!r} (사용 가능: {', '.join(DIRECTIONS)})")
+    _check_engine(engine)   # 빠른 경로로 끝나는 입력도 엔진 이름 검사
+    parse, render = DIRECTIONS[direction]
+    if not trace.active:
+        out = fast_path.transpile(text, direction)
+        if out is not None:
+            return out
+        return getattr(parse(text, engine), render)()
+
+    with trace.span("convert", direction=direction, length=len(text), text=text):
+        out = fast_path.transpile(text, direction)
+        trace.emit("fast_path", hit=out is not None)
+        if out is not None:
+            return out
+        ast = parse(text, engine)
+        with trace.span("render", target=render):
+            return getattr(ast, render)()
\ No newline at end of file
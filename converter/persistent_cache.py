@@ -0,0 +1,120 @@
+# converter/persistent_cache.py
+
+"""
+실행 / 프로세스 간에 공유되는 디스크 변환 캐시 (SQLite, WAL 모드)
+
+- 키 : (변환기 지문, 변환 방향, 입력 해시(sha256))
+    - fingerprint : 패키지 버전 + 매핑 테이블(map.py, register_node 로 추가된 것 포함) + 연산자 우선순위의 해시
+      → 매핑 / 우선순위가 바뀌면 지문이 달라져 예전 항목은 자동으로 무시됨 (prune() 으로 삭제)
+- 값 : 렌더링 결과 문자열 (변환 중 예외는 저장하지 않음)
+- WAL 모드 + busy_timeout : 여러 워커 프로세스가 같은 파일을 동시에 읽고 씀
+    - 연결은 프로세스마다 따로 (fork 된 워커는 첫 사용 시 새로 연결)
+
+사용 예시:
+    cache = PersistentCache("~/.cache/math_converter")
+    cache.convert("x ^ 2")                       # 없으면 변환 후 저장
+    convert_many(items, cache_dir="~/.cache/math_converter")   # 풀 워커가 같은 캐시 공유
+"""
+
+import hashlib
+import os
+import sqlite3
+from typing import Iterable, Optional
+
+from converter import __version__, registry
+from converter.parser import DIRECTIONS, convert
+
+DEFAULT_FILENAME = "conversions.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS conversions (
+    fingerprint TEXT NOT NULL,
+    direction TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    output TEXT NOT NULL,
+    PRIMARY KEY (fingerprint, direction, digest)
+) WITHOUT ROWID
+"""
+
+_FINGERPRINT = None   # (registry.revision, 지문)
+
+
+def fingerprint() -> str:
+    """현재 변환기 지문 (패키지 버전 + 매핑 테이블 + 우선순위), 레지스트리가 바뀔 때만 다시 계산"""
+    global _FINGERPRINT
+    if _FINGERPRINT is not None and _FINGERPRINT[0] == registry.revision:
+        return _FINGERPRINT[1]
+    h = hashlib.sha256(__version__.encode())
+    for from_lang, to_lang in registry.DIRECTIONS:
+        for kind, cls, table in registry.tables(from_lang, to_lang):
+            h.update(repr((from_lang, kind, cls and cls.__qualname__, sorted(table.items()))).encode())
+        h.update(repr(sorted(registry.precedence_map(from_lang).items())).encode())
+    _FINGERPRINT = (registry.revision, h.hexdigest()[:16])
+    return _FINGERPRINT[1]
+
+
+def digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class PersistentCache:
+    """directory/conversions.sqlite3 에 (지문, 방향, 입력 해시) → 변환 결과 저장"""
+
+    def __init__(self, directory: str, filename: str = DEFAULT_FILENAME, timeout: float = 30.0):
+        self.directory = os.path.expanduser(directory)
+        self.path = os.path.join(self.directory, filename)
+        self.timeout = timeout
+        self._conn = None
+        self._pid = None
+
+    def _connection(self) -> sqlite3.Connection:
+        # fork 로 물려받은 연결은 쓰지 않음 : 프로세스마다 새로 연결
+        if self._conn is None or self._pid != os.getpid():
+            os.makedirs(self.directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(_SCHEMA)
+            self._conn, self._pid = conn, os.getpid()
+        return self._conn
+
+    def get(self, text: str, direction: str) -> Optional[str]:
+        row = self._connection().execute(
+            "SELECT output FROM conversions WHERE fingerprint = ? AND direction = ? AND digest = ?",
+            (fingerprint(), direction, digest(text))).fetchone()
+        return row[0] if row else None
+
+    def put_many(self, entries: Iterable[tuple[str, str, str]]):
+        """(입력, 방향, 결과) 여러 개를 한 트랜잭션으로 저장"""
+        fp = fingerprint()
+        rows = [(fp, direction, digest(text), output) for text, direction, output in entries]
+        if not rows:
+            return
+        conn = self._connection()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany("INSERT OR REPLACE INTO conversions VALUES (?, ?, ?, ?)", rows)
+
+    def put(self, text: str, direction: str, output: str):
+        self.put_many([(text, direction, output)])
+
+    def convert(self, text: str, direction: str = "hangul_to_latex", engine: str = "split") -> str:
+        """캐시를 거친 convert : 저장된 결과가 없으면 변환 후 저장"""
+        if direction not in DIRECTIONS:
+            raise ValueError(f"지원하지 않는 변환 방향: {direction!r} (사용 가능: {', '.join(DIRECTIONS)})")
+        output = self.get(text, direction)
+        if output is None:
+            output = convert(text, direction, engine)
+            self.put(text, direction, output)
+        return output
+
+    def prune(self) -> int:
+        """현재 지문이 아닌 (예전 변환기 버전의) 항목 삭제, 삭제한 행 수 반환"""
+        conn = self._connection()
+        with conn:
+            return conn.execute("DELETE FROM conversions WHERE fingerprint != ?", (fingerprint(),)).rowcount
+
+    def close(self):
+        if self._conn is not None and self._pid == os.getpid():
+            self._conn.close()
+        self._conn = None
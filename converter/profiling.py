@@ -0,0 +1,164 @@
+# converter/profiling.py
+
+"""
+변환 프로파일러 : 논리 단계별 collapsed stack (flamegraph 입력) + 가장 느린 수식 top-N
+
+- sys.setprofile 기반 결정적 프로파일링 (with 블록 / start ~ stop 동안 현재 스레드의 모든 변환)
+    - 파이썬 함수 호출 대신 아래 논리 단계로 묶어 기록 → build_ast 작업 스택 / 제너레이터 단계가 흩어지지 않음
+    - 단계에 속하지 않는 함수의 시간은 호출한 단계에 포함, 변환 밖의 시간은 "other"
+- 단계 (스택 한 칸)
+    - convert / fast_path / tokenize (merge_brackets 포함)
+    - parse (build_ast) 안의 split (구간 분기 본문 _range_steps, 우선순위 연산자 조회, 구조 판정 요약)
+      / brackets (자동 괄호 추출) / node;<클래스 이름> (노드 생성자)
+    - hooks 안의 훅 함수 이름 (handle_cases_structure 등) / render
+- collapsed() : "convert;parse;split 1234" 형식 (값 : 마이크로초, 단계 경로별 자기 시간)
+    - flamegraph.pl / speedscope 에 그대로 입력
+- report(n) : convert 호출 단위로 잰 가장 느린 수식 n 개 (시간, 방향, 입력)
+- 프로파일링 중에는 함수 호출마다 훅이 실행되므로 절대 시간보다 단계 간 비율로 볼 것
+
+사용 예시:
+    with Profiler(top=20) as profiler:
+        for text in scripts:
+            convert(text)
+    profiler.write("convert.folded")   # convert.folded + convert.folded.top.txt
+"""
+
+import heapq
+import itertools
+import sys
+import time
+from collections import Counter
+
+from converter import fast_path, parser, render, token_summary, tokenizer
+from converter.base import ExprNode
+from converter.hooks import postprocess_hook
+
+OTHER = "other"   # 변환 밖 (입출력 등) 시간의 스택 이름
+
+
+def _node_classes() -> list[type]:
+    """ExprNode 하위 클래스 전체 (register_node 로 추가된 것 포함)"""
+    found, pending = [], [ExprNode]
+    while pending:
+        for cls in pending.pop().__subclasses__():
+            found.append(cls)
+            pending.append(cls)
+    return found
+
+
+def _labels() -> dict:
+    """코드 객체 → 단계 이름"""
+    phases = {
+        "convert": [parser.convert],
+        "fast_path": [fast_path.transpile],
+        "tokenize": [parser.tokenize, parser._tokenize, tokenizer.scan, parser.merge_brackets],
+        "parse": [parser.build_ast],
+        "brackets": [parser.extract_bracket_nodes, parser._extract_steps, parser._bracket_node_steps],
+        "split": [parser._range_steps, parser.find_lowest_precedence_op, parser._lowest_precedence_entry,
+                  parser._should_skip_range, parser._operator_tree, parser._is_plain_split, parser._chain_steps,
+                  token_summary.TokenSummary.__init__, token_summary.TokenSummary.lowest],
+        "hooks": [postprocess_hook.apply_postprocess_hooks],
+        "render": [render.render],
+    }
+    labels = {fn.__code__: phase for phase, fns in phases.items() for fn in fns}
+    for name in dir(postprocess_hook):
+        if name.startswith("handle_"):
+            labels[getattr(postprocess_hook, name).__code__] = name
+    for cls in _node_classes():
+        init = cls.__dict__.get("__init__")
+        if init is not None and hasattr(init, "__code__"):
+            labels[init.__code__] = f"node;{cls.__name__}"
+    return labels
+
+
+class Profiler:
+    """논리 단계별 자기 시간 + convert 단위 top-N (with 문 / start ~ stop)"""
+
+    def __init__(self, top: int = 20):
+        self.top = top
+        self.stacks = Counter()   # 단계 경로 → 자기 시간 (ns)
+        self.slowest = []         # (시간 ns, 순번, 방향, 입력) min-heap, 최대 top 개
+        self._seq = itertools.count()
+        self._labels = {}
+        self._frames = []         # (프레임, 단계 경로) : 단계에 해당하는 프레임만
+        self._key = OTHER
+        self._last = 0
+        self._calls = []          # 진행 중인 convert : (프레임, 시작 ns, 방향, 입력)
+
+    def start(self):
+        self._labels = _labels()
+        self._last = time.perf_counter_ns()
+        sys.setprofile(self._hook)
+
+    def stop(self):
+        sys.setprofile(None)
+        self._charge(time.perf_counter_ns())
+        self._frames.clear()
+        self._calls.clear()
+        self._key = OTHER
+
+    def __enter__(self) -> "Profiler":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
+
+    def _charge(self, now: int):
+        self.stacks[self._key] += now - self._last
+
+    def _hook(self, frame, event: str, arg):
+        if event != "call" and event != "return":
+            return
+        now = time.perf_counter_ns()
+        self._charge(now)
+        if event == "call":
+            label = self._labels.get(frame.f_code)
+            if label is not None:
+                key = self._key
+                if key == OTHER:
+                    key = label
+                elif not key.endswith(label):   # 같은 단계 연속 호출은 한 칸으로
+                    key = f"{key};{label}"
+                self._frames.append((frame, key))
+                self._key = key
+                if label == "convert":
+                    args = frame.f_locals
+                    self._calls.append((frame, now, args.get("direction"), args.get("text")))
+        elif self._frames and self._frames[-1][0] is frame:
+            self._frames.pop()
+            self._key = self._frames[-1][1] if self._frames else OTHER
+            if self._calls and self._calls[-1][0] is frame:
+                _, started, direction, text = self._calls.pop()
+                self._record(now - started, direction, text)
+        # 훅 자체의 처리 시간은 어느 단계에도 넣지 않음
+        self._last = time.perf_counter_ns()
+
+    def _record(self, elapsed: int, direction: str, text: str):
+        item = (elapsed, next(self._seq), direction, text)
+        if len(self.slowest) < self.top:
+            heapq.heappush(self.slowest, item)
+        elif item > self.slowest[0]:
+            heapq.heapreplace(self.slowest, item)
+
+    def collapsed(self) -> str:
+        """flamegraph collapsed stack 형식 (값 : 마이크로초, 0 인 경로 제외)"""
+        lines = [f"{key} {ns // 1000}" for key, ns in sorted(self.stacks.items()) if ns >= 1000]
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def report(self, n: int = None) -> str:
+        """가장 느린 수식 n 개 (기본 top 개)"""
+        rows = sorted(self.slowest, reverse=True)[:n or self.top]
+        total = sum(self.stacks.values()) or 1
+        lines = [f"# slowest {len(rows)} formulas (profiled time, profile total {total / 1e6:.1f} ms)"]
+        for elapsed, _, direction, text in rows:
+            lines.append(f"{elapsed / 1e6:10.3f} ms  {direction:16} {text!r}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str, report_path: str = None):
+        """path 에 collapsed stack, report_path (기본 path + ".top.txt") 에 top-N 보고서"""
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.collapsed())
+        with open(report_path or path + ".top.txt", "w", encoding="utf-8") as f:
+            f.write(self.report())
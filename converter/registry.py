@@ -0,0 +1,160 @@
+# converter/registry.py
+
+"""
+매핑 종류 ↔ 노드 클래스 레지스트리
+
+- converter.mapping.map 의 {FROM}_TO_{TO}_<종류> 매핑 테이블을 종류 이름(ROOT, BINARY_OP, ...)으로 묶어
+  노드 클래스에 한 번만 연결 (파서의 globals() / to_pascal_case 리플렉션 대체)
+- None 으로 선언된 종류는 노드 클래스가 없는 매핑 : 토큰은 우선순위 비교에만 쓰이고 노드로 만들어지지 않음
+    - DERIV / SET / BIGOP / BAR / ANGLE / SYMBOL 은 기존 리플렉션에서 클래스가 해석되지 않던 종류 (동작 유지)
+- map.py 에 선언되지 않은 종류의 매핑이 있으면 import 시 RegistryError
+- register_node / unregister_node 로 parser.py 수정 없이 노드 종류 등록 / 해제
+  (파서 연산자 인덱스는 다음 파싱 때 다시 구성)
+
+사용 예시:
+    register_node("NORM", NormNode, hangul_to_latex={"norm": r"\\lVert"}, latex_to_hangul={r"\\lVert": "norm"})
+"""
+
+import re
+from converter.base import ExprNode
+from converter.mapping import map as mapping
+from converter.mapping.precedence import OP_PRECEDENCE_HANGUL, OP_PRECEDENCE_LATEX
+from converter.nodes.root import RootNode
+from converter.nodes.log import LogNode
+from converter.nodes.function import FunctionNode
+from converter.nodes.fraction import FractionNode
+from converter.nodes.power import PowerNode
+from converter.nodes.integral import IntegralNode
+from converter.nodes.cases import CasesNode
+from converter.nodes.arrow import ArrowNode
+from converter.nodes.vector import VectorNode
+from converter.nodes.matrix import MatrixNode
+from converter.nodes.limit import LimitNode
+from converter.nodes.binary_op import BinaryOpNode
+from converter.nodes.bracket import BracketNode
+
+DIRECTIONS = (("HANGUL", "LATEX"), ("LATEX", "HANGUL"))
+
+_MAP_NAME_RE = re.compile(r"(HANGUL_TO_LATEX|LATEX_TO_HANGUL)_(\w+)")
+
+
+class RegistryError(Exception):
+    """매핑 종류와 노드 클래스 연결 오류"""
+    pass
+
+
+# 종류 이름 → 노드 클래스 (None : 노드 클래스 없음)
+NODE_CLASSES: dict[str, type] = {
+    "ROOT": RootNode,
+    "LOG": LogNode,
+    "FUNCTION": FunctionNode,
+    "FRACTION": FractionNode,
+    "POWER": PowerNode,
+    "INTEGRAL": IntegralNode,
+    "CASES": CasesNode,
+    "ARROW": ArrowNode,
+    "VECTOR": VectorNode,
+    "MATRIX": MatrixNode,
+    "LIMIT": LimitNode,
+    "BINARY_OP": BinaryOpNode,
+    "BRACKET": BracketNode,
+    "DERIV": None,
+    "SET": None,
+    "BIGOP": None,
+    "BAR": None,
+    "ANGLE": None,
+    "SYMBOL": None,
+}
+
+# 방향 → {종류 이름: 매핑 테이블} (map.py 정의 순서, 등록된 종류는 뒤에 추가)
+_TABLES: dict[tuple, dict] = {direction: {} for direction in DIRECTIONS}
+
+# register_node 로 추가된 토큰 우선순위 (종류 이름 → 토큰 → 우선순위)
+_PRECEDENCE: dict[str, dict] = {}
+
+# 등록 내용이 바뀔 때마다 증가 (파서 연산자 인덱스 캐시 무효화용)
+revision = 0
+
+
+def _load_builtin_maps():
+    """map.py 의 매핑 테이블을 종류별로 묶음 (선언되지 않은 종류는 RegistryError)"""
+    for name, table in vars(mapping).items():
+        m = _MAP_NAME_RE.fullmatch(name)
+        if m is None:
+            continue
+        kind = m.group(2)
+        if kind not in NODE_CLASSES:
+            raise RegistryError(f"{name}: 노드 클래스가 선언되지 않은 매핑 종류 {kind!r} (converter.registry.NODE_CLASSES)")
+        direction = tuple(m.group(1).split("_TO_"))
+        _TABLES[direction][kind] = table
+
+
+def map_name(kind: str, from_lang: str, to_lang: str) -> str:
+    """종류 이름 → 매핑 테이블 이름 (BINARY_OP → HANGUL_TO_LATEX_BINARY_OP)"""
+    return f"{from_lang.upper()}_TO_{to_lang.upper()}_{kind}"
+
+
+def node_class(kind: str):
+    """종류 이름 → 노드 클래스 (None : 노드 클래스 없음), 모르는 종류는 RegistryError"""
+    try:
+        return NODE_CLASSES[kind]
+    except KeyError:
+        raise RegistryError(f"등록되지 않은 매핑 종류: {kind!r}") from None
+
+
+def tables(from_lang: str, to_lang: str) -> list[tuple[str, type, dict]]:
+    """방향별 (종류 이름, 노드 클래스, 매핑 테이블) 목록 (정의 / 등록 순서)"""
+    direction = (from_lang.upper(), to_lang.upper())
+    return [(kind, NODE_CLASSES[kind], table) for kind, table in _TABLES[direction].items()]
+
+
+def precedence_map(from_lang: str) -> dict:
+    """원본 언어 기준 토큰 우선순위 (precedence.py + register_node 로 추가된 값)"""
+    base = OP_PRECEDENCE_HANGUL if from_lang.upper() == "HANGUL" else OP_PRECEDENCE_LATEX
+    if not _PRECEDENCE:
+        return base
+    merged = dict(base)
+    for extra in _PRECEDENCE.values():
+        merged.update(extra)
+    return merged
+
+
+def register_node(kind: str, cls: type, hangul_to_latex: dict = None, latex_to_hangul: dict = None,
+                  precedence: dict = None, replace: bool = False):
+    """
+    새 노드 종류 등록 (또는 노드 클래스가 없던 종류에 클래스 연결)
+    - hangul_to_latex / latex_to_hangul : 방향별 토큰 매핑 테이블 (없으면 기존 테이블 유지)
+    - precedence : 토큰 → 우선순위 (양쪽 언어 공통, 없는 토큰은 우선순위 inf → 첫 토큰 리플렉션으로만 사용)
+    - 이미 다른 클래스가 연결된 종류는 replace=True 일 때만 교체
+    """
+    global revision
+    if cls is not None and not (isinstance(cls, type) and issubclass(cls, ExprNode)):
+        raise TypeError(f"노드 클래스는 ExprNode 하위 클래스여야 함: {cls!r}")
+    current = NODE_CLASSES.get(kind)
+    if current is not None and current is not cls and not replace:
+        raise RegistryError(f"매핑 종류 {kind!r} 에 이미 {current.__name__} 가 등록되어 있음 (replace=True 로 교체)")
+
+    NODE_CLASSES[kind] = cls
+    for direction, table in zip(DIRECTIONS, (hangul_to_latex, latex_to_hangul)):
+        if table is not None:
+            _TABLES[direction][kind] = table
+    if precedence:
+        _PRECEDENCE[kind] = dict(precedence)
+    revision += 1
+    return cls
+
+
+def unregister_node(kind: str):
+    """register_node 로 등록한 종류 해제 (map.py 에 정의된 기본 종류는 해제 불가)"""
+    global revision
+    if any(map_name(kind, *direction) in vars(mapping) for direction in DIRECTIONS):
+        raise RegistryError(f"map.py 에 정의된 기본 매핑 종류는 해제할 수 없음: {kind!r}")
+    node_class(kind)
+    del NODE_CLASSES[kind]
+    for direction in DIRECTIONS:
+        _TABLES[direction].pop(kind, None)
+    _PRECEDENCE.pop(kind, None)
+    revision += 1
+
+
+_load_builtin_maps()
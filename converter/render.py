@@ -0,0 +1,59 @@
+# converter/render.py
+
+"""
+AST → 문자열 렌더러 (명시적 스택, 재귀 없음)
+
+- 각 노드는 출력 조각 리스트만 정의 (latex_parts / hangul_parts)
+    - 조각은 문자열 또는 하위 노드
+    - ex) BinaryOpNode : [left, " \\times ", right]
+- render 가 작업 스택으로 조각을 펼쳐 이어 붙임 → 중첩 깊이와 무관하게 인터프리터 재귀 한도에 걸리지 않음
+- 조각 메서드가 없는 객체는 기존 to_latex / to_hangul 을 그대로 호출
+"""
+
+# 렌더 대상 → (조각 메서드 이름, 문자열 메서드 이름)
+TARGETS = {
+    "latex": ("latex_parts", "to_latex"),
+    "hangul": ("hangul_parts", "to_hangul"),
+}
+
+
+def render(node, target: str) -> str:
+    """
+    node 를 target("latex" / "hangul") 문자열로 렌더링
+    - 작업 스택에는 노드별 조각 iterator 를 쌓음 : 문자열 조각은 바로 출력, 하위 노드를 만나면 그 조각으로 내려감
+    """
+    parts_name, method_name = TARGETS[target]
+    out = []
+    append = out.append
+    methods = {}
+    stack = [iter((node,))]
+    while stack:
+        for part in stack[-1]:
+            if isinstance(part, str):
+                append(part)
+                continue
+            cls = type(part)
+            parts = methods.get(cls)
+            if parts is None:
+                parts = methods[cls] = getattr(cls, parts_name, None) or False
+            if parts:
+                stack.append(iter(parts(part)))
+                break
+            append(getattr(part, method_name)())
+        else:
+            stack.pop()
+    return "".join(out)
+
+
+def joined(items: list, sep: str, before: str = "", after: str = "") -> list:
+    """sep.join(...) 의 조각 버전 : 각 항목을 before / after 로 감싸고 사이에 sep"""
+    parts = []
+    for i, item in enumerate(items):
+        if i:
+            parts.append(sep)
+        if before:
+            parts.append(before)
+        parts.append(item)
+        if after:
+            parts.append(after)
+    return parts
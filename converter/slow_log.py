@@ -0,0 +1,155 @@
+# converter/slow_log.py
+
+"""
+느린 변환 기록 (slow log) : 기준보다 오래 걸린 convert 를 JSONL 파일에 한 줄씩 추가
+
+- SlowLog 는 trace sink : trace.enable(slow_log) 동안의 convert 호출만 대상
+    - convert_many(..., slow_log=...) 는 워커 프로세스마다 같은 설정으로 설치
+- 느린 변환 판정 (둘 중 하나라도 넘으면 기록)
+    - threshold_ms : 고정 기준 (밀리초)
+    - quantile     : 최근 window 개 변환 시간의 분위값 (ex) 0.99 → p99), 표본이 min_samples 개 이상일 때만
+- 기록 항목 : 시각, pid, 방향, 입력, 걸린 시간, 판정 이유, 토큰 수, 최대 중첩 깊이(중괄호 + 자동 괄호),
+             최종 AST 노드 수 (빠른 경로면 null), 단계별 시간 (hook.<이름> 포함), 예외 이름
+    - 토큰 수 / 중첩 깊이는 느린 변환으로 판정된 뒤에만 계산
+- 설치 중에는 trace 가 활성화되어 단계 구간 비용이 더해짐 (샘플 코퍼스 기준 변환 시간 약 1.8배)
+    - 노드 단위 정보(node 이벤트, 훅별 스냅샷)는 요청하지 않음 : 노드 수는 훅 적용 후 한 번만 셈
+- 파일 쓰기 : 기록마다 O_APPEND 로 열어 한 줄을 write 한 번으로 쓰고 닫음
+    - 여러 워커 프로세스가 같은 파일에 써도 줄이 섞이지 않음 (fcntl 이 있으면 배타 잠금도 사용)
+    - 파일을 열어 두지 않으므로 logrotate 등으로 옮기거나 지워도 다음 기록부터 새 파일에 씀
+
+사용 예시:
+    slow = SlowLog("slow.jsonl", threshold_ms=20, quantile=0.99)
+    trace.enable(slow)
+    for text in scripts:
+        convert(text)
+"""
+
+import json
+import os
+import re
+import time
+from bisect import bisect_left, insort
+from collections import Counter, deque
+
+from converter import trace
+from converter.tokenizer import scan
+
+try:
+    import fcntl
+except ImportError:   # Windows : O_APPEND 한 번 쓰기만 사용
+    fcntl = None
+
+_O_BINARY = getattr(os, "O_BINARY", 0)   # Windows : 줄바꿈 변환 없이 쓰기
+
+_NESTING_RE = re.compile(r"[{}]|\\?\b(left|right)\b", re.IGNORECASE)
+
+
+def nesting_depth(text: str) -> int:
+    """중괄호와 자동 괄호(LEFT/RIGHT, \\left/\\right)를 합친 최대 중첩 깊이"""
+    depth = deepest = 0
+    for m in _NESTING_RE.finditer(text):
+        tag = m.group(1)
+        if m.group() == "{" or (tag and tag.lower() == "left"):
+            depth += 1
+            deepest = max(deepest, depth)
+        elif depth:
+            depth -= 1
+    return deepest
+
+
+class SlowLog:
+    """trace sink : threshold_ms / 최근 변환 시간 분위값을 넘은 convert 를 path 에 JSONL 로 추가"""
+
+    def __init__(self, path: str, threshold_ms: float = None, quantile: float = None, window: int = 1000,
+                 min_samples: int = 100):
+        if threshold_ms is None and quantile is None:
+            raise ValueError("threshold_ms 또는 quantile 중 하나는 필요함")
+        if quantile is not None and not 0 < quantile < 1:
+            raise ValueError(f"quantile 은 0 과 1 사이여야 함: {quantile}")
+        self.path = os.path.expanduser(path)
+        self.threshold_ms = threshold_ms
+        self.quantile = quantile
+        self.window = window
+        self.min_samples = min_samples
+        self.recorded = 0
+        self._recent = deque()    # 최근 변환 시간 (도착 순서)
+        self._sorted = []         # 같은 값들의 정렬 리스트 (분위값 조회)
+        self._phases = Counter()  # 진행 중인 convert 의 단계별 시간 (ns)
+        self._nodes = None
+
+    def __call__(self, event: trace.TraceEvent):
+        if event.kind != "end":
+            if event.kind == "begin" and event.phase == "convert":
+                self._phases.clear()
+                self._nodes = None
+            return
+        phase = event.phase
+        if phase == "convert":
+            self._finish(event)
+            return
+        if phase == "hook":
+            phase = f"hook.{event.data['name']}"
+        elif phase == "hooks":
+            self._nodes = event.data.get("nodes")
+        self._phases[phase] += event.elapsed
+
+    def _limit_ms(self) -> float:
+        """현재 분위값 기준 (표본 부족이면 None)"""
+        if self.quantile is None or len(self._sorted) < self.min_samples:
+            return None
+        return self._sorted[min(len(self._sorted) - 1, int(len(self._sorted) * self.quantile))]
+
+    def _finish(self, event: trace.TraceEvent):
+        elapsed_ms = event.elapsed / 1e6
+        reason = None
+        if self.threshold_ms is not None and elapsed_ms >= self.threshold_ms:
+            reason = f"threshold {self.threshold_ms}ms"
+        else:
+            limit = self._limit_ms()
+            if limit is not None and elapsed_ms > limit:
+                reason = f"p{self.quantile * 100:g} {limit:.3f}ms"
+        if self.quantile is not None:
+            self._observe(elapsed_ms)
+        if reason is not None:
+            self.write(self._record(event, elapsed_ms, reason))
+
+    def _observe(self, elapsed_ms: float):
+        self._recent.append(elapsed_ms)
+        insort(self._sorted, elapsed_ms)
+        if len(self._recent) > self.window:
+            del self._sorted[bisect_left(self._sorted, self._recent.popleft())]
+
+    def _record(self, event: trace.TraceEvent, elapsed_ms: float, reason: str) -> dict:
+        data = event.data
+        text = data.get("text", "")
+        try:
+            tokens = len(scan(text))
+        except Exception:
+            tokens = None
+        record = {
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "pid": os.getpid(),
+            "direction": data.get("direction"),
+            "text": text,
+            "elapsed_ms": round(elapsed_ms, 3),
+            "reason": reason,
+            "tokens": tokens,
+            "depth": nesting_depth(text),
+            "nodes": self._nodes,
+            "phases_ms": {phase: round(ns / 1e6, 3) for phase, ns in self._phases.items()},
+        }
+        if "error" in data:
+            record["error"] = data["error"]
+        return record
+
+    def write(self, record: dict):
+        """한 줄 추가 (O_APPEND 로 열고 write 한 번, 가능하면 배타 잠금)"""
+        line = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT | _O_BINARY, 0o644)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            os.write(fd, line)
+        finally:
+            os.close(fd)   # 잠금도 함께 풀림
+        self.recorded += 1
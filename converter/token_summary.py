@@ -0,0 +1,178 @@
+# converter/token_summary.py
+
+"""
+토큰 배열 구간에 대한 구조 판정용 요약 (per-range token feature summary)
+
+- 파서가 재귀 단계마다 구간을 다시 훑던 판정을 구간 질의로 바꾸기 위한 자료구조
+    - 위치 리스트 + bisect : 구간 내 특정 토큰 존재 여부 / 첫 위치 → O(log n)
+        - 정확히 일치 : 'of', '_', '^'
+        - 부분 문자열 : '_', '^', 'dx' (적분 분기 판정), 'dx' 로 끝나는 토큰
+        - 자동 괄호 매핑 토큰 (should_skip_reflection)
+    - 연산자 sparse table : 구간 내 가장 낮은 우선순위 연산자 (같으면 뒤쪽) → O(1)
+- 위치 리스트 / 연산자 테이블은 판정 종류별로 처음 질의할 때 한 번만 구성 (쓰이지 않는 판정은 비용 없음)
+- 문자열이 아닌 토큰(BracketNode 등)이 섞인 구간의 부분 문자열 / 접미사 판정은
+  기존 판정식과 같은 결과·예외가 나도록 선형 검사로 처리
+"""
+
+from bisect import bisect_left
+from converter.mapping.map import HANGUL_TO_LATEX_BRACKET, LATEX_TO_HANGUL_BRACKET
+from converter.tokenizer import BraceBlock
+
+BRACKET_TOKENS = frozenset(HANGUL_TO_LATEX_BRACKET) | frozenset(LATEX_TO_HANGUL_BRACKET)
+TEXT_TOKENS = (str, BraceBlock)   # 문자열로 다루는 토큰 (중괄호 블록은 원문 구간을 가리킴)
+
+# 연산자 수가 이 값 이하인 구간은 sparse table 없이 직접 비교 (짧은 수식은 테이블 구성 비용이 더 큼)
+LINEAR_SCAN_LIMIT = 8
+
+
+def _has(positions: list[int], lo: int, hi: int) -> bool:
+    i = bisect_left(positions, lo)
+    return i < len(positions) and positions[i] < hi
+
+
+def _first(positions: list[int], lo: int, hi: int) -> int:
+    i = bisect_left(positions, lo)
+    if i < len(positions) and positions[i] < hi:
+        return positions[i]
+    return -1
+
+
+class TokenSummary:
+    """
+    tokens[lo:hi] 구간의 구조 판정 요약
+    - 질의 구간은 구성 시 지정한 구간 안이어야 함
+    - split_index : 연산자 인덱스 (토큰 → (우선순위, 맵 이름, 노드 클래스)), lowest() 사용 시 필요
+    - 위치 리스트는 판정 종류별로 처음 질의될 때 구성 (sqrt / int 관련 판정은 해당 구조가 있을 때만 사용됨)
+    """
+    __slots__ = ("tokens", "lo", "hi", "split_index", "_positions", "_ops", "_entries", "_table")
+
+    def __init__(self, tokens: list, lo: int = 0, hi: int = None, split_index: dict = None):
+        self.tokens = tokens
+        self.lo = lo
+        self.hi = len(tokens) if hi is None else hi
+        self.split_index = split_index
+        self._positions = {}
+        self._ops = None
+        self._table = None
+
+    def _feature(self, key: tuple) -> list[int]:
+        """판정 종류별 위치 리스트 (정렬됨, 최초 1회 구성)"""
+        positions = self._positions.get(key)
+        if positions is not None:
+            return positions
+        tokens = self.tokens
+        span = range(self.lo, self.hi)
+        kind, value = key
+        if kind == "object":
+            positions = [i for i in span if not isinstance(tokens[i], TEXT_TOKENS)]
+        elif kind == "bracket":
+            positions = [i for i in span if tokens[i].__class__ is not BraceBlock and tokens[i] in BRACKET_TOKENS]
+        elif kind == "token":
+            positions = [i for i in span if tokens[i] == value]
+        elif kind == "substring":
+            positions = [i for i in span if isinstance(tokens[i], TEXT_TOKENS) and value in tokens[i]]
+        else:  # suffix
+            positions = [i for i in span if isinstance(tokens[i], TEXT_TOKENS) and tokens[i].endswith(value)]
+        self._positions[key] = positions
+        return positions
+
+    def _has_object(self, lo: int, hi: int) -> bool:
+        return _has(self._feature(("object", None)), lo, hi)
+
+    # === 정확히 일치하는 토큰 ===
+    def has_token(self, tok: str, lo: int, hi: int) -> bool:
+        """tok in tokens[lo:hi]"""
+        return _has(self._feature(("token", tok)), lo, hi)
+
+    def first_token(self, tok: str, lo: int, hi: int) -> int:
+        """tokens.index(tok, lo, hi), 없으면 -1"""
+        return _first(self._feature(("token", tok)), lo, hi)
+
+    # === 부분 문자열 / 접미사 ===
+    def any_substring(self, sub: str, lo: int, hi: int) -> bool:
+        """any(sub in t for t in tokens[lo:hi])"""
+        if self._has_object(lo, hi):
+            return any(sub in self.tokens[i] for i in range(lo, hi))
+        return _has(self._feature(("substring", sub)), lo, hi)
+
+    def first_substring(self, sub: str, lo: int, hi: int) -> int:
+        """next(i for i in range(lo, hi) if sub in tokens[i])"""
+        if self._has_object(lo, hi):
+            return next(i for i in range(lo, hi) if sub in self.tokens[i])
+        i = _first(self._feature(("substring", sub)), lo, hi)
+        if i == -1:
+            raise StopIteration
+        return i
+
+    def any_dx_suffix(self, lo: int, hi: int) -> bool:
+        """any(t.endswith("dx") or t == "dx" for t in tokens[lo:hi])"""
+        if self._has_object(lo, hi):
+            return any(self.tokens[i].endswith("dx") or self.tokens[i] == "dx" for i in range(lo, hi))
+        return _has(self._feature(("suffix", "dx")), lo, hi)
+
+    # === 자동 괄호 매핑 토큰 ===
+    def has_bracket(self, lo: int, hi: int) -> bool:
+        """HANGUL_TO_LATEX_BRACKET / LATEX_TO_HANGUL_BRACKET 토큰 포함 여부"""
+        return _has(self._feature(("bracket", None)), lo, hi)
+
+    # === 연산자 ===
+    def _build_ops(self):
+        get = self.split_index.get
+        tokens = self.tokens
+        ops = []
+        entries = []
+        for i in range(self.lo, self.hi):
+            if tokens[i].__class__ is BraceBlock:   # 중괄호 블록은 연산자가 아님 (원문 해시 생략)
+                continue
+            entry = get(tokens[i])
+            if entry is not None:
+                ops.append(i)
+                entries.append(entry)
+        self._ops = ops
+        self._entries = entries
+
+    def _build_table(self):
+        """
+        sparse table : table[k][j] = entries[j : j + 2^k] 중 우선순위가 가장 낮은 항목의 번호 (같으면 뒤쪽)
+        """
+        entries = self._entries
+        table = [list(range(len(entries)))]
+        width = 1
+        while width * 2 <= len(entries):
+            prev = table[-1]
+            level = []
+            for j in range(len(entries) - width * 2 + 1):
+                x, y = prev[j], prev[j + width]
+                level.append(y if entries[y][0] <= entries[x][0] else x)
+            table.append(level)
+            width *= 2
+        self._table = table
+
+    def lowest(self, lo: int, hi: int) -> tuple[int, tuple]:
+        """
+        구간 내 가장 낮은 우선순위 연산자 (인덱스, 인덱스 항목), 없으면 (-1, None)
+        - 같은 우선순위면 뒤쪽 토큰 (_lowest_precedence_entry 와 동일)
+        - 연산자가 적은 구간은 직접 비교, 많은 구간은 sparse table 로 O(1)
+        """
+        if self._ops is None:
+            self._build_ops()
+        ops = self._ops
+        entries = self._entries
+        a = bisect_left(ops, lo)
+        b = bisect_left(ops, hi, a)
+        if a >= b:
+            return -1, None
+        if b - a <= LINEAR_SCAN_LIMIT:
+            x = a
+            for j in range(a + 1, b):
+                if entries[j][0] <= entries[x][0]:
+                    x = j
+        else:
+            if self._table is None:
+                self._build_table()
+            k = (b - a).bit_length() - 1
+            level = self._table[k]
+            x, y = level[a], level[b - (1 << k)]
+            if entries[y][0] < entries[x][0] or (entries[y][0] == entries[x][0] and y > x):
+                x = y
+        return ops[x], entries[x]
@@ -0,0 +1,355 @@
+# converter/tokenizer.py
+
+"""
+수식 문자열을 토큰 리스트로 분리하는 토크나이저 엔진
+
+- `scan` : 미리 컴파일된 마스터 정규식으로 입력을 한 번만 읽는 단일 패스 스캐너
+    - 문자 단위 처리는 정규식 엔진에 맡기고, 파이썬 루프는 토큰 단위로만 돎
+    - 중괄호 블록은 내부 토큰까지 만들어 둔 BraceBlock 토큰 트리로 반환
+    - 자동 괄호(LEFT( / \\left( ) 인식과 음수 병합(merge_negative_numbers)을 같은 패스에서 처리
+- `scan_chars` : 기존 문자 단위 루프 구현 (비교 기준 / 벤치마크 용도로 유지, 블록 내부 토큰 없음)
+- `shape_key` : 리터럴(숫자 / 변수 한 글자)만 자리 문자로 바꾼 구조 키 (수식 모양 캐시용)
+
+두 엔진은 항상 같은 토큰 스트림을 반환해야 함
+"""
+
+import re
+from bisect import bisect_left
+from converter.hooks.postprocess_hook import merge_negative_numbers
+
+AUTO_BRACKETS = "(){}[]"
+
+# 토큰 하나에 대응하는 마스터 정규식 (기존 루프의 분기 우선순위를 그대로 따름)
+# LEFT( / RIGHT( / \left( / \right( → 알파벳 연속 → LaTeX 명령어 → 공백을 제외한 단일 문자
+# - LEFT/RIGHT 는 str.upper() 비교와 동일하게 대소문자 무시 (RIGHT 의 'ı' 는 upper() 시 'I')
+# - 자동 괄호는 'LEFT(' 처럼 한 덩어리로 잡힌 뒤 후처리에서 태그/괄호 두 토큰으로 나눔
+# - 알파벳 연속은 [^\W\d_] 로 잡으므로 str.isalpha() 가 아닌 숫자형 문자(No/Nl 범주, 예: '²')도
+#   포함될 수 있음 → 그런 문자가 있는 입력은 기존 루프(scan_chars)로 처리
+_TOKEN_RE = re.compile(
+    r"(?:[Ll][Ee][Ff][Tt]|[Rr][Iiı][Gg][Hh][Tt]|\\left|\\right)[(){}\[\]]"
+    r"|[^\W\d_]+"
+    r"|\\[^\W\d_]*"
+    r"|[^ ]",
+    re.DOTALL,
+)
+_AUTO_BRACKET_RE = re.compile(r"(?:[Ll][Ee][Ff][Tt]|[Rr][Iiı][Gg][Hh][Tt]|\\left|\\right)[(){}\[\]]")
+_WORD_RE = re.compile(r"[^\W\d_]+")
+_BRACE_RE = re.compile(r"[{}]")
+_MINUS_RE = re.compile(r"-")
+
+
+class BraceBlock:
+    """
+    중괄호 블록 토큰 : 입력 원문의 [start, end) 구간만 들고 '{...}' 문자열처럼 동작
+    - tokens : 블록 내부(원문[start + 1:end - 1])를 스캔한 하위 토큰 리스트 (스캔 시 한 번에 만들어 둠)
+    - 블록 원문을 복사하지 않으므로 중첩 깊이와 무관하게 메모리는 입력 길이에 비례
+    - 항상 '{' 로 시작하는 두 글자 이상 → 연산자 / 괄호 매핑 키('{' 한 글자)와 같을 수 없음
+        - 파서의 인덱스 조회는 블록을 건너뜀 (블록마다 원문 해시를 계산하지 않음)
+        - 비교 / startswith / in / 길이 / 인덱스 는 원문 구간에서 바로 처리
+        - 그 밖의 문자열 메서드(strip, replace 등)와 str() 은 그때 구간을 잘라 만듦
+    - 파서는 내부를 다시 tokenize 하지 않고 tokens 를 그대로 사용
+    """
+    __slots__ = ("source", "start", "end", "tokens")
+
+    def __init__(self, source: str, start: int, end: int):
+        self.source = source
+        self.start = start
+        self.end = end
+        self.tokens = []
+
+    def __str__(self) -> str:
+        return self.source[self.start:self.end]
+
+    def __repr__(self) -> str:
+        return repr(str(self))
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, BraceBlock):
+            other = str(other)
+        elif not isinstance(other, str):
+            return NotImplemented
+        return len(other) == len(self) and self.source.startswith(other, self.start, self.end)
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+    def __getitem__(self, key):
+        if isinstance(key, int):
+            if not -len(self) <= key < len(self):
+                raise IndexError("string index out of range")
+            return self.source[(self.end if key < 0 else self.start) + key]
+        return str(self)[key]
+
+    def __iter__(self):
+        return iter(str(self))
+
+    def __contains__(self, sub: str) -> bool:
+        return self.source.find(sub, self.start, self.end) != -1
+
+    def startswith(self, prefix, *args) -> bool:
+        if args:
+            return str(self).startswith(prefix, *args)
+        return self.source.startswith(prefix, self.start, self.end)
+
+    def endswith(self, suffix, *args) -> bool:
+        if args:
+            return str(self).endswith(suffix, *args)
+        return self.source.endswith(suffix, self.start, self.end)
+
+    def __getattr__(self, name: str):
+        if name in BraceBlock.__slots__:   # 구성 전 (copy / pickle 등)
+            raise AttributeError(name)
+        return getattr(str(self), name)
+
+
+def _match_braces(expr: str) -> dict[int, int]:
+    """
+    모든 '{' 위치 → 짝이 맞는 '}' 다음 인덱스 (스택 한 번 순회)
+    짝이 없는 '{' 는 문자열 끝까지를 블록으로 봄 (기존 collect_brace_block 의 깊이 계산과 동일)
+    """
+    ends = {}
+    stack = []
+    for m in _BRACE_RE.finditer(expr):
+        if m.group() == "{":
+            stack.append(m.start())
+        elif stack:
+            ends[stack.pop()] = m.end()
+    for start in stack:
+        ends[start] = len(expr)
+    return ends
+
+
+def _is_negative_operand(tok: str) -> bool:
+    """merge_negative_numbers 의 r'\\d+(\\.\\d+)?|[a-zA-Z]' 판정과 동일 (숫자는 항상 한 글자 토큰)"""
+    return len(tok) == 1 and (tok.isdecimal() or "a" <= tok <= "z" or "A" <= tok <= "Z")
+
+
+def _postprocess(tokens: list[str], auto: bool, negative: bool) -> list[str]:
+    """
+    정규식 결과 토큰에 대한 보정 (필요한 경우에만 호출)
+    - auto     : 'LEFT(' → 'left', '('
+    - negative : '-', '3' → '-3' (merge_negative_numbers)
+    """
+    out = []
+    append = out.append
+    for tok in tokens:
+        if auto and len(tok) > 1 and tok[-1] in AUTO_BRACKETS and tok[0] != "{":
+            tex = tok[0] == "\\"
+            if len(tok) - tex == 5:
+                append(r"\left" if tex else "left")
+            else:
+                append(r"\right" if tex else "right")
+            append(tok[-1])
+        elif negative and out and out[-1] == "-" and _is_negative_operand(tok):
+            out[-1] = "-" + tok
+        else:
+            append(tok)
+    return out
+
+
+def _has_position(positions: list[int], lo: int, hi: int) -> bool:
+    """정렬된 위치 리스트에 [lo, hi) 구간 값이 있는지 (O(log n))"""
+    i = bisect_left(positions, lo)
+    return i < len(positions) and positions[i] < hi
+
+
+def _scan_block_range(expr: str, lo: int, hi: int, ends: dict[int, int], marks: tuple, pending: list) -> list[str]:
+    """
+    중괄호가 있는 입력에서 expr[lo:hi] 한 단계를 토큰화
+    - 중괄호 블록은 BraceBlock 토큰 하나로 묶고, 블록 내부 구간은 pending 에 넘겨 나중에 같은 방식으로 스캔
+    - 블록/자동 괄호/'-' 존재 여부는 미리 구한 위치 리스트로 판정 → 중첩 구간을 다시 훑지 않음
+    """
+    opens, autos, minus = marks
+    if _has_position(opens, lo, hi):
+        tokens = []
+        append = tokens.append
+        finditer = _TOKEN_RE.finditer
+        pos = lo
+        while pos < hi:
+            for m in finditer(expr, pos, hi):
+                if m.group() != "{":
+                    append(m.group())
+                    continue
+                start = m.start()
+                pos = min(ends[start], hi)
+                if pos - start == 1:   # 짝 없는 '{' 가 끝에 있음 : 내부가 없으므로 일반 문자열 토큰
+                    append("{")
+                    break
+                block = BraceBlock(expr, start, pos)
+                # 기존 tokenize(block[1:-1]) 와 같은 구간
+                pending.append((block.tokens, start + 1, max(start + 1, pos - 1)))
+                append(block)
+                break
+            else:
+                break
+    else:
+        tokens = _TOKEN_RE.findall(expr, lo, hi)
+
+    auto = _has_position(autos, lo, hi)
+    negative = _has_position(minus, lo, hi)
+    if auto or negative:
+        return _postprocess(tokens, auto, negative)
+    return tokens
+
+
+def scan(expr: str) -> list[str]:
+    """
+    단일 패스 스캐너
+    - 중괄호 블록은 원문 구간을 가리키는 BraceBlock 토큰 하나로 묶고,
+      블록 내부 토큰(BraceBlock.tokens)까지 한 번에 만들어 둠 → 중첩 깊이와 무관하게 선형 시간 / 메모리
+    - 중괄호가 없는 입력은 정규식 findall 한 번으로 끝남 (토큰 단위 파이썬 루프 없음)
+    - 자동 괄호 분리 / 음수 병합은 해당 패턴이 있을 때만 수행
+    """
+    if not expr.isascii():
+        words = "".join(_WORD_RE.findall(expr))
+        if words and not words.isalpha():
+            return scan_chars(expr)
+
+    if "{" not in expr:
+        tokens = _TOKEN_RE.findall(expr)
+        auto = _AUTO_BRACKET_RE.search(expr) is not None
+        negative = "-" in expr
+        if auto or negative:
+            return _postprocess(tokens, auto, negative)
+        return tokens
+
+    ends = _match_braces(expr)
+    marks = (
+        sorted(ends),
+        [m.start() for m in _AUTO_BRACKET_RE.finditer(expr)],
+        [m.start() for m in _MINUS_RE.finditer(expr)],
+    )
+    pending = []
+    tokens = _scan_block_range(expr, 0, len(expr), ends, marks, pending)
+    # 블록 내부 구간은 재귀 없이 작업 스택으로 처리
+    while pending:
+        children, lo, hi = pending.pop()
+        children.extend(_scan_block_range(expr, lo, hi, ends, marks, pending))
+    return tokens
+
+
+def scan_chars(expr: str) -> list[str]:
+    """기존 문자 단위 토크나이저 (비교 기준 구현)"""
+    def collect_brace_block(expr: str, start_index: int) -> tuple[str, int]:
+        i = start_index
+        brace_depth = 1
+        block = '{'
+        while i < len(expr) and brace_depth > 0:
+            if expr[i] == '{':
+                brace_depth += 1
+            elif expr[i] == '}':
+                brace_depth -= 1
+            block += expr[i]
+            i += 1
+        return block, i
+
+    tokens = []
+    i = 0
+
+    while i < len(expr):
+        ch = expr[i]
+
+        # Hangul 자동 괄호: LEFT ( → left(
+        if expr[i:i + 4].upper() == "LEFT" and i + 4 < len(expr) and expr[i + 4] in AUTO_BRACKETS:
+            tokens.append("left")
+            tokens.append(expr[i + 4])
+            i += 5
+            continue
+        if expr[i:i + 5].upper() == "RIGHT" and i + 5 < len(expr) and expr[i + 5] in AUTO_BRACKETS:
+            tokens.append("right")
+            tokens.append(expr[i + 5])
+            i += 6
+            continue
+
+        # LaTeX 자동 괄호: \left( → \left(
+        if expr.startswith(r'\left', i) and i + 6 <= len(expr) and expr[i + 5] in AUTO_BRACKETS:
+            tokens.append(r'\left')
+            tokens.append(expr[i + 5])
+            i += 6
+            continue
+        if expr.startswith(r'\right', i) and i + 7 <= len(expr) and expr[i + 6] in AUTO_BRACKETS:
+            tokens.append(r'\right')
+            tokens.append(expr[i + 6])
+            i += 7
+            continue
+
+        # 중괄호 블록
+        if ch == '{':
+            block, i = collect_brace_block(expr, i + 1)
+            tokens.append(block)
+            continue
+
+        if ch == ' ':
+            i += 1
+            continue
+
+        # 알파벳 연속 토큰
+        if ch.isalpha():
+            ident = ''
+            while i < len(expr) and expr[i].isalpha():
+                ident += expr[i]
+                i += 1
+            tokens.append(ident)
+            continue
+
+        # LaTeX 명령어
+        if ch == '\\':
+            command = ch
+            i += 1
+            while i < len(expr) and expr[i].isalpha():
+                command += expr[i]
+                i += 1
+            tokens.append(command)
+            continue
+
+        # 단일 문자 토큰 (괄호 등)
+        tokens.append(ch)
+        i += 1
+
+    return merge_negative_numbers(tokens)
+
+
+# 리터럴 자리 문자 : 원래 리터럴과 같은 토큰 규칙을 따르면서 ASCII 입력에는 나오지 않는 문자
+# - 숫자 자리 : ASCII 가 아닌 유니코드 10진 숫자 (한 글자 토큰, isdecimal → 음수 병합도 동일)
+# - 변수 자리 : CJK 한자 (알파벳 연속 토큰, 앞뒤가 글자가 아니므로 한 글자 토큰 유지)
+SLOT_DIGITS = "".join(c for c in map(chr, range(0x80, 0x20000)) if c.isdecimal())
+SLOT_LETTERS = "".join(map(chr, range(0x4E00, 0x9FA6)))
+
+# 숫자 한 글자 / 앞뒤에 글자와 '\' 가 없는 ASCII 영문자 한 글자
+# - '-' 뒤의 영문자는 ASCII 여부로 음수 병합('-x')이 갈리므로 자리로 바꾸지 않음 (neg 그룹으로 건너뜀)
+_SLOT_RE = re.compile(r"(?P<neg>- *[A-Za-z](?![^\W\d_]))|[0-9]|(?<![^\W\d_])(?<!\\)[A-Za-z](?![^\W\d_])")
+
+
+def shape_key(expr: str, reserved: frozenset = frozenset()) -> tuple[str, str]:
+    """
+    리터럴을 자리 문자로 바꾼 (모양, 원래 리터럴 문자열) 반환, 모양을 만들 수 없으면 None
+    - i 번째 숫자 → SLOT_DIGITS[i], i 번째 변수 → SLOT_LETTERS[i] (등장 순서대로, 자리마다 다른 문자)
+    - 리터럴 문자열은 자리 순서대로 이어 붙인 원래 글자 → 모양의 자리 문자와 1:1 대응
+    - reserved : 매핑 테이블 키처럼 연산자로 쓰이는 영문자 (자리로 바꾸지 않음)
+    - ASCII 가 아닌 입력이나 자리 문자가 모자라는 긴 입력은 None
+    ex ) 'f LEFT ( 2 RIGHT )' → ('一 LEFT ( ٠ RIGHT )', 'f2')
+    """
+    if not expr.isascii():
+        return None
+    literals = []
+    digits = letters = 0
+
+    def slot(m) -> str:
+        nonlocal digits, letters
+        ch = m.group()
+        if m.group("neg") is not None or ch in reserved:
+            return ch
+        literals.append(ch)
+        if ch <= "9":
+            digits += 1
+            return SLOT_DIGITS[digits - 1] if digits <= len(SLOT_DIGITS) else ch
+        letters += 1
+        return SLOT_LETTERS[letters - 1] if letters <= len(SLOT_LETTERS) else ch
+
+    shape = _SLOT_RE.sub(slot, expr)
+    if digits > len(SLOT_DIGITS) or letters > len(SLOT_LETTERS):
+        return None
+    return shape, "".join(literals)
@@ -0,0 +1,147 @@
+# converter/trace.py
+
+"""
+변환 과정 추적(trace) 계층
+
+- sink 가 하나도 설치되지 않으면 비활성 상태
+    - 호출부는 `if trace.active:` 검사 한 번만 수행하고 이벤트 객체도 만들지 않음
+- enable(sink) 로 설치, disable(sink) 로 제거 (여러 개 동시 설치 가능)
+- sink 는 TraceEvent 하나를 인자로 받는 callable
+- 노드 단위 정보(node 이벤트, hook 의 changed)는 AST 전체를 순회해야 하므로
+  wants_nodes 를 요청한 sink 가 있을 때만 만듦 (enable(sink, wants_nodes=True) 또는 sink.wants_nodes = True)
+    - 호출부는 `if trace.node_events:` 로 검사
+
+이벤트 종류 (TraceEvent.kind):
+- "begin" / "end" : 구간(span) 시작 / 끝. end 이벤트의 elapsed 에 경과 시간(ns)
+- "point"         : 단발 이벤트
+
+단계 (TraceEvent.phase):
+- convert        : 수식 하나의 전체 변환 (parse + render), data: direction, length, text
+- fast_path      : 구조 없는 수식의 빠른 변환 시도 (point), data: hit (False 면 아래 단계로 전체 변환)
+- tokenize       : 토큰화, data: length, tokens
+- parse          : 토큰 → AST (build_ast), data: tokens
+- brackets       : 자동 괄호 추출 (새 토큰 배열마다), data: tokens
+- split          : 이항 연산자 분기 (point), data: op, map, start, end
+- node           : 생성된 노드 (point, parse 직후 AST 순회, node_events 일 때만), data: type
+- fallback       : 마지막 LiteralNode(" ".join(...)) 분기 (point), data: tokens
+- integral_error : 적분 분기 파싱 실패 (point), data: error
+- hooks / hook   : 후처리 훅 전체 / 훅 하나, hooks data: nodes (최종 AST 노드 수), hook data: name, changed
+                   (changed 는 node_events 일 때만 : 훅마다 AST 스냅샷 비교)
+- render         : to_latex / to_hangul, data: target
+"""
+
+import logging
+import time
+from contextlib import contextmanager
+from typing import Callable, NamedTuple
+
+logger = logging.getLogger(__name__)
+
+PHASES = ("convert", "fast_path", "tokenize", "parse", "brackets", "split", "node", "fallback", "integral_error",
+          "hooks", "hook", "render")
+
+
+class TraceEvent(NamedTuple):
+    kind: str      # "begin" | "end" | "point"
+    phase: str
+    time: int      # time.perf_counter_ns()
+    elapsed: int   # end 이벤트의 경과 시간(ns), 그 외 0
+    data: dict
+
+
+# 설치된 sink 존재 여부 (호출부의 빠른 검사용)
+active = False
+# 노드 단위 정보를 요청한 sink 존재 여부
+node_events = False
+_sinks: list[Callable[[TraceEvent], None]] = []
+_node_sinks: list[Callable[[TraceEvent], None]] = []
+
+
+def enable(sink: Callable[[TraceEvent], None], wants_nodes: bool = None) -> Callable[[TraceEvent], None]:
+    """
+    sink 설치 후 그대로 반환
+    - wants_nodes : 노드 단위 정보 요청 여부 (None 이면 sink.wants_nodes 속성, 없으면 False)
+    """
+    global active, node_events
+    _sinks.append(sink)
+    if wants_nodes is None:
+        wants_nodes = getattr(sink, "wants_nodes", False)
+    if wants_nodes:
+        _node_sinks.append(sink)
+    active = True
+    node_events = bool(_node_sinks)
+    return sink
+
+
+def disable(sink: Callable[[TraceEvent], None] = None):
+    """sink 제거 (인자가 없으면 모두 제거)"""
+    global active, node_events
+    if sink is None:
+        _sinks.clear()
+        _node_sinks.clear()
+    else:
+        if sink in _sinks:
+            _sinks.remove(sink)
+        if sink in _node_sinks:
+            _node_sinks.remove(sink)
+    active = bool(_sinks)
+    node_events = bool(_node_sinks)
+
+
+def _dispatch(event: TraceEvent):
+    for sink in tuple(_sinks):
+        sink(event)
+
+
+def emit(phase: str, **data):
+    """단발 이벤트 전달"""
+    _dispatch(TraceEvent("point", phase, time.perf_counter_ns(), 0, data))
+
+
+class span:
+    """
+    구간 이벤트 (with 문)
+    - with trace.span("tokenize", length=n) as data: ... data["tokens"] = len(tokens)
+    - as 로 받은 dict 에 넣은 값은 end 이벤트의 data 로 전달됨
+    - 예외로 끝나면 data["error"] 에 예외 클래스 이름 기록 (예외는 그대로 전파)
+    """
+    __slots__ = ("phase", "data", "start")
+
+    def __init__(self, phase: str, **data):
+        self.phase = phase
+        self.data = data
+        self.start = 0
+
+    def __enter__(self) -> dict:
+        self.start = time.perf_counter_ns()
+        _dispatch(TraceEvent("begin", self.phase, self.start, 0, self.data))
+        return self.data
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter_ns()
+        if exc_type is not None:
+            self.data["error"] = exc_type.__name__
+        _dispatch(TraceEvent("end", self.phase, end, end - self.start, self.data))
+        return False
+
+
+@contextmanager
+def collect():
+    """with 블록 동안 모든 이벤트를 리스트로 수집 (테스트 / 디버깅용, 노드 단위 정보 포함)"""
+    events = []
+    sink = enable(events.append, wants_nodes=True)
+    try:
+        yield events
+    finally:
+        disable(sink)
+
+
+def logging_sink(event: TraceEvent):
+    """이벤트를 converter.trace 로거의 DEBUG 로그로 출력 (기존 디버그 print 대체)"""
+    if event.kind == "end":
+        logger.debug("%s %s %.3fms %s", event.kind, event.phase, event.elapsed / 1e6, event.data)
+    else:
+        logger.debug("%s %s %s", event.kind, event.phase, event.data)
+
+
+logging_sink.wants_nodes = True
@@ -0,0 +1,212 @@
+# main.py
+
+"""
+수식 변환 CLI
+
+- 수식 하나       : python main.py "x ^ 2"  → 변환 결과 한 줄
+- 섹션 / HWPX    : python main.py -f sample/section0.xml (또는 doc.hwpx) → 수식마다 JSONL 한 줄
+    - {"section": ..., "id": ..., "script": ..., "output": ...} (실패 시 output 대신 error)
+- JSONL 스트림   : python main.py --jsonl < in.jsonl > out.jsonl
+    - 입력 줄 : {"text": "...", "direction": "..."(선택), 그 밖의 필드는 그대로 출력에 유지}
+    - 출력 줄 : 입력 레코드 + "output" 또는 "error" (입력 순서 유지)
+    - JSON 이 아닌 줄은 {"line": 줄 번호, "error": ...} 로 출력하고 계속 진행
+- 입력은 필요한 만큼만 읽음 : --jobs 개 워커 프로세스에 --chunk-size 개씩, 최대 --buffer 개 청크까지 미리 읽음
+  (수식마다 프로세스를 띄우지 않으므로 수백만 줄 파이프라인에도 사용 가능)
+- --progress 초마다 처리량 / 지연 시간(읽은 시점 → 출력 시점) 요약을 stderr 에 출력
+- --profile PATH : 단계별 collapsed stack(flamegraph 입력)을 PATH 에, 가장 느린 수식 목록을 PATH.top.txt 에 저장
+    - 프로파일링은 현재 프로세스에서만 가능하므로 --jobs 는 1 로 실행
+- --slow-log PATH : --slow-ms 이상 또는 최근 변환의 --slow-quantile 분위값을 넘은 변환을 PATH 에 JSONL 로 추가
+    - 워커 프로세스마다 기록 (같은 파일에 안전하게 추가)
+    - 기준을 주지 않으면 --slow-quantile 0.99, 수식 하나 변환은 분위값을 낼 표본이 없으므로 --slow-ms 필요
+- --section 은 .hwpx 입력에만, --cache-dir 는 -f/--file, --jsonl 변환에만 사용 가능 (그 밖의 입력과 함께 쓰면 오류)
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import deque
+
+from converter import convert, convert_many, trace
+from converter.hwpx import iter_equations, iter_package_equations
+from converter.parser import DIRECTIONS, ENGINES
+from converter.profiling import Profiler
+from converter.slow_log import SlowLog
+
+
+class Progress:
+    """처리량 / 지연 시간 구간 요약 (stderr)"""
+
+    def __init__(self, interval: float, stream=None):
+        self.interval = interval
+        self.stream = stream or sys.stderr
+        self.start = self.last = time.perf_counter()
+        self.total = self.errors = 0
+        self.window = []   # 마지막 요약 이후 레코드별 지연 시간(초)
+
+    def record(self, latency: float, ok: bool):
+        self.total += 1
+        self.errors += not ok
+        self.window.append(latency)
+        if self.interval and time.perf_counter() - self.last >= self.interval:
+            self.report()
+
+    def report(self, final: bool = False):
+        now = time.perf_counter()
+        window, elapsed = sorted(self.window), now - self.last
+        line = f"[{'done' if final else 'progress'}] {self.total} records, {self.errors} errors, " \
+               f"{len(window) / elapsed if elapsed > 0 else 0:.0f}/s"
+        if window:
+            p50 = window[len(window) // 2]
+            p95 = window[min(len(window) - 1, int(len(window) * 0.95))]
+            line += f", latency p50 {p50 * 1e3:.2f}ms p95 {p95 * 1e3:.2f}ms max {window[-1] * 1e3:.2f}ms"
+        if final:
+            line += f", total {now - self.start:.2f}s"
+        print(line, file=self.stream, flush=True)
+        self.last = now
+        self.window = []
+
+
+def _read_jsonl(lines, direction: str, pending: deque):
+    """
+    입력 줄 → (방향, 수식) 항목
+    - 출력용 레코드와 읽은 시각은 pending 에 같은 순서로 쌓음
+    - 잘못된 줄은 error 가 채워진 레코드로 두고, 순서를 맞추기 위한 빈 항목을 넘김
+    """
+    for number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+            text = record["text"]
+            item = (record.get("direction", direction), text)
+        except (ValueError, KeyError, TypeError) as e:
+            record = {"line": number, "error": f"{type(e).__name__}: {e}"}
+            item = (direction, "")
+        pending.append((record, time.perf_counter()))
+        yield item
+
+
+def _equation_records(path: str, sections: list):
+    """섹션 XML / .hwpx 의 수식 → 출력용 레코드"""
+    if path.endswith(".hwpx"):
+        for section, eq in iter_package_equations(path, sections):
+            yield {"section": section, "id": eq.id, "script": eq.script}
+    else:
+        for eq in iter_equations(path):
+            yield {"id": eq.id, "script": eq.script}
+
+
+def run_stream(records_and_items, pending: deque, args, out=None) -> int:
+    """항목을 병렬 변환하고 pending 의 레코드 순서대로 JSONL 출력, 실패한 레코드 수 반환"""
+    out = out or sys.stdout
+    progress = Progress(args.progress) if args.progress else None
+    failures = 0
+    results = convert_many(records_and_items, workers=args.jobs, chunk_size=args.chunk_size,
+                           max_in_flight=args.buffer, engine=args.engine, cache_dir=args.cache_dir,
+                           slow_log=args.slow_log)
+    for result in results:
+        record, read_at = pending.popleft()
+        if "error" not in record:
+            if result.ok:
+                record["output"] = result.output
+            else:
+                record["error"] = result.error
+        failures += "error" in record
+        out.write(json.dumps(record, ensure_ascii=False) + "\n")
+        if progress:
+            progress.record(time.perf_counter() - read_at, "error" not in record)
+    out.flush()
+    if progress:
+        progress.report(final=True)
+    return failures
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("formula", nargs="?", help="변환할 수식 하나")
+    source = ap.add_mutually_exclusive_group()
+    source.add_argument("-f", "--file", help="섹션 XML 또는 .hwpx 파일")
+    source.add_argument("--jsonl", action="store_true", help="stdin 의 JSONL 레코드 스트림 변환")
+    ap.add_argument("--direction", default="hangul_to_latex", choices=list(DIRECTIONS))
+    ap.add_argument("--engine", default="split", choices=list(ENGINES))
+    ap.add_argument("--section", type=int, action="append", help=".hwpx 섹션 번호 (여러 번 지정 가능, 기본 전체)")
+    ap.add_argument("-j", "--jobs", type=int, default=1, help="워커 프로세스 수 (0 : CPU 수)")
+    ap.add_argument("--chunk-size", type=int, default=256, help="워커에 한 번에 넘기는 수식 수")
+    ap.add_argument("--buffer", type=int, default=None, help="미리 읽어 둘 최대 청크 수 (기본 jobs * 2)")
+    ap.add_argument("--progress", type=float, default=0, help="N 초마다 처리량 / 지연 요약 (stderr, 0 : 끔)")
+    ap.add_argument("--cache-dir", default=None, help="디스크 변환 캐시 디렉터리 (워커 간 공유)")
+    ap.add_argument("--profile", metavar="PATH", help="단계별 collapsed stack 저장 경로 (+ PATH.top.txt)")
+    ap.add_argument("--profile-top", type=int, default=20, help="--profile 보고서의 느린 수식 수")
+    ap.add_argument("--slow-log", metavar="PATH", help="느린 변환 기록 JSONL 경로")
+    ap.add_argument("--slow-ms", type=float, default=None, help="느린 변환 고정 기준 (밀리초)")
+    ap.add_argument("--slow-quantile", type=float, default=None,
+                    help="최근 변환 시간의 분위값 기준 (ex) 0.99, --slow-ms 와 함께 쓰면 둘 중 하나만 넘어도 기록)")
+    args = ap.parse_args(argv)
+    args.jobs = args.jobs or os.cpu_count() or 1
+    single = args.formula is not None and args.file is None and not args.jsonl   # 수식 하나 변환
+    if args.section and not (args.file or "").endswith(".hwpx"):
+        ap.error("--section 은 .hwpx 파일 입력에만 쓸 수 있음")
+    if args.cache_dir and single:
+        ap.error("--cache-dir 는 -f/--file, --jsonl 변환에만 쓸 수 있음")
+    if args.slow_log:
+        if single and args.slow_ms is None:
+            ap.error("수식 하나 변환의 --slow-log 는 --slow-ms 가 필요함 (분위값 기준을 낼 표본이 없음)")
+        if args.slow_ms is None and args.slow_quantile is None:
+            args.slow_quantile = 0.99
+        try:
+            args.slow_log = SlowLog(args.slow_log, args.slow_ms, args.slow_quantile)
+        except ValueError as e:
+            ap.error(str(e))
+    if args.profile and args.jobs > 1:
+        print("--profile : 현재 프로세스에서 프로파일링하기 위해 --jobs 1 로 실행", file=sys.stderr)
+        args.jobs = 1
+
+    if not args.profile:
+        return _run(ap, args)
+    with Profiler(top=args.profile_top) as profiler:
+        code = _run(ap, args)
+    profiler.write(args.profile)
+    print(f"[profile] {args.profile}, {args.profile}.top.txt", file=sys.stderr)
+    return code
+
+
+def _run(ap: argparse.ArgumentParser, args) -> int:
+    """입력 방식에 따라 수식 하나 / 스트림 변환"""
+    if args.file is None and not args.jsonl:
+        if args.formula is None:
+            ap.error("수식, -f/--file 또는 --jsonl 중 하나가 필요함")
+        if args.slow_log:
+            trace.enable(args.slow_log)
+        try:
+            print(convert(args.formula, args.direction, args.engine))
+        except Exception as e:
+            print(f"{type(e).__name__}: {e}", file=sys.stderr)
+            return 1
+        finally:
+            if args.slow_log:
+                trace.disable(args.slow_log)
+        return 0
+    if args.formula is not None:
+        ap.error("수식 인자는 -f/--file, --jsonl 과 함께 쓸 수 없음")
+
+    pending = deque()
+    if args.jsonl:
+        items = _read_jsonl(sys.stdin, args.direction, pending)
+    else:
+        def items_from_file():
+            for record in _equation_records(args.file, args.section):
+                pending.append((record, time.perf_counter()))
+                yield args.direction, record["script"]
+        items = items_from_file()
+    try:
+        run_stream(items, pending, args)   # 수식별 실패는 레코드의 error 로 출력
+    except BrokenPipeError:
+        # 출력 쪽 파이프가 먼저 닫힘 (| head 등) : 남은 출력은 버리고 정상 종료
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,16 @@
+import os
+import re
+
 from setuptools import setup, find_packages
 
+# 버전은 converter/__init__.py 의 __version__ 한 곳에서만 관리 (디스크 캐시 지문에도 같은 값이 쓰임)
+with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "converter", "__init__.py"), encoding="utf-8") as f:
+    VERSION = re.search(r'^__version__ = "([^"]+)"', f.read(), re.MULTILINE).group(1)
+
 setup(
     name="math_converter",
-    version="0.1.0",
+    version=VERSION,
     packages=find_packages(),
     install_requires=[],
     python_requires=">=3.6",
-) 
\ No newline at end of file
+)
@@ -0,0 +1,13 @@
+# tests/samples.py
+
+"""테스트 공용 샘플 입력 (benchmarks 패키지에 의존하지 않음)"""
+
+import os
+from converter.hwpx import iter_equations
+
+SAMPLE_XML = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "sample", "section0.xml")
+
+
+def load_scripts(path: str = SAMPLE_XML) -> list[str]:
+    """샘플 섹션의 비어 있지 않은 수식 스크립트 (문서 순서)"""
+    return [eq.script for eq in iter_equations(path) if eq.script]
@@ -0,0 +1,46 @@
+# tests/test_batch.py
+
+import itertools
+import unittest
+from converter import convert, convert_document, convert_many
+
+# 두 번째 수식 : 현재 파서가 처리하지 못하는 중첩 LEFT/RIGHT (AttributeError)
+SCRIPTS = ["x ^ 2", "LEFT ( LEFT ( a RIGHT ) RIGHT )", "a over b", "sqrt {x}", "1"]
+
+
+class ConvertDocumentTests(unittest.TestCase):
+    # 병렬 / 직렬 결과가 같고, 문서 순서 유지
+    def test_parallel_matches_serial(self):
+        serial = convert_document(SCRIPTS, workers=1)
+        self.assertEqual(serial, convert_document(SCRIPTS, workers=2, chunk_size=2))
+        self.assertEqual(list(range(len(SCRIPTS))), [r.index for r in serial])
+        self.assertEqual(convert("a over b"), serial[2].output)
+
+    # 실패한 수식은 error 로 기록되고 나머지는 계속 변환
+    def test_failure_does_not_stop_batch(self):
+        results = convert_document(SCRIPTS, workers=2, chunk_size=1)
+        self.assertFalse(results[1].ok)
+        self.assertIsNone(results[1].output)
+        self.assertTrue(results[1].error.startswith("AttributeError: "))
+        self.assertTrue(all(r.ok for i, r in enumerate(results) if i != 1))
+
+
+class ConvertManyTests(unittest.TestCase):
+    ITEMS = [("hangul_to_latex", "x ^ 2"), ("latex_to_hangul", "\\frac{a}{b}"), ("bad", "x")] * 5
+
+    def test_ordered_and_unordered(self):
+        expected = list(convert_many(self.ITEMS, workers=1))
+        self.assertEqual(convert("\\frac{a}{b}", "latex_to_hangul"), expected[1].output)
+        self.assertTrue(expected[2].error.startswith("ValueError: "))
+        self.assertEqual(expected, list(convert_many(self.ITEMS, workers=2, chunk_size=4)))
+        unordered = list(convert_many(self.ITEMS, workers=2, chunk_size=4, ordered=False))
+        self.assertEqual(expected, sorted(unordered))
+
+    # 입력은 제출 창(max_in_flight) 만큼만 미리 읽음
+    def test_bounded_input(self):
+        read = []
+        items = ((read.append(i), ("hangul_to_latex", "x"))[1] for i in itertools.count())
+        results = convert_many(items, workers=2, chunk_size=10, max_in_flight=2)
+        self.assertEqual([0, 1, 2], [next(results).index for _ in range(3)])
+        results.close()
+        self.assertLessEqual(len(read), 30)
@@ -0,0 +1,76 @@
+# tests/test_cache.py
+
+import unittest
+from converter import ConversionCache, convert
+from converter.cache import ShapeCache, normalize
+from converter.hooks.postprocess_hook import handle_nested_mix
+from converter.nodes.literal import LiteralNode
+
+
+class ConversionCacheTests(unittest.TestCase):
+    def test_normalized_key(self):
+        self.assertEqual("f LEFT ( x RIGHT )", normalize("  f  LEFT  (   x RIGHT ) "))
+        # 간격 기호 / 탭 / 중괄호 블록 안 공백 / 짝 없는 '{' 뒤는 그대로
+        self.assertEqual("a~=~b `\tc", normalize("a~=~b  `\tc"))
+        self.assertEqual("x {a  b} {c {d  }}", normalize(" x   {a  b}  {c {d  }}  "))
+        self.assertEqual("x {a  b  ", normalize("x   {a  b  "))
+        cache = ConversionCache()
+        first = cache.convert("x ^ 2")
+        self.assertEqual(convert("x ^ 2"), first)
+        self.assertEqual(first, cache.convert("  x  ^   2 "))
+        self.assertEqual((1, 1, 0, 1), cache.stats()[:4])
+        cache.convert("x ^ 2", "latex_to_hangul")
+        self.assertEqual(2, cache.stats().misses)
+
+    # 캐시를 거쳐도 convert() 와 같은 결과 (간격 기호 / 블록 안 공백이 결과에 남는 입력)
+    def test_same_output_as_convert(self):
+        cache = ConversionCache()
+        for text, direction in [("a~=~b", "hangul_to_latex"), ("a `= b", "hangul_to_latex"),
+                                ("{a  b}", "hangul_to_latex"), (r"\~{a}", "latex_to_hangul"),
+                                ("a~b", "latex_to_hangul")]:
+            self.assertEqual(convert(text, direction), cache.convert(text, direction), text)
+            self.assertEqual(convert(text, direction), cache.convert(text, direction), text)
+
+    def test_lru_eviction(self):
+        cache = ConversionCache(maxsize=2)
+        for text in ("a", "b", "a", "c", "a", "b"):
+            cache.convert(text)
+        # c 가 들어올 때 b 제거, b 가 다시 들어올 때 c 제거
+        self.assertEqual((2, 4, 2, 2, 2), tuple(cache.stats()))
+        cache.clear()
+        self.assertEqual((0, 0, 0, 0, 2), tuple(cache.stats()))
+
+    # 반환된 AST 를 바꿔도 캐시된 AST / 결과는 그대로
+    def test_ast_isolation(self):
+        cache = ConversionCache()
+        text = "matrix {a & b # c & d}"
+        ast = cache.parse(text)
+        ast.children[0][0].value = "z"
+        ast.children.append([LiteralNode("q")])
+        handle_nested_mix(ast)
+        again = cache.parse(text)
+        self.assertIsNot(ast, again)
+        self.assertEqual(convert(text), again.to_latex())
+        self.assertEqual(convert(text), cache.convert(text))
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            ConversionCache(maxsize=0)
+        with self.assertRaises(ValueError):
+            ConversionCache().convert("x", "bad")
+
+
+class ShapeCacheTests(unittest.TestCase):
+    # 리터럴만 다른 수식은 첫 파싱의 템플릿을 채워 변환
+    def test_template_reuse(self):
+        cache = ShapeCache()
+        for text in ("f LEFT ( 2 RIGHT )", "g LEFT ( 3 RIGHT )", "x^{1 over 3}", "y^{2 over 5}"):
+            self.assertEqual(convert(text), cache.convert(text))
+        self.assertEqual((2, 2), cache.stats()[:2])
+        self.assertEqual(convert("2 over 5", "latex_to_hangul"), cache.convert("2 over 5", "latex_to_hangul"))
+
+    def test_returned_ast_is_fresh(self):
+        cache = ShapeCache()
+        first = cache.parse("a over b")
+        first.args[0].value = "z"
+        self.assertEqual(convert("c over d"), cache.parse("c over d").to_latex())
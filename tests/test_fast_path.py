@@ -0,0 +1,47 @@
+# tests/test_fast_path.py
+
+import unittest
+from tests.samples import load_scripts
+from converter import convert, trace
+from converter.fast_path import transpile
+from converter.parser import DIRECTIONS
+
+
+def full_path(text: str, direction: str) -> str:
+    parse, render = DIRECTIONS[direction]
+    return getattr(parse(text), render)()
+
+
+class FastPathTests(unittest.TestCase):
+    # 빠른 경로가 처리한 샘플 수식은 전체 경로와 결과가 같아야 함
+    def test_matches_full_path_on_sample(self):
+        for direction in DIRECTIONS:
+            hits = 0
+            for expr in load_scripts():
+                out = transpile(expr, direction)
+                if out is not None:
+                    hits += 1
+                    self.assertEqual(full_path(expr, direction), out, expr)
+            self.assertGreater(hits, 300)
+
+    def test_cases(self):
+        self.assertEqual("a \\times b = 4", transpile("a times b = 4", "hangul_to_latex"))
+        self.assertEqual("a times b", transpile("a \\times b", "latex_to_hangul"))
+        self.assertEqual("", transpile("", "hangul_to_latex"))
+        for expr in ["times a", "a times", "a times div b", "x ^ 2", "{a}", "LEFT ( a RIGHT )", "sqrt x", "a over b"]:
+            self.assertIsNone(transpile(expr, "hangul_to_latex"), expr)
+
+    # trace 의 fast_path 이벤트로 적중 여부 기록
+    def test_trace_hit(self):
+        with trace.collect() as events:
+            convert("1 + 2")
+            convert("x ^ 2")
+        self.assertEqual([True, False], [e.data["hit"] for e in events if e.phase == "fast_path"])
+
+    # 빠른 경로로 끝나는 입력도 잘못된 엔진 이름은 ValueError
+    def test_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            convert("3", engine="bogus")
+        with trace.collect():
+            with self.assertRaises(ValueError):
+                convert("3", engine="bogus")
@@ -0,0 +1,102 @@
+# tests/test_hwpx.py
+
+import io
+import unittest
+import xml.etree.ElementTree as ET
+import zipfile
+from unittest import mock
+from tests.samples import SAMPLE_XML
+from converter import hwpx
+from converter.hwpx import iter_equations, iter_package_equations, rewrite_scripts
+
+SECTION = b"""<?xml version="1.0" encoding="UTF-8"?>
+<hs:sec xmlns:hs="http://www.hancom.co.kr/hwpml/2011/section"
+        xmlns:hp="http://www.hancom.co.kr/hwpml/2011/paragraph">
+  <hp:p id="1"><hp:run>
+    <hp:t>text</hp:t>
+    <hp:equation id="10" baseUnit="1100" font="HYhwpEQ">
+      <hp:sz width="1" height="2"/><hp:script>a &lt; b</hp:script>
+    </hp:equation>
+  </hp:run></hp:p>
+  <hp:p id="2"><hp:run>
+    <hp:equation id="11"><hp:script/></hp:equation>
+    <hp:equation><hp:script>x ^ 2</hp:script></hp:equation>
+  </hp:run></hp:p>
+</hs:sec>"""
+
+
+class HwpxTests(unittest.TestCase):
+    def test_records(self):
+        records = list(iter_equations(io.BytesIO(SECTION)))
+        self.assertEqual(["10", "11", None], [r.id for r in records])
+        self.assertEqual(["a < b", "", "x ^ 2"], [r.script for r in records])
+        self.assertEqual({"id": "10", "baseUnit": "1100", "font": "HYhwpEQ"}, records[0].attributes)
+
+    # 끝난 요소는 부모에서 떼어냄 → 다 읽은 뒤 루트에 남는 자식이 없음
+    def test_finished_elements_released(self):
+        roots = []
+        iterparse = ET.iterparse
+
+        def spy(source, events=None):
+            for event, elem in iterparse(source, events=events):
+                if not roots:
+                    roots.append(elem)
+                yield event, elem
+
+        with mock.patch.object(hwpx.ET, "iterparse", spy):
+            self.assertEqual(3, sum(1 for _ in iter_equations(io.BytesIO(SECTION))))
+        self.assertEqual(0, len(roots[0]))
+
+    def test_sample(self):
+        records = list(iter_equations(SAMPLE_XML))
+        self.assertEqual(923, len(records))
+        self.assertTrue(all(r.id for r in records))
+        self.assertEqual("root 3 of 5 times25^{1 over 3}", records[0].script)
+
+
+    # 섹션 번호 순으로 읽고, 요청한 섹션만 압축 해제
+    def test_package(self):
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as package:
+            package.writestr("mimetype", "application/hwp+zip")
+            package.writestr("Contents/header.xml", "<head/>")
+            package.writestr("Contents/section10.xml", SECTION)
+            package.writestr("Contents/section2.xml", SECTION.replace(b"x ^ 2", b"y"))
+        buf.seek(0)
+        records = list(iter_package_equations(buf))
+        self.assertEqual(["Contents/section2.xml"] * 3 + ["Contents/section10.xml"] * 3, [s for s, _ in records])
+        self.assertEqual("y", records[2][1].script)
+
+        opened = []
+        zip_open = zipfile.ZipFile.open
+
+        def spy(package, name, *args, **kwargs):
+            opened.append(name)
+            return zip_open(package, name, *args, **kwargs)
+
+        buf.seek(0)
+        with mock.patch.object(zipfile.ZipFile, "open", spy):
+            records = list(iter_package_equations(buf, sections=[10]))
+        self.assertEqual(["a < b", "", "x ^ 2"], [r.script for _, r in records])
+        self.assertEqual(["Contents/section10.xml"], opened)
+
+        buf.seek(0)
+        with self.assertRaises(KeyError):
+            list(iter_package_equations(buf, sections=[0]))
+
+    # 교체 대상이 없으면 바이트 그대로, 청크 경계가 태그 중간에 걸려도 동일
+    def test_rewrite_identity(self):
+        with open(SAMPLE_XML, "rb") as f:
+            data = f.read()
+        for chunk_size in (1, 7, 1 << 16):
+            out = io.BytesIO()
+            self.assertEqual(0, rewrite_scripts(io.BytesIO(data), out, {}, chunk_size))
+            self.assertEqual(data, out.getvalue())
+
+    def test_rewrite_scripts(self):
+        scripts = {"10": "a <= b & c", "11": "y"}
+        for chunk_size in (1, 5, 1 << 16):
+            out = io.BytesIO()
+            self.assertEqual(2, rewrite_scripts(io.BytesIO(SECTION), out, scripts, chunk_size))
+            self.assertEqual(SECTION.replace(b"a &lt; b", b"a &lt;= b &amp; c")
+                             .replace(b"<hp:script/>", b"<hp:script>y</hp:script>"), out.getvalue())
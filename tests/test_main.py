@@ -0,0 +1,76 @@
+# tests/test_main.py
+
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+import zipfile
+from unittest import mock
+
+import main
+from tests.samples import SAMPLE_XML
+from converter import convert
+
+
+def run_cli(argv, stdin=""):
+    out, err = io.StringIO(), io.StringIO()
+    with mock.patch("sys.stdin", io.StringIO(stdin)), contextlib.redirect_stdout(out), \
+            contextlib.redirect_stderr(err):
+        code = main.main(argv)
+    return code, out.getvalue(), err.getvalue()
+
+
+class CliTests(unittest.TestCase):
+    def test_single_formula(self):
+        self.assertEqual((0, convert("x ^ 2") + "\n", ""), run_cli(["x ^ 2"]))
+        self.assertEqual(convert("a over b", "latex_to_hangul") + "\n",
+                         run_cli(["a over b", "--direction", "latex_to_hangul"])[1])
+
+    # 수식 하나 변환은 분위값 표본이 없으므로 --slow-log 에 --slow-ms 가 필요
+    def test_single_formula_slow_log(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "slow.jsonl")
+            with self.assertRaises(SystemExit):
+                run_cli(["{a} over {b}", "--slow-log", path])
+            self.assertEqual(0, run_cli(["{a} over {b}", "--slow-log", path, "--slow-ms", "0"])[0])
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual("{a} over {b}", json.loads(f.readline())["text"])
+
+    # 입력 방식이 반영할 수 없는 옵션은 조용히 무시하지 않고 오류
+    def test_unsupported_options(self):
+        for argv in (["-f", SAMPLE_XML, "--section", "0"], ["--jsonl", "--section", "0"],
+                     ["x ^ 2", "--section", "0"]):
+            with self.assertRaises(SystemExit):
+                run_cli(argv)
+        with tempfile.TemporaryDirectory() as tmp:
+            package = os.path.join(tmp, "doc.hwpx")
+            with zipfile.ZipFile(package, "w") as zf:
+                zf.write(SAMPLE_XML, "Contents/section0.xml")
+            self.assertEqual(923, len(run_cli(["-f", package, "--section", "0"])[1].splitlines()))
+            with self.assertRaises(SystemExit):
+                run_cli(["x ^ 2", "--cache-dir", tmp])
+            self.assertEqual(0, run_cli(["--jsonl", "--cache-dir", tmp], json.dumps({"text": "x ^ 2"}) + "\n")[0])
+
+    # 입력 순서 유지, 잘못된 줄 / 실패한 수식은 error 로 출력하고 계속 진행
+    def test_jsonl_stream(self):
+        lines = [json.dumps({"text": f"x ^ {i}", "id": i}) for i in range(20)]
+        lines[5] = "not json"
+        lines[7] = json.dumps({"text": "LEFT ( LEFT ( a RIGHT ) RIGHT )"})
+        code, out, err = run_cli(["--jsonl", "-j", "2", "--chunk-size", "3", "--progress", "1e-9"],
+                                 "\n".join(lines) + "\n")
+        records = [json.loads(line) for line in out.splitlines()]
+        self.assertEqual(0, code)
+        self.assertEqual(20, len(records))
+        self.assertEqual(convert("x ^ 19"), records[19]["output"])
+        self.assertEqual(19, records[19]["id"])
+        self.assertEqual(6, records[5]["line"])
+        self.assertIn("error", records[7])
+        self.assertIn("[done] 20 records, 2 errors", err)
+
+    def test_section_file(self):
+        records = [json.loads(line) for line in run_cli(["-f", SAMPLE_XML])[1].splitlines()]
+        self.assertEqual(923, len(records))
+        self.assertEqual("7274263", records[0]["id"])
+        self.assertEqual(convert(records[0]["script"]), records[0]["output"])
@@ -0,0 +1,62 @@
+# tests/test_metrics.py
+
+import json
+import unittest
+from converter import MetricsRegistry, convert, trace
+from converter.metrics import Histogram
+
+
+class MetricsTests(unittest.TestCase):
+    def setUp(self):
+        self.metrics = trace.enable(MetricsRegistry())
+
+    def tearDown(self):
+        trace.disable()
+
+    def test_counters(self):
+        convert("{a} over {b}")
+        convert("x")                     # 빠른 경로
+        convert(r"\frac{1}{2}", "latex_to_hangul")
+        with self.assertRaises(AttributeError):
+            convert("LEFT ( LEFT ( a RIGHT ) RIGHT )")   # 기존 중첩 자동 괄호 오류
+        snap = self.metrics.snapshot()
+
+        self.assertEqual(2, snap["nodes"]["FractionNode"])
+        self.assertEqual({"hit": 1, "miss": 3}, snap["fast_path"])
+        self.assertEqual(2, snap["hook_runs"]["handle_cases_structure"])
+        self.assertEqual({"convert": 1, "parse": 1}, snap["phase_errors"])
+        self.assertGreater(snap["fallbacks"], 0)
+        self.assertEqual(4, snap["phases"]["convert"]["count"])
+        self.assertEqual(2, snap["phases"]["hook.handle_nested_mix"]["count"])
+        self.assertEqual(["+Inf", 2], snap["phases"]["render"]["buckets"][-1])
+        self.assertEqual(snap, json.loads(self.metrics.to_json()))
+
+    # 현재 샘플 수식에는 훅이 트리를 바꾸는 경우가 없어 이벤트를 직접 전달
+    def test_hook_changes(self):
+        self.metrics(trace.TraceEvent("end", "hook", 0, 2_000, {"name": "handle_cases_structure", "changed": True}))
+        self.metrics(trace.TraceEvent("end", "hook", 0, 1_000, {"name": "handle_cases_structure", "changed": False}))
+        snap = self.metrics.snapshot()
+        self.assertEqual({"handle_cases_structure": 1}, snap["hook_changes"])
+        self.assertEqual({"handle_cases_structure": 2}, snap["hook_runs"])
+        self.assertAlmostEqual(3e-6, snap["phases"]["hook.handle_cases_structure"]["sum"])
+
+    def test_prometheus(self):
+        convert("{a} over {b}")
+        text = self.metrics.to_prometheus()
+        self.assertIn('math_converter_nodes_total{type="FractionNode"} 1\n', text)
+        self.assertIn("# TYPE math_converter_phase_seconds histogram\n", text)
+        self.assertIn('math_converter_phase_seconds_bucket{phase="convert",le="+Inf"} 1\n', text)
+        self.assertIn('math_converter_phase_seconds_count{phase="hook",hook="handle_nested_mix"} 1\n', text)
+        for line in text.splitlines():
+            self.assertTrue(line.startswith(("# HELP math_converter_", "# TYPE math_converter_", "math_converter_")))
+
+    def test_histogram_buckets(self):
+        h = Histogram((1.0, 2.0))
+        for value in (0.5, 1.0, 1.5, 3.0):
+            h.observe(value)
+        self.assertEqual({"buckets": [[1.0, 2], [2.0, 3], ["+Inf", 4]], "sum": 6.0, "count": 4}, h.snapshot())
+
+    def test_inactive_without_sink(self):
+        trace.disable()
+        convert("{a} over {b}")
+        self.assertEqual({}, self.metrics.snapshot()["nodes"])
@@ -0,0 +1,165 @@
+# tests/test_parser_internals.py
+
+import unittest
+from tests.samples import load_scripts
+import sys
+from converter.parser import tokenize, find_lowest_precedence_op, operator_index, parse_hangul, parse_latex, \
+    extract_bracket_nodes, build_ast, _build_range, _lowest_precedence_entry, convert
+from converter import trace
+from converter.hooks.postprocess_hook import apply_postprocess_hooks
+from converter.token_summary import TokenSummary
+from converter.nodes.bracket import BracketNode
+from converter.nodes.fraction import FractionNode
+from converter.nodes.binary_op import BinaryOpNode
+
+
+class OperatorIndexTests(unittest.TestCase):
+    # 연산자 인덱스: 토큰 → (우선순위, 맵 이름, 노드 클래스)
+    def test_operator_index_entries(self):
+        index = operator_index("HANGUL", "LATEX")
+        self.assertEqual((3, "HANGUL_TO_LATEX_FRACTION", FractionNode), index["over"])
+        self.assertEqual((2, "HANGUL_TO_LATEX_BINARY_OP", BinaryOpNode), index["times"])
+        self.assertEqual(3, operator_index("LATEX", "HANGUL")[r"\frac"][0])
+
+    # 같은 우선순위면 마지막 연산자를 분기점으로 선택
+    def test_find_lowest_precedence_op(self):
+        tokens = tokenize("a times b over c times d")
+        self.assertEqual((5, "HANGUL_TO_LATEX_BINARY_OP"), find_lowest_precedence_op(tokens, "HANGUL", "LATEX"))
+        self.assertEqual((-1, ""), find_lowest_precedence_op(tokenize("a + b"), "HANGUL", "LATEX"))
+
+
+    # 공개 tokenize 는 모든 토큰이 str (중괄호 블록도 '{...}' 원문) → join / 이어 붙이기 가능
+    def test_tokenize_returns_str_tokens(self):
+        tokens = tokenize("x^{2} + {a {b}}")
+        self.assertEqual(["x", "^", "{2}", "+", "{a {b}}"], tokens)
+        self.assertTrue(all(type(tok) is str for tok in tokens))
+        self.assertEqual("x ^ {2} + {a {b}}", " ".join(tokens))
+        self.assertEqual("a{2}", "a" + tokens[2])
+        self.assertEqual("{2}a", tokens[2] + "a")
+        self.assertEqual(convert("x^{2} + {a {b}}"),
+                         apply_postprocess_hooks(build_ast(tokens, "HANGUL", "LATEX")).to_latex())
+
+
+class BracketMatcherTests(unittest.TestCase):
+    def extract(self, expr):
+        return extract_bracket_nodes(tokenize(expr), "HANGUL", "LATEX")
+
+    # 중첩 괄호는 안쪽부터 짝지어져야 함
+    def test_nested_pairs(self):
+        tokens = self.extract("f LEFT ( f LEFT ( x RIGHT ) RIGHT ) = 3")
+        self.assertIsInstance(tokens[1], BracketNode)
+        self.assertEqual(["f", ")", "=", "3"], [tokens[0]] + tokens[2:])
+        self.assertIn("BracketNode", repr(tokens[1].inner))
+        self.assertIn("LiteralNode('( x')", repr(tokens[1].inner))
+
+    def test_sequential_pairs(self):
+        tokens = self.extract("f LEFT ( 2+h RIGHT ) -f LEFT ( 2 RIGHT )")
+        self.assertEqual(2, sum(isinstance(t, BracketNode) for t in tokens))
+
+    # 여는 태그 바로 다음의 닫는 태그 / 짝이 없는 태그는 일반 토큰으로 남음
+    def test_unmatched_tags(self):
+        self.assertEqual(["left", "right", "x"], self.extract("left right x"))
+        self.assertEqual(["right", "x", "left", "y"], self.extract("right x left y"))
+
+
+class TokenSummaryTests(unittest.TestCase):
+    # 모든 구간에서 요약 질의 결과가 직접 순회한 결과와 같아야 함 (직접 비교 / sparse table 경로 모두)
+    def test_lowest_matches_linear_scan(self):
+        index = operator_index("HANGUL", "LATEX")
+        tokens = tokenize(" ".join(["a times b over c", "x ^ 2 div y", "p = q", "sqrt {2} of {3}"] * 4))
+        summary = TokenSummary(tokens, 0, len(tokens), index)
+        for lo in range(len(tokens)):
+            for hi in range(lo, len(tokens) + 1):
+                self.assertEqual(_lowest_precedence_entry(tokens, lo, hi, index), summary.lowest(lo, hi), (lo, hi))
+
+    def test_feature_queries(self):
+        tokens = tokenize("int _ {0} ^ {1} x dx times sqrt {2} of {3} left ( y")
+        summary = TokenSummary(tokens)
+        self.assertTrue(summary.has_token("of", 0, len(tokens)))
+        self.assertEqual(tokens.index("of"), summary.first_token("of", 0, len(tokens)))
+        self.assertFalse(summary.has_token("of", 0, tokens.index("of")))
+        self.assertEqual(1, summary.first_substring("_", 0, len(tokens)))
+        self.assertTrue(summary.any_dx_suffix(0, len(tokens)))
+        self.assertFalse(summary.any_dx_suffix(0, tokens.index("dx")))
+        self.assertTrue(summary.has_bracket(0, len(tokens)))
+        self.assertFalse(summary.has_bracket(0, tokens.index("left")))
+
+
+class RangeParsingTests(unittest.TestCase):
+    @staticmethod
+    def outcome(build):
+        try:
+            return repr(build())
+        except Exception as e:
+            return type(e).__name__
+
+    # 공유 토큰 배열의 구간 파싱은 같은 구간을 잘라낸 리스트의 파싱과 같아야 함
+    def test_range_matches_slice(self):
+        for expr in ["a times b over c times d", "sqrt {3} of {x} times y", "sin x times int _ {0} ^ {1} x dx"]:
+            tokens = tokenize(expr)
+            for lo in range(len(tokens)):
+                for hi in range(lo, len(tokens) + 1):
+                    expected = self.outcome(lambda: build_ast(tokens[lo:hi], "HANGUL", "LATEX"))
+                    summary = TokenSummary(tokens, 0, len(tokens), operator_index("HANGUL", "LATEX"))
+                    actual = self.outcome(lambda: _build_range(tokens, lo, hi, "HANGUL", "LATEX", summary=summary))
+                    self.assertEqual(expected, actual, (expr, lo, hi))
+
+    # 괄호가 없으면 토큰 리스트를 복사하지 않음
+    def test_extract_without_brackets_returns_same_list(self):
+        tokens = tokenize("a times b")
+        self.assertIs(tokens, extract_bracket_nodes(tokens, "HANGUL", "LATEX"))
+
+
+class ParserEngineTests(unittest.TestCase):
+    def assert_same_result(self, parse, expr):
+        results = []
+        for engine in ("split", "pratt"):
+            try:
+                ast = parse(expr, engine=engine)
+                results.append((repr(ast), ast.to_latex(), ast.to_hangul()))
+            except Exception as e:
+                results.append(type(e).__name__)
+        self.assertEqual(results[0], results[1], expr)
+
+    # 샘플 XML 의 모든 수식에서 두 엔진의 AST 가 같아야 함
+    def test_pratt_matches_split_on_sample(self):
+        for expr in load_scripts():
+            self.assert_same_result(parse_hangul, expr)
+
+    def test_pratt_matches_split_edge_cases(self):
+        for expr in ["a times b over c times d", "x over y over z", "a times sqrt {2} of {x} times b",
+                     "times a times b", "a times", "a times LEFT( b over c RIGHT) times d", "a ^ b _ c times d"]:
+            self.assert_same_result(parse_hangul, expr)
+        for expr in [r"a \times b \div c", r"\frac{a}{b} \times \sqrt[3]{x}", r"a \times \left( b \right)"]:
+            self.assert_same_result(parse_latex, expr)
+
+    # 긴 연산자 사슬: 왼쪽 결합 순서 유지
+    def test_pratt_long_chain(self):
+        ast = parse_hangul(" times ".join(["a"] * 500), engine="pratt")
+        self.assertEqual(" \\times ".join(["a"] * 500), ast.to_latex())
+
+    def test_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            parse_hangul("a times b", engine="lr")
+
+
+class DeepNestingTests(unittest.TestCase):
+    # 재귀 한도보다 깊은 수식도 파싱 / 훅 / 렌더링이 RecursionError 없이 동작해야 함
+    depth = sys.getrecursionlimit() * 3
+
+    def test_power_tower(self):
+        expr = " ^ ".join(["x"] * self.depth)
+        for engine in ("split", "pratt"):
+            self.assertEqual("x" + "^{x}" * (self.depth - 1), convert(expr, "hangul_to_latex", engine))
+            self.assertEqual("x" + " ^ {x}" * (self.depth - 1), convert(expr, "latex_to_hangul", engine))
+
+    def test_nested_blocks(self):
+        expected = "\\sqrt{" * self.depth + "x" + "}" * self.depth
+        self.assertEqual(expected, convert("sqrt {" * self.depth + "x" + "}" * self.depth))
+        self.assertEqual("sqrt {" * self.depth + "x" + "}" * self.depth,
+                         convert("\\sqrt{" * self.depth + "x" + "}" * self.depth, "latex_to_hangul"))
+
+    def test_deep_input_with_trace(self):
+        with trace.collect() as events:
+            parse_hangul(" times ".join(["a"] * self.depth))
+        self.assertEqual(self.depth - 1, sum(1 for e in events if e.phase == "split"))
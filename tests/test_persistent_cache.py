@@ -0,0 +1,78 @@
+# tests/test_persistent_cache.py
+
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+import converter
+from converter import batch
+from converter import PersistentCache, convert, convert_many, registry
+from converter.persistent_cache import fingerprint
+from tests.test_registry import NormNode
+
+
+class PersistentCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = PersistentCache(self.tmp.name)
+
+    def tearDown(self):
+        self.cache.close()
+        if "NORM" in registry.NODE_CLASSES:
+            registry.unregister_node("NORM")
+        self.tmp.cleanup()
+
+    def test_shared_across_instances(self):
+        self.assertIsNone(self.cache.get("x ^ 2", "hangul_to_latex"))
+        self.assertEqual(convert("x ^ 2"), self.cache.convert("x ^ 2"))
+        other = PersistentCache(self.tmp.name)
+        self.assertEqual(convert("x ^ 2"), other.get("x ^ 2", "hangul_to_latex"))
+        self.assertIsNone(other.get("x ^ 2", "latex_to_hangul"))
+        other.close()
+
+    # 매핑 테이블이 바뀌면 지문이 바뀌어 예전 항목은 적중하지 않음
+    def test_fingerprint_invalidation(self):
+        self.cache.put("norm x", "hangul_to_latex", "stale")
+        before = fingerprint()
+        registry.register_node("NORM", NormNode, hangul_to_latex={"norm": "\\lVert"})
+        self.assertNotEqual(before, fingerprint())
+        self.assertEqual("\\lVert{x}\\rVert", self.cache.convert("norm x"))
+        self.assertEqual(1, self.cache.prune())
+        registry.unregister_node("NORM")
+        self.assertEqual(before, fingerprint())
+        self.assertIsNone(self.cache.get("norm x", "hangul_to_latex"))
+
+    # 풀 워커들이 같은 캐시 파일에 동시에 쓰고, 다음 실행에서 그대로 읽음
+    def test_pool_workers(self):
+        items = [("hangul_to_latex", f"x ^ {i}") for i in range(40)]
+        first = list(convert_many(items, workers=3, chunk_size=5, cache_dir=self.tmp.name))
+        self.assertEqual([convert(text) for _, text in items], [r.output for r in first])
+        for _, text in items:
+            self.assertEqual(convert(text), self.cache.get(text, "hangul_to_latex"))
+        self.assertEqual(first, list(convert_many(items, workers=3, chunk_size=5, cache_dir=self.tmp.name)))
+
+    # 패키지 버전은 converter.__version__ 한 곳뿐이고 setup.py 도 그 값을 씀
+    def test_single_version_source(self):
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        out = subprocess.run([sys.executable, "setup.py", "--version"], cwd=root,
+                             capture_output=True, text=True, check=True).stdout
+        self.assertEqual(converter.__version__, out.strip().splitlines()[-1])
+
+    # 현재 프로세스 변환은 생성기가 끝나면(중간에 닫혀도) 연결을 닫고, 워커 연결은 _close_stores 가 정리
+    def test_connections_closed(self):
+        items = [("hangul_to_latex", f"x ^ {i}") for i in range(10)]
+        with mock.patch.object(PersistentCache, "close", autospec=True, side_effect=PersistentCache.close) as close:
+            self.assertEqual(10, len(list(convert_many(items, workers=1, cache_dir=self.tmp.name))))
+            self.assertEqual(1, close.call_count)
+            results = convert_many(items, workers=1, chunk_size=2, cache_dir=self.tmp.name)
+            next(results)
+            results.close()
+            self.assertEqual(2, close.call_count)
+        self.assertEqual({}, batch._STORES)
+        store = batch._store(self.tmp.name)
+        self.assertEqual(convert("x ^ 3"), store.get("x ^ 3", "hangul_to_latex"))
+        batch._close_stores()
+        self.assertEqual({}, batch._STORES)
+        self.assertIsNone(store._conn)
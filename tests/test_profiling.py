@@ -0,0 +1,53 @@
+# tests/test_profiling.py
+
+import os
+import sys
+import tempfile
+import unittest
+from converter import convert
+from converter.profiling import Profiler
+
+
+class ProfilerTests(unittest.TestCase):
+    def test_phase_stacks(self):
+        with Profiler(top=2) as profiler:
+            convert("{a} over {b}")
+            convert("x")
+            convert(r"\frac{1}{2}", "latex_to_hangul")
+        self.assertIsNone(sys.getprofile())
+
+        # 구간 분기 본문(_range_steps)과 그 안의 괄호 추출 / 노드 생성은 split 아래
+        for stack in ("convert;tokenize", "convert;fast_path", "convert;parse;split", "convert;parse;split;brackets",
+                      "convert;parse;split;node;FractionNode", "convert;hooks;handle_nested_mix", "convert;render"):
+            self.assertIn(stack, profiler.stacks)
+        self.assertTrue(all(key == "other" or key.startswith("convert") for key in profiler.stacks))
+
+        self.assertEqual(2, len(profiler.slowest))
+        report = profiler.report()
+        self.assertEqual(3, len(report.splitlines()))
+        self.assertNotIn("'x'", report)   # 빠른 경로 수식은 가장 느린 2개에 들지 않음
+
+    # 변환 중 예외가 나도 convert 단위 기록과 스택이 맞게 유지
+    def test_failing_conversion(self):
+        with Profiler() as profiler:
+            with self.assertRaises(AttributeError):
+                convert("LEFT ( LEFT ( a RIGHT ) RIGHT )")
+            convert("{a} over {b}")
+        self.assertEqual(["LEFT ( LEFT ( a RIGHT ) RIGHT )", "{a} over {b}"], sorted(row[3] for row in profiler.slowest))
+        self.assertFalse(any(key.count("convert") > 1 for key in profiler.stacks))
+
+    def test_write(self):
+        with Profiler() as profiler:
+            convert("{a} over {b}")
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "out.folded")
+            profiler.write(path)
+            with open(path, encoding="utf-8") as f:
+                lines = f.read().splitlines()
+            with open(path + ".top.txt", encoding="utf-8") as f:
+                self.assertIn("{a} over {b}", f.read())
+        self.assertTrue(lines)
+        for line in lines:
+            stack, value = line.rsplit(" ", 1)
+            self.assertTrue(value.isdigit())
+            self.assertNotIn(" ", stack)
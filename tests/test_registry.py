@@ -0,0 +1,84 @@
+# tests/test_registry.py
+
+import unittest
+from converter import convert, registry
+from converter.base import ExprNode
+from converter.mapping import map as mapping
+from converter.nodes.binary_op import BinaryOpNode
+from converter.parser import operator_index
+
+
+class NormNode(ExprNode):
+    """테스트용 노드 : norm {x} ↔ \\lVert{x}\\rVert"""
+
+    def __init__(self, op, *args):
+        self.op = op
+        self.args = list(args)
+
+    def latex_parts(self) -> list:
+        return ["\\lVert{", *self.args, "}\\rVert"]
+
+    def hangul_parts(self) -> list:
+        return ["norm {", *self.args, "}"]
+
+
+class AbsNode(ExprNode):
+    """테스트용 노드 : to_latex 만 구현 (조각 메서드 없음)"""
+
+    def __init__(self, op, *args):
+        self.op = op
+        self.args = list(args)
+
+    def to_latex(self) -> str:
+        return "\\lvert " + " ".join(arg.to_latex() for arg in self.args) + " \\rvert"
+
+
+class RegistryTests(unittest.TestCase):
+    def tearDown(self):
+        for kind in ("NORM", "ABS"):
+            if kind in registry.NODE_CLASSES:
+                registry.unregister_node(kind)
+
+    # map.py 의 모든 매핑 종류가 선언되어 있고, 클래스가 없는 종류는 명시적으로 None
+    def test_builtin_kinds(self):
+        self.assertIs(BinaryOpNode, registry.node_class("BINARY_OP"))
+        self.assertIsNone(registry.node_class("DERIV"))
+        kinds = {kind for kind, _, _ in registry.tables("HANGUL", "LATEX")}
+        self.assertEqual({name.split("HANGUL_TO_LATEX_")[1] for name in vars(mapping)
+                          if name.startswith("HANGUL_TO_LATEX_")}, kinds)
+        with self.assertRaises(registry.RegistryError):
+            registry.node_class("UNKNOWN")
+
+    # 선언되지 않은 매핑 종류는 로드 시 바로 오류
+    def test_undeclared_map_fails_on_load(self):
+        mapping.HANGUL_TO_LATEX_UNDECLARED = {"foo": "\\foo"}
+        try:
+            with self.assertRaises(registry.RegistryError):
+                registry._load_builtin_maps()
+        finally:
+            del mapping.HANGUL_TO_LATEX_UNDECLARED
+
+    # parser.py 수정 없이 새 노드 종류 등록 / 해제
+    def test_register_node(self):
+        self.assertEqual("norm x", convert("norm x"))
+        registry.register_node("NORM", NormNode, hangul_to_latex={"norm": "\\lVert"})
+        self.assertEqual("HANGUL_TO_LATEX_NORM", operator_index("HANGUL", "LATEX")["norm"][1])
+        self.assertEqual("\\lVert{x}\\rVert", convert("norm x"))
+        registry.unregister_node("NORM")
+        self.assertEqual("norm x", convert("norm x"))
+
+    # to_latex 만 구현한 노드도 등록 / 렌더링 가능 (부모 노드 안에서도), 구현 안 된 방향은 NotImplementedError
+    def test_register_node_with_to_latex_only(self):
+        registry.register_node("ABS", AbsNode, hangul_to_latex={"abs": "\\lvert"})
+        self.assertEqual("\\lvert x \\rvert", convert("abs x"))
+        self.assertEqual("\\frac{1}{\\lvert x \\rvert}", convert("1 over abs x"))
+        with self.assertRaises(NotImplementedError):
+            AbsNode("abs").to_hangul()
+
+    def test_register_errors(self):
+        with self.assertRaises(registry.RegistryError):
+            registry.register_node("BINARY_OP", NormNode)
+        with self.assertRaises(TypeError):
+            registry.register_node("NORM", dict)
+        with self.assertRaises(registry.RegistryError):
+            registry.unregister_node("ROOT")
@@ -0,0 +1,77 @@
+# tests/test_slow_log.py
+
+import json
+import os
+import tempfile
+import unittest
+from converter import convert, convert_many, trace
+from converter.slow_log import SlowLog, nesting_depth
+
+
+def read(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+class SlowLogTests(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, "slow.jsonl")
+
+    def tearDown(self):
+        trace.disable()
+
+    def test_threshold_record(self):
+        trace.enable(SlowLog(self.path, threshold_ms=0))
+        convert("{a} over {b}")
+        convert("x")   # 빠른 경로 : AST 없음
+        with self.assertRaises(AttributeError):
+            convert("LEFT ( LEFT ( a RIGHT ) RIGHT )")
+        slow, fast, failed = read(self.path)
+
+        self.assertEqual("{a} over {b}", slow["text"])
+        self.assertEqual("hangul_to_latex", slow["direction"])
+        self.assertEqual((3, 1, os.getpid()), (slow["tokens"], slow["depth"], slow["pid"]))
+        self.assertEqual(3, slow["nodes"])
+        for phase in ("tokenize", "parse", "brackets", "hooks", "hook.handle_nested_mix", "render"):
+            self.assertIn(phase, slow["phases_ms"])
+        self.assertIsNone(fast["nodes"])
+        self.assertEqual({}, fast["phases_ms"])
+        self.assertEqual(("AttributeError", 2), (failed["error"], failed["depth"]))
+
+    # 최근 window 개의 분위값을 넘는 변환만 기록, 표본이 모자라면 기록하지 않음
+    def test_quantile_window(self):
+        slow = SlowLog(self.path, quantile=0.5, window=4, min_samples=4)
+        for ms in (1, 2, 3):
+            slow._observe(ms)
+        self.assertIsNone(slow._limit_ms())
+        for ms in (4, 5, 6):
+            slow._observe(ms)
+        self.assertEqual([3, 4, 5, 6], slow._sorted)
+        self.assertEqual(5, slow._limit_ms())
+
+        event = trace.TraceEvent("end", "convert", 0, 5_500_000, {"direction": "hangul_to_latex", "text": "a"})
+        slow(event)
+        self.assertEqual("p50 5.000ms", read(self.path)[0]["reason"])
+        self.assertEqual([4, 5, 5.5, 6], slow._sorted)
+        with self.assertRaises(ValueError):
+            SlowLog(self.path)
+
+    # 워커 프로세스 여러 개가 같은 파일에 기록 + 기록 사이에 파일을 옮겨도 새 파일에 계속 기록
+    def test_workers_and_rotation(self):
+        slow = SlowLog(self.path, threshold_ms=0)
+        items = [("hangul_to_latex", "{%d} over {b}" % i) for i in range(40)]
+        self.assertTrue(all(r.ok for r in convert_many(items, workers=2, chunk_size=5, slow_log=slow)))
+        records = read(self.path)
+        self.assertEqual(sorted(text for _, text in items), sorted(r["text"] for r in records))
+
+        os.rename(self.path, self.path + ".1")
+        list(convert_many(items[:3], workers=1, slow_log=slow))
+        self.assertEqual(3, len(read(self.path)))
+        self.assertFalse(trace.active)
+
+    def test_nesting_depth(self):
+        self.assertEqual(0, nesting_depth("a LEFTARROW b"))
+        self.assertEqual(3, nesting_depth(r"\left( {a \left[ b \right]} \right)"))
+        self.assertEqual(2, nesting_depth("{1 over {2}} + LEFT ( x RIGHT )"))
@@ -0,0 +1,77 @@
+# tests/test_tokenizer.py
+
+import tracemalloc
+import unittest
+from tests.samples import load_scripts
+from converter.tokenizer import scan, scan_chars, shape_key, BraceBlock
+
+
+class TokenizerEngineTests(unittest.TestCase):
+    # 샘플 XML 의 모든 수식에서 단일 패스 스캐너와 기존 루프의 토큰 스트림이 같아야 함
+    def test_scan_matches_reference_on_sample(self):
+        for expr in load_scripts():
+            self.assertEqual(scan_chars(expr), scan(expr), expr)
+
+    # 자동 괄호 / 음수 병합 / 중괄호 블록 / 숫자형 문자 등 경계 사례
+    def test_scan_matches_reference_edge_cases(self):
+        cases = [
+            "LEFT ( x RIGHT )", "left{a_n right}", "RıGHT)", "LEFT", "xLEFT(", r"\left( x \right)", r"\left\{",
+            "a - 3 - -x", "- - 3", "-ab", "{a", "x}", "{{1} over {3}}", "x²y", "²LEFT(", r"\x²", "\\",
+            "한글 - 3", "x\ty\n", "",
+        ]
+        for expr in cases:
+            self.assertEqual(scan_chars(expr), scan(expr), expr)
+
+    def test_scan_tokens(self):
+        self.assertEqual(["f", "left", "(", "x", "right", ")", "=", "-3"], scan("f LEFT(x RIGHT)=- 3"))
+        self.assertEqual(["5", "^", "{{1} over {3}}"], scan("5 ^{{1} over {3}}"))
+
+    # 중괄호 블록은 한 번의 스캔에서 내부 토큰까지 만들어져야 함 (tokenize(block[1:-1]) 와 동일)
+    def test_scan_builds_nested_block_tokens(self):
+        tokens = scan("5 ^{{1} over {3}}")
+        block = tokens[2]
+        self.assertIsInstance(block, BraceBlock)
+        self.assertEqual(["{1}", "over", "{3}"], block.tokens)
+        self.assertEqual(["1"], block.tokens[0].tokens)
+
+        pending = list(scan("{a{b}} - {- 3 {LEFT( x }"))
+        while pending:
+            tok = pending.pop()
+            if isinstance(tok, BraceBlock):
+                self.assertEqual(scan_chars(tok[1:-1]), tok.tokens, tok)
+                pending.extend(tok.tokens)
+
+    # 블록은 원문 구간만 가리키고 '{...}' 문자열처럼 비교 / 조회됨
+    def test_brace_block_is_string_like(self):
+        block = scan("x + {a over b}")[2]
+        self.assertEqual("{a over b}", block)
+        self.assertEqual("{a over b}", str(block))
+        self.assertEqual(hash("{a over b}"), hash(block))
+        self.assertTrue(block.startswith("{") and block.endswith("b}") and "over" in block)
+        self.assertEqual(("{", "}", 10), (block[0], block[-1], len(block)))
+        self.assertEqual("a over b", block.strip("{}"))
+        self.assertEqual(["{"], scan("{"))
+
+    # 중첩 깊이를 4배로 늘려도 스캔 최대 메모리는 입력 길이처럼 약 4배 (블록마다 원문을 복사하면 약 16배)
+    def test_scan_memory_grows_linearly_with_depth(self):
+        def peak(depth: int) -> int:
+            expr = "{1 over " * depth + "x" + "}" * depth
+            tracemalloc.start()
+            try:
+                scan(expr)
+                return tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+        self.assertLess(peak(4000), peak(1000) * 6)
+
+    # 리터럴만 다른 수식은 같은 모양, 자리 문자는 원래 리터럴과 같은 토큰 구조를 유지
+    def test_shape_key(self):
+        shape, literals = shape_key("x^{1 over 3}")
+        self.assertEqual((shape, "y25"), shape_key("y^{2 over 5}"))
+        self.assertEqual("x13", literals)
+        self.assertNotEqual(shape, shape_key("xy^{1 over 3}")[0])
+        for expr in ["f LEFT ( 2 RIGHT )", "a - 3 - -x", "\\frac{a}{b} 2x", "{{1} over {3}} - y"]:
+            self.assertEqual(len(scan(expr)), len(scan(shape_key(expr)[0])), expr)
+        self.assertEqual(("-x o", ""), shape_key("-x o", frozenset("o")))
+        self.assertIsNone(shape_key("x²"))
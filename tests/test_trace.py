@@ -0,0 +1,68 @@
+# tests/test_trace.py
+
+import contextlib
+import io
+import unittest
+from converter import convert, parse_latex, trace
+
+
+class TraceTests(unittest.TestCase):
+    def tearDown(self):
+        trace.disable()
+
+    # sink 가 없으면 비활성, 설치 / 제거에 따라 active 갱신
+    def test_enable_disable(self):
+        self.assertFalse(trace.active)
+        sink = trace.enable(lambda event: None)
+        self.assertTrue(trace.active)
+        trace.disable(sink)
+        self.assertFalse(trace.active)
+
+    def test_convert_phases(self):
+        with trace.collect() as events:
+            convert("f LEFT ( a RIGHT )")
+            result = convert("a times b over 2")
+        self.assertEqual(convert("a times b over 2"), result)
+
+        phases = {(e.kind, e.phase) for e in events}
+        for phase in ("convert", "tokenize", "parse", "brackets", "hooks", "hook", "render"):
+            self.assertIn(("begin", phase), phases)
+            self.assertIn(("end", phase), phases)
+        self.assertIn(("point", "split"), phases)
+        self.assertIn("FractionNode", {e.data["type"] for e in events if e.phase == "node"})
+        self.assertEqual(10, sum(1 for e in events if e.phase == "hook" and e.kind == "end"))
+        self.assertTrue(all(e.elapsed >= 0 for e in events if e.kind == "end"))
+        self.assertEqual("convert", events[-1].phase)
+
+    # 노드 단위 정보(node 이벤트 / hook changed)는 wants_nodes sink 가 있을 때만
+    def test_node_events_on_request(self):
+        events = []
+        trace.enable(events.append)
+        self.assertFalse(trace.node_events)
+        convert("{a} over {b}")
+        self.assertFalse(any(e.phase == "node" for e in events))
+        hooks = [e for e in events if e.kind == "end" and e.phase in ("hook", "hooks")]
+        self.assertFalse(any("changed" in e.data for e in hooks))
+        self.assertEqual(3, hooks[-1].data["nodes"])
+
+        trace.disable()
+        events.clear()
+        sink = trace.enable(events.append, wants_nodes=True)
+        self.assertTrue(trace.node_events)
+        convert("{a} over {b}")
+        self.assertIn("FractionNode", {e.data["type"] for e in events if e.phase == "node"})
+        self.assertTrue(all("changed" in e.data for e in events if e.kind == "end" and e.phase == "hook"))
+        trace.disable(sink)
+        self.assertFalse(trace.node_events)
+
+    # 변환 중 표준 출력에 디버그 출력이 없어야 함
+    def test_no_debug_output(self):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            convert("a times b over c")
+            parse_latex(r"a \times b").to_hangul()
+        self.assertEqual("", out.getvalue())
+
+    def test_unknown_direction(self):
+        with self.assertRaises(ValueError):
+            convert("a", "hangul_to_mathml")